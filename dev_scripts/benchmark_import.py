@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Benchmark the cold-start cost of importing pymatgen.
+
+Each repeat runs the import in a fresh interpreter so that nothing is cached
+in sys.modules. The median wall time is reported and, if --max-time is given,
+the script exits with a non-zero status when it is exceeded so that it can be
+used to catch import-time regressions, e.g.
+
+    python dev_scripts/benchmark_import.py -n 20 --max-time 0.5
+    python dev_scripts/benchmark_import.py -s "from pymatgen import Structure"
+    python dev_scripts/benchmark_import.py --importtime
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+def time_import(statement, repeats):
+    """
+    Time a statement in fresh interpreters.
+
+    :param statement: Python statement to execute, e.g. "import pymatgen".
+    :param repeats: Number of interpreters to start.
+    :return: List of wall times in seconds.
+    """
+    # Baseline cost of starting the interpreter, subtracted from each timing.
+    baseline = []
+    times = []
+    for _ in range(repeats):
+        t = time.perf_counter()
+        subprocess.check_call([sys.executable, "-c", "pass"])
+        baseline.append(time.perf_counter() - t)
+        t = time.perf_counter()
+        subprocess.check_call([sys.executable, "-c", statement])
+        times.append(time.perf_counter() - t)
+    offset = min(baseline)
+    return [max(t - offset, 0) for t in times]
+
+
+def print_importtime(statement, top):
+    """
+    Print the slowest modules reported by "python -X importtime".
+
+    :param statement: Python statement to execute.
+    :param top: Number of modules to print.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        try:
+            rows.append((int(cumulative), name.strip()))
+        except ValueError:
+            # Header line.
+            continue
+    rows.sort(reverse=True)
+    print("{:>12}  {}".format("cumul. (us)", "module"))
+    for cumulative, name in rows[:top]:
+        print("{:>12}  {}".format(cumulative, name))
+
+
+def main():
+    """
+    Handle main.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-s", "--statement", default="import pymatgen",
+                        help="Statement to time. Defaults to "
+                             "'import pymatgen'.")
+    parser.add_argument("-n", "--repeats", type=int, default=10,
+                        help="Number of fresh interpreters to time.")
+    parser.add_argument("--max-time", type=float, default=None,
+                        help="Fail if the median import time in seconds "
+                             "exceeds this value.")
+    parser.add_argument("--importtime", action="store_true",
+                        help="Also print the slowest modules as reported "
+                             "by python -X importtime.")
+    parser.add_argument("--top", type=int, default=25,
+                        help="Number of modules to show with --importtime.")
+    args = parser.parse_args()
+
+    times = time_import(args.statement, args.repeats)
+    median = statistics.median(times)
+    print("{}: median {:.3f} s, min {:.3f} s, max {:.3f} s over {} runs".format(
+        args.statement, median, min(times), max(times), len(times)))
+
+    if args.importtime:
+        print_importtime(args.statement, args.top)
+
+    if args.max_time is not None and median > args.max_time:
+        print("Import time regression: {:.3f} s > {:.3f} s".format(
+            median, args.max_time))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
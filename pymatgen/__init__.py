@@ -7,7 +7,9 @@ Pymatgen (Python Materials Genomics) is a robust, open-source Python library
 for materials analysis. This is the root package.
 """
 
+import importlib
 import os
+import sys
 import warnings
 from fnmatch import fnmatch
 
@@ -43,19 +45,51 @@ def _load_pmg_settings():
 
 SETTINGS = _load_pmg_settings()
 
-# pylint: disable=C0413
 # Useful aliases for commonly used objects and modules.
-# Allows from pymatgen import <class> for quick usage.
-# Note that these have to come after the SETTINGS have been loaded. Otherwise, import does not work.
-from .core.periodic_table import Element, Specie, DummySpecie
-from .core.composition import Composition
-from .core.structure import Structure, IStructure, Molecule, IMolecule
-from .core.lattice import Lattice
-from .core.sites import Site, PeriodicSite
-from .core.operations import SymmOp
-from .core.units import Unit, FloatWithUnit, ArrayWithUnit
-from .electronic_structure.core import Spin, Orbital
-from .ext.matproj import MPRester
+# Allows from pymatgen import <class> for quick usage. The aliases are only
+# imported on first access (see __getattr__ below), so that "import pymatgen"
+# stays cheap for short-lived processes and command line tools.
+_LAZY_IMPORTS = {
+    "Element": "pymatgen.core.periodic_table",
+    "Specie": "pymatgen.core.periodic_table",
+    "DummySpecie": "pymatgen.core.periodic_table",
+    "Composition": "pymatgen.core.composition",
+    "Structure": "pymatgen.core.structure",
+    "IStructure": "pymatgen.core.structure",
+    "Molecule": "pymatgen.core.structure",
+    "IMolecule": "pymatgen.core.structure",
+    "Lattice": "pymatgen.core.lattice",
+    "Site": "pymatgen.core.sites",
+    "PeriodicSite": "pymatgen.core.sites",
+    "SymmOp": "pymatgen.core.operations",
+    "Unit": "pymatgen.core.units",
+    "FloatWithUnit": "pymatgen.core.units",
+    "ArrayWithUnit": "pymatgen.core.units",
+    "Spin": "pymatgen.electronic_structure.core",
+    "Orbital": "pymatgen.electronic_structure.core",
+    "MPRester": "pymatgen.ext.matproj",
+}
+
+
+def __getattr__(name):
+    """
+    Imports the aliases of commonly used objects on first access.
+    """
+    if name in _LAZY_IMPORTS:
+        obj = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is only supported from python 3.7 (PEP 562).
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
 
 
 def get_structure_from_mp(formula):
@@ -70,6 +104,7 @@ def get_structure_from_mp(formula):
         (Structure) The lowest energy structure in Materials Project with that
             formula.
     """
+    from pymatgen.ext.matproj import MPRester
     m = MPRester()
     entries = m.get_entries(formula, inc_structure="final")
     if len(entries) == 0:
@@ -98,6 +133,7 @@ def loadfn(fname):
     """
     if (fnmatch(fname, "*POSCAR*") or fnmatch(fname, "*CONTCAR*") or ".cif" in fname.lower()) or \
             fnmatch(fname, "*.vasp"):
+        from pymatgen.core.structure import Structure
         return Structure.from_file(fname)
     if fnmatch(fname, "*vasprun*"):
         from pymatgen.io.vasp import Vasprun
@@ -26,6 +26,7 @@ import itertools
 import logging
 import time
 from collections import OrderedDict
+from multiprocessing import Pool
 from random import shuffle
 
 import numpy as np
@@ -319,6 +320,114 @@ def find_scaling_factor(points_distorted, points_perfect, rot):
     return num / denom, rotated_coords, points_perfect
 
 
+def symmetry_measures(points_distorted, points_perfect):
+    """
+    Computes the continuous symmetry measures of several (distorted) sets of points, e.g., the points of a local
+    geometry for different permutations, with respect to the (perfect) set of points "points_perfect". The rotations
+    of all the sets of points are obtained with a single batched singular value decomposition.
+    :param points_distorted: Array of shape (number of sets, number of points, 3) of the (distorted) sets of points.
+    :param points_perfect: List of "perfect" points describing a given model polyhedron.
+    :return: List of the continuous symmetry measures of each set of points, in the same form as the ones given by
+        symmetry_measure.
+    """
+    if len(points_distorted) == 0:
+        return []
+    points_distorted = np.asarray(points_distorted, dtype=np.float)
+    if points_distorted.shape[1] == 1:
+        return [{'symmetry_measure': 0.0, 'scaling_factor': None, 'rotation_matrix': None}
+                for _ in range(len(points_distorted))]
+    csms, scaling_factors, rots = _get_symmetry_measures(points_distorted, np.asarray(points_perfect, dtype=np.float))
+    return [{'symmetry_measure': csm, 'scaling_factor': scaling_factor, 'rotation_matrix': rot}
+            for csm, scaling_factor, rot in zip(csms, scaling_factors, rots)]
+
+
+def minimum_symmetry_measure(points_distorted, points_perfect, prune=True, block_size=64):
+    """
+    Finds the set of points with the minimum continuous symmetry measure among several (distorted) sets of points,
+    e.g., the points of a local geometry for different permutations, with respect to the (perfect) set of points
+    "points_perfect".
+
+    The continuous symmetry measure of a set of points Q is 100 * (1 - (s1 + s2 + s3)^2 / (|P|^2 |Q|^2)), where
+    s1, s2 and s3 are the singular values of Q^T P. Since (s1 + s2 + s3)^2 <= 3 |Q^T P|^2, a lower bound of the
+    measure is obtained without decomposition. If prune is True, the sets of points are evaluated by blocks in the
+    order of increasing lower bounds, and the sets for which the lower bound is larger than the minimum found so far
+    are skipped. The result is the same as the minimum of symmetry_measures.
+    :param points_distorted: Array of shape (number of sets, number of points, 3) of the (distorted) sets of points.
+    :param points_perfect: List of "perfect" points describing a given model polyhedron.
+    :param prune: Whether to skip the sets of points using the lower bound of the measure.
+    :param block_size: Number of sets of points evaluated at once when prune is True.
+    :return: The index of the set of points with the minimum continuous symmetry measure (the first one in case of
+        ties) and its continuous symmetry measure, in the same form as the one given by symmetry_measure.
+    """
+    points_distorted = np.asarray(points_distorted, dtype=np.float)
+    points_perfect = np.asarray(points_perfect, dtype=np.float)
+    if points_distorted.shape[1] == 1:
+        return 0, {'symmetry_measure': 0.0, 'scaling_factor': None, 'rotation_matrix': None}
+    if not prune:
+        csms = _get_symmetry_measures(points_distorted, points_perfect)[0]
+    else:
+        hh = np.einsum('pni,nj->pij', points_distorted, points_perfect)
+        norm_perfect = np.tensordot(points_perfect, points_perfect)
+        norms = np.einsum('pni,pni->p', points_distorted, points_distorted) * norm_perfect
+        bounds = 100.0 * (1.0 - 3.0 * np.einsum('pij,pij->p', hh, hh) / norms)
+        order = np.argsort(bounds, kind='mergesort')
+        csms = np.full(len(points_distorted), np.inf)
+        for start in range(0, len(order), block_size):
+            # The tolerance ensures that measures equal to the minimum within numerical precision are evaluated
+            if bounds[order[start]] > np.min(csms) + 1e-8:
+                break
+            block = order[start:start + block_size]
+            csms[block] = _get_symmetry_measures(points_distorted[block], points_perfect)[0]
+    imin = int(np.argmin(csms))
+    csm, scaling_factor, rot = _get_symmetry_measures(points_distorted[imin:imin + 1], points_perfect)
+    return imin, {'symmetry_measure': csm[0], 'scaling_factor': scaling_factor[0], 'rotation_matrix': rot[0]}
+
+
+def _get_symmetry_measures(points_distorted, points_perfect):
+    """
+    Batched version of symmetry_measure (see find_rotation and find_scaling_factor) for an array of shape
+    (number of sets, number of points, 3) of (distorted) sets of points.
+    :return: Arrays of the continuous symmetry measures, scaling factors and rotation matrices.
+    """
+    hh = np.einsum('pni,nj->pij', points_distorted, points_perfect)
+    uu, ss, vvt = np.linalg.svd(hh)
+    rots = np.matmul(np.swapaxes(vvt, 1, 2), np.swapaxes(uu, 1, 2))
+    rotated_coords = np.matmul(points_distorted, np.swapaxes(rots, 1, 2))
+    num = np.einsum('pni,ni->p', rotated_coords, points_perfect)
+    denom = np.einsum('pni,pni->p', rotated_coords, rotated_coords)
+    scaling_factors = num / denom
+    diff = points_perfect - scaling_factors[:, None, None] * rotated_coords
+    csms = np.einsum('pni,pni->p', diff, diff) / np.tensordot(points_perfect, points_perfect) * 100.0
+    return csms, scaling_factors, rots
+
+
+_SITE_ENVIRONMENTS_WORKER = None
+
+
+def _init_site_environments_worker(lgf, se, site_kwargs):
+    """
+    Stores the LocalGeometryFinder, the StructureEnvironments and the parameters used by a worker process of
+    LocalGeometryFinder.compute_structure_environments.
+    """
+    global _SITE_ENVIRONMENTS_WORKER
+    _SITE_ENVIRONMENTS_WORKER = (lgf, se, site_kwargs)
+
+
+def _compute_site_environments_worker(isite):
+    """
+    Computes the environments of one site in a worker process.
+
+    Returns:
+        Index of the site, dict representations of its neighbors sets, its ChemicalEnvironments and its info.
+    """
+    lgf, se, site_kwargs = _SITE_ENVIRONMENTS_WORKER
+    lgf._compute_site_environments(se=se, isite=isite, **site_kwargs)
+    nb_sets = se.neighbors_sets[isite]
+    nb_sets_dicts = None if nb_sets is None else {cn: [nb_set.as_dict() for nb_set in cn_nb_sets]
+                                                  for cn, cn_nb_sets in nb_sets.items()}
+    return isite, nb_sets_dicts, se.ce_list[isite], se.info['sites_info'][isite]
+
+
 class LocalGeometryFinder:
     """
     Main class used to find the local environments in a structure
@@ -359,6 +468,8 @@ class LocalGeometryFinder:
                               include_central_site_in_centroid=True,
                               bva_distance_scale_factor=None,
                               structure_refinement=self.STRUCTURE_REFINEMENT_NONE)
+        # Random generator used by the fallback algorithm, seeded for each site by compute_structure_environments
+        self._random_state = None
         print(chemenv_citations())
 
     def setup_parameters(self, centering_type='standard',
@@ -502,7 +613,8 @@ class LocalGeometryFinder:
                                        voronoi_normalized_angle_tolerance=PRESETS['DEFAULT']
                                        ['voronoi_normalized_angle_tolerance'],
                                        recompute=None,
-                                       optimization=PRESETS['DEFAULT']['optimization']):
+                                       optimization=PRESETS['DEFAULT']['optimization'],
+                                       nproc=None):
         """
         Computes and returns the StructureEnvironments object containing all the information about the coordination
         environments in the structure
@@ -532,6 +644,10 @@ class LocalGeometryFinder:
         :param recompute: whether to recompute the sites already computed (when initial_structure_environments
             is not None)
         :param optimization: optimization algorithm
+        :param nproc: If not set to None, the sites are distributed over nproc processes. The Voronoi neighbors are
+            computed once and shared with the processes, and the result is the same as the serial one (the random
+            permutations of the fallback algorithm are seeded with the index of the site). Cannot be used with
+            timelimit.
         :return: The StructureEnvironments object containing all the information about the coordination
             environments in the structure
         """
@@ -657,6 +773,36 @@ class LocalGeometryFinder:
             self.detailed_voronoi.local_planes = [None] * len(self.structure)
             self.detailed_voronoi.separations = [None] * len(self.structure)
 
+        site_kwargs = {'all_cns': all_cns, 'recompute': do_recompute, 'optimization': optimization,
+                       'additional_conditions': additional_conditions, 'valences': valences,
+                       'get_from_hints': get_from_hints, 'max_cn': max_cn, 'min_cn': min_cn}
+
+        if nproc is not None:
+            if timelimit is not None:
+                raise ValueError('timelimit is not supported when computing the environments with nproc')
+            for isite in range(len(self.structure)):
+                if isite not in sites_indices:
+                    continue
+                if optimization > 0:
+                    self.detailed_voronoi.local_planes[isite] = OrderedDict()
+                    self.detailed_voronoi.separations[isite] = {}
+            # The workers get a copy of the finder and of the StructureEnvironments (with the Voronoi neighbors)
+            # once, and return the neighbors sets, environments and info of each site.
+            with Pool(nproc, initializer=_init_site_environments_worker, initargs=(self, se, site_kwargs)) as p:
+                for isite, nb_sets_dicts, site_ces, site_info in p.imap_unordered(
+                        _compute_site_environments_worker, sites_indices):
+                    if nb_sets_dicts is not None:
+                        se.neighbors_sets[isite] = {
+                            cn: [se.NeighborsSet.from_dict(dd=nb_set_dict, structure=se.structure,
+                                                           detailed_voronoi=se.voronoi)
+                                 for nb_set_dict in nb_sets_dict]
+                            for cn, nb_sets_dict in nb_sets_dicts.items()}
+                    se.ce_list[isite] = site_ces
+                    se.update_site_info(isite=isite, info_dict=site_info)
+            time_end = time.process_time()
+            logging.debug('    ... compute_structure_environments ended in {:.2f} seconds'.format(time_end - time_init))
+            return se
+
         # Loop on all the sites
         for isite in range(len(self.structure)):
             if isite not in sites_indices:
@@ -675,86 +821,8 @@ class LocalGeometryFinder:
             if optimization > 0:
                 self.detailed_voronoi.local_planes[isite] = OrderedDict()
                 self.detailed_voronoi.separations[isite] = {}
-            se.init_neighbors_sets(isite=isite, additional_conditions=additional_conditions, valences=valences)
-
-            to_add_from_hints = []
-            nb_sets_info = {}
-
-            for cn, nb_sets in se.neighbors_sets[isite].items():
-                if cn not in all_cns:
-                    continue
-                for inb_set, nb_set in enumerate(nb_sets):
-                    logging.debug('    ... getting environments for nb_set ({:d}, {:d})'.format(cn, inb_set))
-                    tnbset1 = time.process_time()
-                    ce = self.update_nb_set_environments(se=se, isite=isite, cn=cn, inb_set=inb_set, nb_set=nb_set,
-                                                         recompute=do_recompute, optimization=optimization)
-                    tnbset2 = time.process_time()
-                    if cn not in nb_sets_info:
-                        nb_sets_info[cn] = {}
-                    nb_sets_info[cn][inb_set] = {'time': tnbset2 - tnbset1}
-                    if get_from_hints:
-                        for cg_symbol, cg_dict in ce:
-                            cg = self.allcg[cg_symbol]
-                            # Get possibly missing neighbors sets
-                            if cg.neighbors_sets_hints is None:
-                                continue
-                            logging.debug('       ... getting hints from cg with mp_symbol "{}" ...'.format(cg_symbol))
-                            hints_info = {'csm': cg_dict['symmetry_measure'],
-                                          'nb_set': nb_set,
-                                          'permutation': cg_dict['permutation']}
-                            for nb_sets_hints in cg.neighbors_sets_hints:
-                                suggested_nb_set_voronoi_indices = nb_sets_hints.hints(hints_info)
-                                for inew, new_nb_set_voronoi_indices in enumerate(suggested_nb_set_voronoi_indices):
-                                    logging.debug('           hint # {:d}'.format(inew))
-                                    new_nb_set = se.NeighborsSet(structure=se.structure, isite=isite,
-                                                                 detailed_voronoi=se.voronoi,
-                                                                 site_voronoi_indices=new_nb_set_voronoi_indices,
-                                                                 sources={'origin': 'nb_set_hints',
-                                                                          'hints_type': nb_sets_hints.hints_type,
-                                                                          'suggestion_index': inew,
-                                                                          'cn_map_source': [cn, inb_set],
-                                                                          'cg_source_symbol': cg_symbol})
-                                    cn_new_nb_set = len(new_nb_set)
-                                    if max_cn is not None and cn_new_nb_set > max_cn:
-                                        continue
-                                    if min_cn is not None and cn_new_nb_set < min_cn:
-                                        continue
-                                    if new_nb_set in [ta['new_nb_set'] for ta in to_add_from_hints]:
-                                        has_nb_set = True
-                                    elif cn_new_nb_set not in se.neighbors_sets[isite]:
-                                        has_nb_set = False
-                                    else:
-                                        has_nb_set = new_nb_set in se.neighbors_sets[isite][cn_new_nb_set]
-                                    if not has_nb_set:
-                                        to_add_from_hints.append({'isite': isite,
-                                                                  'new_nb_set': new_nb_set,
-                                                                  'cn_new_nb_set': cn_new_nb_set})
-                                        logging.debug('              => to be computed')
-                                    else:
-                                        logging.debug('              => already present')
-            logging.debug('    ... getting environments for nb_sets added from hints')
-            for missing_nb_set_to_add in to_add_from_hints:
-                se.add_neighbors_set(isite=isite, nb_set=missing_nb_set_to_add['new_nb_set'])
-            for missing_nb_set_to_add in to_add_from_hints:
-                isite_new_nb_set = missing_nb_set_to_add['isite']
-                cn_new_nb_set = missing_nb_set_to_add['cn_new_nb_set']
-                new_nb_set = missing_nb_set_to_add['new_nb_set']
-                inew_nb_set = se.neighbors_sets[isite_new_nb_set][cn_new_nb_set].index(new_nb_set)
-                logging.debug('    ... getting environments for nb_set ({:d}, {:d}) - '
-                              'from hints'.format(cn_new_nb_set, inew_nb_set))
-                tnbset1 = time.process_time()
-                self.update_nb_set_environments(se=se,
-                                                isite=isite_new_nb_set,
-                                                cn=cn_new_nb_set,
-                                                inb_set=inew_nb_set,
-                                                nb_set=new_nb_set,
-                                                optimization=optimization)
-                tnbset2 = time.process_time()
-                if cn not in nb_sets_info:
-                    nb_sets_info[cn] = {}
-                nb_sets_info[cn][inew_nb_set] = {'time': tnbset2 - tnbset1}
+            self._compute_site_environments(se=se, isite=isite, **site_kwargs)
             t2 = time.process_time()
-            se.update_site_info(isite=isite, info_dict={'time': t2 - t1, 'nb_sets_info': nb_sets_info})
             if timelimit is not None:
                 time_elapsed = t2 - time_init
                 time_left = timelimit - time_elapsed
@@ -766,6 +834,100 @@ class LocalGeometryFinder:
         logging.debug('    ... compute_structure_environments ended in {:.2f} seconds'.format(time_end - time_init))
         return se
 
+    def _compute_site_environments(self, se, isite, all_cns, recompute, optimization, additional_conditions,
+                                   valences, get_from_hints, max_cn, min_cn):
+        """
+        Computes the neighbors sets and the coordination environments of one site and stores them in the
+        StructureEnvironments object. See compute_structure_environments for the parameters.
+        :param se: StructureEnvironments object to be updated
+        :param isite: Index of the site
+        """
+        t1 = time.process_time()
+        # Seed the fallback permutations with the site index so that the result does not depend on the sites
+        # computed before (e.g. in another process)
+        self._random_state = np.random.RandomState(isite)
+        se.init_neighbors_sets(isite=isite, additional_conditions=additional_conditions, valences=valences)
+
+        to_add_from_hints = []
+        nb_sets_info = {}
+
+        for cn, nb_sets in se.neighbors_sets[isite].items():
+            if cn not in all_cns:
+                continue
+            for inb_set, nb_set in enumerate(nb_sets):
+                logging.debug('    ... getting environments for nb_set ({:d}, {:d})'.format(cn, inb_set))
+                tnbset1 = time.process_time()
+                ce = self.update_nb_set_environments(se=se, isite=isite, cn=cn, inb_set=inb_set, nb_set=nb_set,
+                                                     recompute=recompute, optimization=optimization)
+                tnbset2 = time.process_time()
+                if cn not in nb_sets_info:
+                    nb_sets_info[cn] = {}
+                nb_sets_info[cn][inb_set] = {'time': tnbset2 - tnbset1}
+                if get_from_hints:
+                    for cg_symbol, cg_dict in ce:
+                        cg = self.allcg[cg_symbol]
+                        # Get possibly missing neighbors sets
+                        if cg.neighbors_sets_hints is None:
+                            continue
+                        logging.debug('       ... getting hints from cg with mp_symbol "{}" ...'.format(cg_symbol))
+                        hints_info = {'csm': cg_dict['symmetry_measure'],
+                                      'nb_set': nb_set,
+                                      'permutation': cg_dict['permutation']}
+                        for nb_sets_hints in cg.neighbors_sets_hints:
+                            suggested_nb_set_voronoi_indices = nb_sets_hints.hints(hints_info)
+                            for inew, new_nb_set_voronoi_indices in enumerate(suggested_nb_set_voronoi_indices):
+                                logging.debug('           hint # {:d}'.format(inew))
+                                new_nb_set = se.NeighborsSet(structure=se.structure, isite=isite,
+                                                             detailed_voronoi=se.voronoi,
+                                                             site_voronoi_indices=new_nb_set_voronoi_indices,
+                                                             sources={'origin': 'nb_set_hints',
+                                                                      'hints_type': nb_sets_hints.hints_type,
+                                                                      'suggestion_index': inew,
+                                                                      'cn_map_source': [cn, inb_set],
+                                                                      'cg_source_symbol': cg_symbol})
+                                cn_new_nb_set = len(new_nb_set)
+                                if max_cn is not None and cn_new_nb_set > max_cn:
+                                    continue
+                                if min_cn is not None and cn_new_nb_set < min_cn:
+                                    continue
+                                if new_nb_set in [ta['new_nb_set'] for ta in to_add_from_hints]:
+                                    has_nb_set = True
+                                elif cn_new_nb_set not in se.neighbors_sets[isite]:
+                                    has_nb_set = False
+                                else:
+                                    has_nb_set = new_nb_set in se.neighbors_sets[isite][cn_new_nb_set]
+                                if not has_nb_set:
+                                    to_add_from_hints.append({'isite': isite,
+                                                              'new_nb_set': new_nb_set,
+                                                              'cn_new_nb_set': cn_new_nb_set})
+                                    logging.debug('              => to be computed')
+                                else:
+                                    logging.debug('              => already present')
+        logging.debug('    ... getting environments for nb_sets added from hints')
+        for missing_nb_set_to_add in to_add_from_hints:
+            se.add_neighbors_set(isite=isite, nb_set=missing_nb_set_to_add['new_nb_set'])
+        for missing_nb_set_to_add in to_add_from_hints:
+            isite_new_nb_set = missing_nb_set_to_add['isite']
+            cn_new_nb_set = missing_nb_set_to_add['cn_new_nb_set']
+            new_nb_set = missing_nb_set_to_add['new_nb_set']
+            inew_nb_set = se.neighbors_sets[isite_new_nb_set][cn_new_nb_set].index(new_nb_set)
+            logging.debug('    ... getting environments for nb_set ({:d}, {:d}) - '
+                          'from hints'.format(cn_new_nb_set, inew_nb_set))
+            tnbset1 = time.process_time()
+            self.update_nb_set_environments(se=se,
+                                            isite=isite_new_nb_set,
+                                            cn=cn_new_nb_set,
+                                            inb_set=inew_nb_set,
+                                            nb_set=new_nb_set,
+                                            optimization=optimization)
+            tnbset2 = time.process_time()
+            if cn not in nb_sets_info:
+                nb_sets_info[cn] = {}
+            nb_sets_info[cn][inew_nb_set] = {'time': tnbset2 - tnbset1}
+        self._random_state = None
+        t2 = time.process_time()
+        se.update_site_info(isite=isite, info_dict={'time': t2 - t1, 'nb_sets_info': nb_sets_info})
+
     def update_nb_set_environments(self, se, isite, cn, inb_set, nb_set, recompute=False, optimization=None):
         """
         :param se:
@@ -837,6 +999,21 @@ class LocalGeometryFinder:
         se.update_coordination_environments(isite=isite, cn=cn, nb_set=nb_set, ce=ce)
         return ce
 
+    def _get_permutations_symmetry_measures(self, permutations, points_perfect):
+        """
+        Computes at once the symmetry measures of the current local geometry (with the central site, centered on the
+        centroid including the central site) for each of the permutations.
+        :param permutations: List of permutations of the neighbors
+        :param points_perfect: Points of the perfect geometry
+        :return: List of the symmetry measures for each permutation
+        """
+        points_distorted = [self.local_geometry.points_wcs_ctwcc(permutation=perm) for perm in permutations]
+        permutations_symmetry_measures = symmetry_measures(points_distorted=points_distorted,
+                                                           points_perfect=points_perfect)
+        for sm_info in permutations_symmetry_measures:
+            sm_info['translation_vector'] = self.local_geometry.centroid_with_centre
+        return permutations_symmetry_measures
+
     def setup_local_geometry(self, isite, coords, optimization=None):
         """
         Sets up the AbstractGeometry for the local geometry of site with index isite.
@@ -1304,7 +1481,6 @@ class LocalGeometryFinder:
         # permutations_symmetry_measures = np.zeros(len(algo.permutations),
         #                                           np.float)
         if optimization == 2:
-            permutations_symmetry_measures = [None] * len(algo.permutations)
             permutations = list()
             algos = list()
             local2perfect_maps = list()
@@ -1319,19 +1495,10 @@ class LocalGeometryFinder:
                     local2perfect_map[ii] = iperfect
                 local2perfect_maps.append(local2perfect_map)
                 perfect2local_maps.append(perfect2local_map)
-
-                points_distorted = self.local_geometry.points_wcs_ctwcc(
-                    permutation=perm)
-
-                sm_info = symmetry_measure(points_distorted=points_distorted,
-                                           points_perfect=points_perfect)
-                sm_info['translation_vector'] = self.local_geometry.centroid_with_centre
-
-                permutations_symmetry_measures[iperm] = sm_info
                 algos.append(str(algo))
+            permutations_symmetry_measures = self._get_permutations_symmetry_measures(permutations, points_perfect)
             return permutations_symmetry_measures, permutations, algos, local2perfect_maps, perfect2local_maps
         else:
-            permutations_symmetry_measures = [None] * len(algo.permutations)
             permutations = list()
             algos = list()
             local2perfect_maps = list()
@@ -1346,16 +1513,8 @@ class LocalGeometryFinder:
                     local2perfect_map[ii] = iperfect
                 local2perfect_maps.append(local2perfect_map)
                 perfect2local_maps.append(perfect2local_map)
-
-                points_distorted = self.local_geometry.points_wcs_ctwcc(
-                    permutation=perm)
-
-                sm_info = symmetry_measure(points_distorted=points_distorted,
-                                           points_perfect=points_perfect)
-                sm_info['translation_vector'] = self.local_geometry.centroid_with_centre
-
-                permutations_symmetry_measures[iperm] = sm_info
                 algos.append(str(algo))
+            permutations_symmetry_measures = self._get_permutations_symmetry_measures(permutations, points_perfect)
             return permutations_symmetry_measures, permutations, algos, local2perfect_maps, perfect2local_maps
 
     def coordination_geometry_symmetry_measures_separation_plane(self,
@@ -1676,14 +1835,8 @@ class LocalGeometryFinder:
                 if testing:
                     separation_permutations.append(sep_perm)
 
-                points_distorted = self.local_geometry.points_wcs_ctwcc(
-                    permutation=pp)
-
-                sm_info = symmetry_measure(points_distorted=points_distorted,
-                                           points_perfect=points_perfect)
-                sm_info['translation_vector'] = self.local_geometry.centroid_with_centre
-
-                permutations_symmetry_measures.append(sm_info)
+            permutations_symmetry_measures.extend(self._get_permutations_symmetry_measures(permutations,
+                                                                                           points_perfect))
             if plane_found:
                 break
         if len(permutations_symmetry_measures) > 0:
@@ -1758,15 +1911,8 @@ class LocalGeometryFinder:
 
             permutations.append(pp)
 
-            points_distorted = self.local_geometry.points_wcs_ctwcc(
-                permutation=pp)
-
-            sm_info = symmetry_measure(points_distorted=points_distorted,
-                                       points_perfect=points_perfect)
-
-            sm_info['translation_vector'] = self.local_geometry.centroid_with_centre
-
-            permutations_symmetry_measures.append(sm_info)
+        permutations_symmetry_measures.extend(self._get_permutations_symmetry_measures(permutations,
+                                                                                       points_perfect))
 
         if len(permutations_symmetry_measures) > 0:
             return permutations_symmetry_measures, permutations, [sepplane.algorithm_type] * len(
@@ -1830,15 +1976,8 @@ class LocalGeometryFinder:
 
             permutations.append(pp)
 
-            points_distorted = self.local_geometry.points_wcs_ctwcc(
-                permutation=pp)
-
-            sm_info = symmetry_measure(points_distorted=points_distorted,
-                                       points_perfect=points_perfect)
-
-            sm_info['translation_vector'] = self.local_geometry.centroid_with_centre
-
-            permutations_symmetry_measures.append(sm_info)
+        permutations_symmetry_measures.extend(self._get_permutations_symmetry_measures(permutations,
+                                                                                       points_perfect))
 
         if len(permutations_symmetry_measures) > 0:
             return permutations_symmetry_measures, permutations, [sepplane.algorithm_type] * len(
@@ -1859,13 +1998,13 @@ class LocalGeometryFinder:
         :param NRANDOM: Number of random permutations to be tested
         :return: The symmetry measures for the given coordination geometry for each permutation investigated
         """
-        permutations_symmetry_measures = [None] * NRANDOM
         permutations = list()
         algos = list()
         perfect2local_maps = list()
         local2perfect_maps = list()
+        random_state = np.random if self._random_state is None else self._random_state
         for iperm in range(NRANDOM):
-            perm = np.random.permutation(
+            perm = random_state.permutation(
                 coordination_geometry.coordination_number)
             permutations.append(perm)
             p2l = {}
@@ -1875,13 +2014,6 @@ class LocalGeometryFinder:
                 l2p[pp] = i_p
             perfect2local_maps.append(p2l)
             local2perfect_maps.append(l2p)
-
-            points_distorted = self.local_geometry.points_wcs_ctwcc(
-                permutation=perm)
-            sm_info = symmetry_measure(points_distorted=points_distorted,
-                                       points_perfect=points_perfect)
-            sm_info['translation_vector'] = self.local_geometry.centroid_with_centre
-
-            permutations_symmetry_measures[iperm] = sm_info
             algos.append('APPROXIMATE_FALLBACK')
+        permutations_symmetry_measures = self._get_permutations_symmetry_measures(permutations, points_perfect)
         return permutations_symmetry_measures, permutations, algos, local2perfect_maps, perfect2local_maps
@@ -5,6 +5,7 @@ __author__ = 'waroquiers'
 
 import unittest
 import os
+import itertools
 import numpy as np
 from pymatgen.util.testing import PymatgenTest
 
@@ -12,6 +13,9 @@ from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_f
 from pymatgen.analysis.chemenv.coordination_environments.coordination_geometries import AllCoordinationGeometries
 from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder import AbstractGeometry
 from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder import symmetry_measure
+from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder import symmetry_measures
+from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_finder import \
+    minimum_symmetry_measure
 
 json_files_dir = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "..",
                               'test_files', "chemenv", "json_test_files")
@@ -210,6 +214,43 @@ class CoordinationGeometryFinderTest(PymatgenTest):
         self.assertAlmostEqual(se_hints.ce_list[0][13][0], se_nohints.ce_list[0][13][0])
         self.assertTrue(set(se_nohints.ce_list[0].keys()).issubset(set(se_hints.ce_list[0].keys())))
 
+    def test_symmetry_measures(self):
+        cg = self.lgf.allcg['O:6']
+        perfect_geometry = AbstractGeometry.from_cg(cg=cg, centering_type='centroid',
+                                                    include_central_site_in_centroid=True)
+        points_perfect = perfect_geometry.points_wcs_ctwcc()
+        np.random.seed(0)
+        local_geometry = AbstractGeometry(central_site=[0.0, 0.0, 0.0],
+                                          bare_coords=np.array(cg.points) + 0.1 * np.random.randn(6, 3),
+                                          centering_type='centroid', include_central_site_in_centroid=True)
+        permutations = list(itertools.permutations(range(6)))[::7]
+        points_distorted = [local_geometry.points_wcs_ctwcc(permutation=perm) for perm in permutations]
+        sm_infos = symmetry_measures(points_distorted, points_perfect)
+        self.assertEqual(len(sm_infos), len(permutations))
+        for pdist, sm_info in zip(points_distorted, sm_infos):
+            ref = symmetry_measure(pdist, points_perfect)
+            self.assertAlmostEqual(sm_info['symmetry_measure'], ref['symmetry_measure'])
+            self.assertAlmostEqual(sm_info['scaling_factor'], ref['scaling_factor'])
+            self.assertArrayAlmostEqual(sm_info['rotation_matrix'], ref['rotation_matrix'])
+        self.assertEqual(symmetry_measures([], points_perfect), [])
+
+        imin = int(np.argmin([sm_info['symmetry_measure'] for sm_info in sm_infos]))
+        for prune in [True, False]:
+            imin_prune, sm_info = minimum_symmetry_measure(points_distorted, points_perfect, prune=prune,
+                                                           block_size=4)
+            self.assertEqual(imin_prune, imin)
+            self.assertAlmostEqual(sm_info['symmetry_measure'], sm_infos[imin]['symmetry_measure'])
+
+    def test_nproc(self):
+        self.lgf.setup_structure(self.get_structure('SrTiO3'))
+        se = self.lgf.compute_structure_environments(only_cations=False, max_cn=8)
+        se_nproc = self.lgf.compute_structure_environments(only_cations=False, max_cn=8, nproc=2)
+        self.assertEqual(se_nproc.neighbors_sets, se.neighbors_sets)
+        self.assertEqual(se_nproc.ce_list, se.ce_list)
+        self.assertEqual(se_nproc.info['sites_info'][0]['nb_sets_info'].keys(),
+                         se.info['sites_info'][0]['nb_sets_info'].keys())
+        self.assertRaises(ValueError, self.lgf.compute_structure_environments, nproc=2, timelimit=10)
+
 
 if __name__ == "__main__":
     unittest.main()
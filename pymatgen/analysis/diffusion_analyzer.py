@@ -132,7 +132,7 @@ class DiffusionAnalyzer(MSONable):
 
     def __init__(self, structure, displacements, specie, temperature,
                  time_step, step_skip, smoothed="max", min_obs=30,
-                 avg_nsteps=1000, lattices=None):
+                 avg_nsteps=1000, lattices=None, use_fft=False, chunk_size=None):
         """
         This constructor is meant to be used with pre-processed data.
         Other convenient constructors are provided as class methods (see
@@ -186,6 +186,17 @@ class DiffusionAnalyzer(MSONable):
             lattices (array): Numpy array of lattice matrix of every step. Used
                 for NPT-AIMD. For NVT-AIMD, the lattice at each time step is
                 set to the lattice in the "structure" argument.
+            use_fft (bool): Used with smoothed="max". Whether to compute the
+                MSD and MSCD of all time steps at once from the FFT
+                autocorrelation of the displacements (windowed MSD algorithm),
+                instead of building the displacement differences for each
+                sampled time step. The results are the same up to numerical
+                precision, at O(nions * nsteps * log(nsteps)) cost. Defaults
+                to False.
+            chunk_size (int): Used with use_fft. Number of ions processed at
+                a time, so that memory use does not scale with the full set of
+                displacements, which can then be a memory-mapped array.
+                Defaults to None, i.e., all ions at once.
         """
         self.structure = structure
         self.disp = displacements
@@ -197,6 +208,8 @@ class DiffusionAnalyzer(MSONable):
         self.smoothed = smoothed
         self.avg_nsteps = avg_nsteps
         self.lattices = lattices
+        self.use_fft = use_fft
+        self.chunk_size = chunk_size
 
         if lattices is None:
             self.lattices = np.array([structure.lattice.matrix.tolist()])
@@ -215,13 +228,19 @@ class DiffusionAnalyzer(MSONable):
             self.conductivity_components = np.array([0., 0., 0.])
             self.max_framework_displacement = 0
         else:
-            framework_disp = self.disp[framework_indices]
-            drift = np.average(framework_disp, axis=0)[None, :, :]
+            fft = use_fft and smoothed not in (False, None, "constant")
+            if fft:
+                drift = self._get_chunked_drift(framework_indices)
+                dc = None
+                nions, nsteps, dim = self.disp.shape
+            else:
+                framework_disp = self.disp[framework_indices]
+                drift = np.average(framework_disp, axis=0)[None, :, :]
 
-            # drift corrected position
-            dc = self.disp - drift
+                # drift corrected position
+                dc = self.disp - drift
 
-            nions, nsteps, dim = dc.shape
+                nions, nsteps, dim = dc.shape
 
             if not smoothed:
                 timesteps = np.arange(0, nsteps)
@@ -242,34 +261,39 @@ class DiffusionAnalyzer(MSONable):
 
             # calculate the smoothed msd values
             msd = np.zeros_like(dt, dtype=np.double)
-            sq_disp_ions = np.zeros((len(dc), len(dt)), dtype=np.double)
+            sq_disp_ions = np.zeros((nions, len(dt)), dtype=np.double)
             msd_components = np.zeros(dt.shape + (3,))
 
             # calculate mean square charge displacement
             mscd = np.zeros_like(msd, dtype=np.double)
 
-            for i, n in enumerate(timesteps):
-                if not smoothed:
-                    dx = dc[:, i:i + 1, :]
-                    dcomponents = dc[:, i:i + 1, :]
-                elif smoothed == "constant":
-                    dx = dc[:, i:i + avg_nsteps, :] - dc[:, 0:avg_nsteps, :]
-                    dcomponents = dc[:, i:i + avg_nsteps, :] - dc[:, 0:avg_nsteps, :]
-                else:
-                    dx = dc[:, n:, :] - dc[:, :-n, :]
-                    dcomponents = dc[:, n:, :] - dc[:, :-n, :]
-
-                # Get msd
-                sq_disp = dx ** 2
-                sq_disp_ions[:, i] = np.average(np.sum(sq_disp, axis=2), axis=1)
-                msd[i] = np.average(sq_disp_ions[:, i][indices])
-
-                msd_components[i] = np.average(dcomponents[indices] ** 2,
-                                               axis=(0, 1))
-
-                # Get mscd
-                sq_chg_disp = np.sum(dx[indices, :, :], axis=0) ** 2
-                mscd[i] = np.average(np.sum(sq_chg_disp, axis=1), axis=0) / len(indices)
+            if fft:
+                sq_disp_ions, msd_components, mscd, max_ion_displacements = \
+                    self._get_fft_msd(drift, indices, timesteps)
+                msd = np.average(sq_disp_ions[indices], axis=0)
+            else:
+                for i, n in enumerate(timesteps):
+                    if not smoothed:
+                        dx = dc[:, i:i + 1, :]
+                        dcomponents = dc[:, i:i + 1, :]
+                    elif smoothed == "constant":
+                        dx = dc[:, i:i + avg_nsteps, :] - dc[:, 0:avg_nsteps, :]
+                        dcomponents = dc[:, i:i + avg_nsteps, :] - dc[:, 0:avg_nsteps, :]
+                    else:
+                        dx = dc[:, n:, :] - dc[:, :-n, :]
+                        dcomponents = dc[:, n:, :] - dc[:, :-n, :]
+
+                    # Get msd
+                    sq_disp = dx ** 2
+                    sq_disp_ions[:, i] = np.average(np.sum(sq_disp, axis=2), axis=1)
+                    msd[i] = np.average(sq_disp_ions[:, i][indices])
+
+                    msd_components[i] = np.average(dcomponents[indices] ** 2,
+                                                   axis=(0, 1))
+
+                    # Get mscd
+                    sq_chg_disp = np.sum(dx[indices, :, :], axis=0) ** 2
+                    mscd[i] = np.average(np.sum(sq_chg_disp, axis=1), axis=0) / len(indices)
 
             def weighted_lstsq(a, b):
                 if smoothed == "max":
@@ -327,9 +351,12 @@ class DiffusionAnalyzer(MSONable):
 
             # Drift and displacement information.
             self.drift = drift
-            self.corrected_displacements = dc
-            self.max_ion_displacements = np.max(np.sum(
-                dc ** 2, axis=-1) ** 0.5, axis=1)
+            self._corrected_displacements = dc
+            if fft:
+                self.max_ion_displacements = max_ion_displacements
+            else:
+                self.max_ion_displacements = np.max(np.sum(
+                    dc ** 2, axis=-1) ** 0.5, axis=1)
             self.max_framework_displacement = np.max(self.max_ion_displacements[framework_indices])
             self.msd = msd
             self.mscd = mscd
@@ -340,6 +367,60 @@ class DiffusionAnalyzer(MSONable):
             self.indices = indices
             self.framework_indices = framework_indices
 
+    @property
+    def corrected_displacements(self):
+        """
+        Drift corrected displacements as a nions x nsteps x 3 array. Computed
+        on first access if the MSD was computed in chunks.
+        """
+        if self._corrected_displacements is None:
+            self._corrected_displacements = self.disp - self.drift
+        return self._corrected_displacements
+
+    def _get_chunked_drift(self, framework_indices):
+        """
+        Average displacement of the framework ions, summed over chunks of ions.
+        """
+        chunk_size = self.chunk_size or len(self.disp)
+        framework = np.zeros(len(self.disp), dtype=bool)
+        framework[framework_indices] = True
+        drift = np.zeros(self.disp.shape[1:])
+        for start in range(0, len(self.disp), chunk_size):
+            mask = framework[start:start + chunk_size]
+            if np.any(mask):
+                drift += np.sum(np.asarray(self.disp[start:start + chunk_size])[mask], axis=0)
+        return drift[None, :, :] / len(framework_indices)
+
+    def _get_fft_msd(self, drift, indices, timesteps):
+        """
+        Computes the square displacements of all ions, and the MSD components
+        and MSCD of the specie, at the sampled time steps with the windowed
+        MSD algorithm, processing chunk_size ions at a time.
+
+        Returns:
+            (sq_disp_ions, msd_components, mscd, max_ion_displacements)
+        """
+        nions, nsteps, dim = self.disp.shape
+        chunk_size = self.chunk_size or nions
+        specie = np.zeros(nions, dtype=bool)
+        specie[indices] = True
+        sq_disp_ions = np.zeros((nions, len(timesteps)))
+        msd_components = np.zeros((len(timesteps), dim))
+        max_ion_displacements = np.zeros(nions)
+        chg_disp = np.zeros((nsteps, dim))
+        for start in range(0, nions, chunk_size):
+            dc = np.asarray(self.disp[start:start + chunk_size]) - drift
+            mask = specie[start:start + chunk_size]
+            sq_disp = _get_windowed_msd(dc, timesteps)
+            sq_disp_ions[start:start + chunk_size] = np.sum(sq_disp, axis=-1)
+            msd_components += np.sum(sq_disp[mask], axis=0)
+            chg_disp += np.sum(dc[mask], axis=0)
+            max_ion_displacements[start:start + chunk_size] = np.max(
+                np.sum(dc ** 2, axis=-1) ** 0.5, axis=1)
+        msd_components /= len(indices)
+        mscd = np.sum(_get_windowed_msd(chg_disp[None], timesteps)[0], axis=-1) / len(indices)
+        return sq_disp_ions, msd_components, mscd, max_ion_displacements
+
     def get_drift_corrected_structures(self, start=None, stop=None, step=None):
         """
         Returns an iterator for the drift-corrected structures. Use of
@@ -746,7 +827,9 @@ class DiffusionAnalyzer(MSONable):
             "min_obs": self.min_obs,
             "smoothed": self.smoothed,
             "avg_nsteps": self.avg_nsteps,
-            "lattices": self.lattices.tolist()
+            "lattices": self.lattices.tolist(),
+            "use_fft": self.use_fft,
+            "chunk_size": self.chunk_size
         }
 
     @classmethod
@@ -763,7 +846,36 @@ class DiffusionAnalyzer(MSONable):
                    step_skip=d["step_skip"], min_obs=d["min_obs"],
                    smoothed=d.get("smoothed", "max"),
                    avg_nsteps=d.get("avg_nsteps", 1000),
-                   lattices=np.array(d.get("lattices", [d["structure"]["lattice"]["matrix"]])))
+                   lattices=np.array(d.get("lattices", [d["structure"]["lattice"]["matrix"]])),
+                   use_fft=d.get("use_fft", False),
+                   chunk_size=d.get("chunk_size"))
+
+
+def _get_windowed_msd(x, lags):
+    """
+    Mean square displacement over all time origins of a trajectory at given
+    time lags, computed from the FFT autocorrelation (windowed MSD
+    algorithm) instead of the differences x[t + n] - x[t] for each lag.
+
+    Args:
+        x (np.ndarray): Positions with shape [..., time step, axis].
+        lags ([int]): Time lags.
+
+    Returns:
+        Array with shape [..., lag, axis] of the MSD along each axis.
+    """
+    nsteps = x.shape[-2]
+    lags = np.asarray(lags, dtype=int)
+    sq = x ** 2
+    # csum[..., k, :] is the sum of the first k squared positions.
+    csum = np.concatenate([np.zeros_like(sq[..., :1, :]), np.cumsum(sq, axis=-2)], axis=-2)
+    # sum_{t < nsteps - n} x[t] ** 2 + sum_{t >= n} x[t] ** 2
+    s1 = csum[..., nsteps - lags, :] + csum[..., -1:, :] - csum[..., lags, :]
+    nfft = 2 ** int(np.ceil(np.log2(2 * nsteps)))
+    f = np.fft.rfft(x, n=nfft, axis=-2)
+    # sum_t x[t] * x[t + n]
+    autocorr = np.fft.irfft(f * f.conj(), n=nfft, axis=-2)[..., lags, :]
+    return (s1 - 2 * autocorr) / (nsteps - lags)[:, None]
 
 
 def get_conversion_factor(structure, species, temperature):
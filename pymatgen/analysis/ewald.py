@@ -55,7 +55,8 @@ class EwaldSummation(MSONable):
     CONV_FACT = 1e10 * constants.e / (4 * pi * constants.epsilon_0)
 
     def __init__(self, structure, real_space_cut=None, recip_space_cut=None,
-                 eta=None, acc_factor=12.0, w=1 / sqrt(2), compute_forces=False):
+                 eta=None, acc_factor=12.0, w=1 / sqrt(2), compute_forces=False,
+                 chunk_size=None):
         """
         Initializes and calculates the Ewald sum. Default convergence
         parameters have been specified, but you can override them if you wish.
@@ -84,11 +85,17 @@ class EwaldSummation(MSONable):
                 cutoffs are set to None.
             compute_forces (bool): Whether to compute forces. False by
                 default since it is usually not needed.
+            chunk_size (int): If set, the real space sum is evaluated for
+                chunk_size sites at a time, which limits the memory used by
+                the neighbor list for very large cells. Defaults to None, i.e.,
+                all sites at once using the neighbor list cached on the
+                structure.
         """
         self._s = structure
         self._charged = abs(structure.charge) > 1e-8
         self._vol = structure.volume
         self._compute_forces = compute_forces
+        self._chunk_size = chunk_size
 
         self._acc_factor = acc_factor
         # set screening length
@@ -148,39 +155,72 @@ class EwaldSummation(MSONable):
         Returns:
             Ewald sum of substructure.
         """
-        total_energy_matrix = self.total_energy_matrix.copy()
+        scaling = self.get_sub_structure_scaling(sub_structure, tol=tol)
+        return np.dot(scaling, np.dot(self.total_energy_matrix, scaling))
 
-        def find_match(site):
-            for test_site in sub_structure:
-                frac_diff = abs(np.array(site.frac_coords)
-                                - np.array(test_site.frac_coords)) % 1
-                frac_diff = [abs(a) < tol or abs(a) > 1 - tol
-                             for a in frac_diff]
-                if all(frac_diff):
-                    return test_site
-            return None
-
-        matches = []
-        for i, site in enumerate(self._s):
-            matching_site = find_match(site)
-            if matching_site:
-                new_charge = compute_average_oxidation_state(matching_site)
-                old_charge = self._oxi_states[i]
-                scaling_factor = new_charge / old_charge
-                matches.append(matching_site)
-            else:
-                scaling_factor = 0
-            total_energy_matrix[i, :] *= scaling_factor
-            total_energy_matrix[:, i] *= scaling_factor
+    def get_sub_structure_scaling(self, sub_structure, tol=1e-3):
+        """
+        Maps the sites of the structure to the sites of a sub structure in the
+        same lattice, by comparing all fractional coordinates at once.
+
+        Args:
+            sub_structure (Structure): Substructure of the structure, with
+                possible different charges.
+            tol (float): Tolerance for site matching in fractional coordinates.
 
-        if len(matches) != len(sub_structure):
+        Returns:
+            (np.ndarray) Charge scaling factor of each site of the structure,
+            i.e., the ratio of the charge of the matching site of the sub
+            structure to the original charge, or 0 if there is no matching
+            site. The Ewald sum of the sub structure is the quadratic form
+            of the total energy matrix with these factors.
+        """
+        fcoords = self._s.frac_coords
+        sub_fcoords = np.reshape(sub_structure.frac_coords, (-1, 3))
+        frac_diff = np.subtract(fcoords[:, None, :], sub_fcoords[None, :, :])
+        frac_diff -= np.round(frac_diff)
+        is_match = np.all(np.abs(frac_diff) < tol, axis=-1)
+        matched = np.any(is_match, axis=1)
+        # Each site is matched with the first matching site of the sub
+        # structure.
+        first = np.argmax(is_match, axis=1)
+
+        if np.sum(matched) != len(sub_structure):
             output = ["Missing sites."]
-            for site in sub_structure:
-                if site not in matches:
+            found = set(first[matched])
+            for j, site in enumerate(sub_structure):
+                if j not in found:
                     output.append("unmatched = {}".format(site))
             raise ValueError("\n".join(output))
 
-        return sum(sum(total_energy_matrix))
+        sub_charges = np.array([compute_average_oxidation_state(site)
+                                for site in sub_structure])
+        scaling = np.zeros(len(self._s))
+        scaling[matched] = sub_charges[first[matched]] / \
+            np.array(self._oxi_states)[matched]
+        return scaling
+
+    def compute_sub_structures(self, sub_structures, tol=1e-3):
+        """
+        Gives the total ewald energies of several sub structures in the same
+        lattice, as a batch of quadratic forms of the total energy matrix.
+        This is much faster than calling compute_sub_structure for each sub
+        structure, e.g., to rank many orderings of the same supercell.
+
+        Args:
+            sub_structures ([Structure]): Substructures to compute Ewald sums
+                for.
+            tol (float): Tolerance for site matching in fractional coordinates.
+
+        Returns:
+            (np.ndarray) Ewald sums of the substructures.
+        """
+        if len(sub_structures) == 0:
+            return np.zeros(0)
+        scalings = np.array([self.get_sub_structure_scaling(s, tol=tol)
+                             for s in sub_structures])
+        return np.sum(np.dot(scalings, self.total_energy_matrix) * scalings,
+                      axis=1)
 
     @property
     def reciprocal_space_energy(self):
@@ -374,12 +414,15 @@ class EwaldSummation(MSONable):
     def _calc_real_and_point(self):
         """
         Determines the self energy -(eta/pi)**(1/2) * sum_{i=1}^{N} q_i**2
+
+        The real space terms of all pairs within the cutoff are computed at
+        once from the neighbor list of the structure, and accumulated into
+        the energy matrix and forces with np.bincount.
         """
-        fcoords = self._s.frac_coords
         forcepf = 2.0 * self._sqrt_eta / sqrt(pi)
         coords = self._coords
         numsites = self._s.num_sites
-        ereal = np.empty((numsites, numsites), dtype=np.float)
+        ereal = np.zeros((numsites, numsites), dtype=np.float)
 
         forces = np.zeros((numsites, 3), dtype=np.float)
 
@@ -387,37 +430,49 @@ class EwaldSummation(MSONable):
 
         epoint = - qs ** 2 * sqrt(self._eta / pi)
 
-        for i in range(numsites):
-            nfcoords, rij, js, _ = self._s.lattice.get_points_in_sphere(fcoords,
-                                                                        coords[i], self._rmax, zip_results=False)
+        chunk_size = self._chunk_size or numsites
+        for start in range(0, numsites, chunk_size):
+            end = min(start + chunk_size, numsites)
+            if start == 0 and end == numsites:
+                centers, js, images, rij = self._s.get_neighbor_list(
+                    self._rmax, exclude_self=False)
+            else:
+                centers, js, images, rij = self._s.get_neighbor_list(
+                    self._rmax, sites=self._s.sites[start:end], exclude_self=False)
 
             # remove the rii term
             inds = rij > 1e-8
+            centers = centers[inds]
             js = js[inds]
             rij = rij[inds]
-            nfcoords = nfcoords[inds]
+            images = images[inds]
 
-            qi = qs[i]
+            qi = qs[centers + start]
             qj = qs[js]
 
             erfcval = erfc(self._sqrt_eta * rij)
             new_ereals = erfcval * qi * qj / rij
 
-            # insert new_ereals
-            for k in range(numsites):
-                ereal[k, i] = np.sum(new_ereals[js == k])
+            # ereal[k, i] is the sum of the terms of neighbors k of site i
+            nc = end - start
+            ereal[:, start:end] = np.bincount(
+                js * nc + centers, weights=new_ereals,
+                minlength=numsites * nc).reshape(numsites, nc)
 
             if self._compute_forces:
-                nccoords = self._s.lattice.get_cartesian_coords(nfcoords)
+                nccoords = coords[js] + np.dot(images, self._s.lattice.matrix)
 
                 fijpf = qj / rij ** 3 * (erfcval + forcepf * rij *
                                          np.exp(-self._eta * rij ** 2))
-                forces[i] += np.sum(np.expand_dims(fijpf, 1) *
-                                    (np.array([coords[i]]) - nccoords) *
-                                    qi * EwaldSummation.CONV_FACT, axis=0)
+                fij = np.expand_dims(fijpf * qi, 1) * \
+                    (coords[centers + start] - nccoords)
+                for k in range(3):
+                    forces[start:end, k] += np.bincount(
+                        centers, weights=fij[:, k], minlength=nc)
 
         ereal *= 0.5 * EwaldSummation.CONV_FACT
         epoint *= EwaldSummation.CONV_FACT
+        forces *= EwaldSummation.CONV_FACT
         return ereal, epoint, forces
 
     @property
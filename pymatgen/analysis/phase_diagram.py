@@ -621,6 +621,100 @@ class PhaseDiagram(MSONable):
         """
         return self.get_decomp_and_e_above_hull(entry)[1]
 
+    def _get_facet_planes(self):
+        """
+        Returns the hyperplanes of the facets as a (n_facets, dim) array of
+        coefficients, such that the energy per atom of the plane at pd_coords x
+        is [x, 1] . plane, and the (n_facets, dim, dim) inverse matrices
+        converting [x, 1] to barycentric coordinates. Computed once and cached.
+        """
+        if getattr(self, "_facet_planes", None) is None:
+            facets = np.array(self.facets)
+            coords = self.qhull_data[facets, :-1]
+            aug = np.concatenate([coords, np.ones(facets.shape + (1,))], axis=-1)
+            aug_inv = np.linalg.inv(aug)
+            planes = np.einsum("fij,fj->fi", aug_inv, self.qhull_data[facets, -1])
+            self._facet_planes = planes, aug_inv
+        return self._facet_planes
+
+    def get_decomps_and_hull_energies(self, compositions, chunk_size=1000):
+        """
+        Batch version of get_decomposition and get_hull_energy. The lower
+        convex hull is the maximum of the hyperplanes of its facets, so the
+        hull energies of all compositions are obtained with matrix products
+        instead of searching the facets one composition at a time.
+
+        Args:
+            compositions: Sequence of Compositions, or a (n, len(elements))
+                array of amounts of the elements of the phase diagram (in the
+                order of self.elements).
+            chunk_size (int): Number of compositions processed at once, which
+                limits the memory used to chunk_size * n_facets floats.
+
+        Returns:
+            (decompositions, hull energies) as a list of dicts of
+            {Entry: amount} and an array of energies **per atom**.
+        """
+        amounts = _get_amounts(compositions, self.elements)
+        x = amounts / amounts.sum(axis=1)[:, None]
+        x[:, 0] = 1
+
+        planes, aug_inv = self._get_facet_planes()
+        tol = PhaseDiagram.numerical_tol
+        decomps = []
+        hull_energies = np.zeros(len(x))
+        for start in range(0, len(x), chunk_size):
+            xc = np.roll(x[start:start + chunk_size], -1, axis=1)
+            plane_energies = np.dot(xc, planes.T)
+            inds = plane_energies.argmax(axis=1)
+            hull_energies[start:start + chunk_size] = plane_energies[
+                np.arange(len(xc)), inds
+            ]
+            bary = np.einsum("ni,nij->nj", xc, aug_inv[inds])
+            for i in np.where(bary.min(axis=1) < -tol / 10)[0]:
+                # The composition lies on a plane shared by several (coplanar)
+                # facets, and is outside the one that was found.
+                for f in np.where(plane_energies[i] >= plane_energies[i, inds[i]] - tol)[0]:
+                    b = np.dot(xc[i], aug_inv[f])
+                    if b.min() >= -tol / 10:
+                        inds[i], bary[i] = f, b
+                        break
+            for f, amts in zip(inds, bary):
+                decomps.append(
+                    {
+                        self.qhull_entries[j]: amt
+                        for j, amt in zip(self.facets[f], amts)
+                        if abs(amt) > tol
+                    }
+                )
+        return decomps, hull_energies
+
+    def get_decomps_and_e_above_hulls(self, entries, allow_negative=False):
+        """
+        Batch version of get_decomp_and_e_above_hull, which is much faster
+        when screening many entries.
+
+        Args:
+            entries: Sequence of PDEntry like objects
+            allow_negative: Whether to allow negative e_above_hulls. Defaults
+                to False.
+
+        Returns:
+            (decomps, energies above convex hull) as a list of dicts of
+            {Entry: amount} and an array.
+        """
+        entries = list(entries)
+        decomps, hull_energies = self.get_decomps_and_hull_energies(
+            [e.composition for e in entries]
+        )
+        ehulls = np.array([e.energy_per_atom for e in entries]) - hull_energies
+        for i, entry in enumerate(entries):
+            if entry in self.stable_entries:
+                decomps[i], ehulls[i] = {entry: 1}, 0
+        if not allow_negative and np.any(ehulls < -PhaseDiagram.numerical_tol):
+            raise ValueError("No valid decomp found!")
+        return decomps, ehulls
+
     def get_equilibrium_reaction_energy(self, entry):
         """
         Provides the reaction energy of a stable entry from the neighboring
@@ -1196,6 +1290,365 @@ class CompoundPhaseDiagram(PhaseDiagram):
         return cls(entries, terminal_compositions, d["normalize_terminal_compositions"])
 
 
+class PatchedPhaseDiagram(MSONable):
+    """
+    Phase diagram built from the phase diagrams of the chemical subsystems
+    that appear in the entries instead of a single convex hull over all
+    elements, which is impractical for high-dimensional entry sets.
+
+    The decomposition of a composition only involves entries whose elements
+    are a subset of its own elements, so the hull energies, decompositions and
+    energies above hull are the same as those of a PhaseDiagram over all
+    entries. A PhaseDiagram is constructed for each chemical system that is not
+    a subsystem of another one. Compositions that do not fall into any of them
+    are handled by a phase diagram built (and cached) for their own chemical
+    system.
+
+    Unlike PhaseDiagram, there are no facets of the full phase diagram, so
+    the chemical potential methods are not available.
+
+    .. attribute: pds
+
+        Dict of {frozenset(elements): PhaseDiagram} of the sub phase diagrams.
+    """
+
+    def __init__(self, entries, elements=None, nproc=None):
+        """
+        Args:
+            entries ([PDEntry]): A list of PDEntry-like objects having an
+                energy, energy_per_atom and composition.
+            elements ([Element]): Optional list of elements in the phase
+                diagram. If set to None, the elements are determined from
+                the the entries themselves and are sorted alphabetically.
+                If specified, element ordering (e.g. for pd coordinates)
+                is preserved.
+            nproc (int): Number of processes used to construct the sub phase
+                diagrams. Defaults to None, i.e., no parallelization.
+        """
+        entries = list(entries)
+        if elements is None:
+            elements = set()
+            for entry in entries:
+                elements.update(entry.composition.elements)
+            elements = sorted(list(elements))
+        elements = list(elements)
+
+        spaces = set(frozenset(e.composition.elements) for e in entries)
+        maximal_spaces = []
+        for space in sorted(spaces, key=len, reverse=True):
+            if not any(space <= s for s in maximal_spaces):
+                maximal_spaces.append(space)
+
+        self.all_entries = entries
+        self.elements = elements
+        self.dim = len(elements)
+        args = [self._get_pd_args(space) for space in maximal_spaces]
+        if nproc is not None:
+            from multiprocessing import Pool
+
+            with Pool(nproc) as p:
+                results = p.starmap(_get_sub_phase_diagram, args)
+            # The sub phase diagrams come back with copies of the entries,
+            # which are replaced by the entries that were passed in.
+            pds = [_restore_pd_entries(pd, a[0], inds) for (pd, inds), a in zip(results, args)]
+        else:
+            pds = [PhaseDiagram(*a) for a in args]
+        self.pds = dict(zip(maximal_spaces, pds))
+
+        el_refs = {}
+        stable_entries = set()
+        for pd in pds:
+            el_refs.update(pd.el_refs)
+            stable_entries.update(pd.stable_entries)
+        if len(el_refs) != self.dim:
+            raise PhaseDiagramError(
+                "There are no entries associated with a terminal element!."
+            )
+        self.el_refs = el_refs
+        self._stable_entries = stable_entries
+
+    def _get_pd_args(self, space):
+        entries = [e for e in self.all_entries if space.issuperset(e.composition.elements)]
+        return entries, [el for el in self.elements if el in space]
+
+    def _get_pd(self, comp):
+        """
+        Returns the smallest sub phase diagram that contains a composition.
+        """
+        if set(comp.elements).difference(self.elements):
+            raise ValueError(
+                "{} has elements not in the phase diagram {}"
+                "".format(comp, self.elements)
+            )
+        return self._get_space_pd(frozenset(comp.elements))
+
+    def _get_space_pd(self, space):
+        """
+        Returns the smallest sub phase diagram that contains a chemical system.
+        """
+        pds = [(s, pd) for s, pd in self.pds.items() if space <= s]
+        if pds:
+            return min(pds, key=lambda x: len(x[0]))[1]
+        pd = PhaseDiagram(*self._get_pd_args(space))
+        self.pds[space] = pd
+        return pd
+
+    @property
+    def stable_entries(self):
+        """
+        Returns the stable entries in the phase diagram.
+        """
+        return self._stable_entries
+
+    @property
+    def unstable_entries(self):
+        """
+        Entries that are unstable in the phase diagram. Includes positive
+        formation energy entries.
+        """
+        return [e for e in self.all_entries if e not in self.stable_entries]
+
+    def get_form_energy(self, entry):
+        """
+        Returns the formation energy for an entry (NOT normalized) from the
+        elemental references.
+
+        Args:
+            entry: A PDEntry-like object.
+
+        Returns:
+            Formation energy from the elemental references.
+        """
+        c = entry.composition
+        return entry.energy - sum(
+            [c[el] * self.el_refs[el].energy_per_atom for el in c.elements]
+        )
+
+    def get_form_energy_per_atom(self, entry):
+        """
+        Returns the formation energy per atom for an entry from the
+        elemental references.
+
+        Args:
+            entry: An PDEntry-like object
+
+        Returns:
+            Formation energy **per atom** from the elemental references.
+        """
+        return self.get_form_energy(entry) / entry.composition.num_atoms
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        symbols = [el.symbol for el in self.elements]
+        output = [
+            "{} patched phase diagram with {} sub phase diagrams".format(
+                "-".join(symbols), len(self.pds)
+            ),
+            "{} stable phases: ".format(len(self.stable_entries)),
+            ", ".join([entry.name for entry in self.stable_entries]),
+        ]
+        return "\n".join(output)
+
+    def as_dict(self):
+        """
+        :return: MSONAble dict
+        """
+        return {
+            "@module": self.__class__.__module__,
+            "@class": self.__class__.__name__,
+            "all_entries": [e.as_dict() for e in self.all_entries],
+            "elements": [e.as_dict() for e in self.elements],
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        """
+        :param d: Dict representation
+        :return: PatchedPhaseDiagram
+        """
+        entries = [MontyDecoder().process_decoded(dd) for dd in d["all_entries"]]
+        elements = [Element.from_dict(dd) for dd in d["elements"]]
+        return cls(entries, elements)
+
+    def get_decomposition(self, comp):
+        """
+        Provides the decomposition at a particular composition.
+
+        Args:
+            comp: A composition
+
+        Returns:
+            Decomposition as a dict of {Entry: amount}
+        """
+        return self._get_pd(comp).get_decomposition(comp)
+
+    def get_hull_energy(self, comp):
+        """
+        Args:
+            comp (Composition): Input composition
+
+        Returns:
+            Energy of lowest energy equilibrium at desired composition. Not
+            normalized by atoms, i.e. E(Li4O2) = 2 * E(Li2O)
+        """
+        return self._get_pd(comp).get_hull_energy(comp)
+
+    def get_decomps_and_hull_energies(self, compositions, chunk_size=1000):
+        """
+        Batch version of get_decomposition and get_hull_energy. Compositions
+        are grouped by chemical system and passed to the batch method of the
+        corresponding sub phase diagram.
+
+        Args:
+            compositions: Sequence of Compositions, or a (n, len(elements))
+                array of amounts of the elements of the phase diagram (in the
+                order of self.elements).
+            chunk_size (int): Number of compositions processed at once by the
+                sub phase diagrams.
+
+        Returns:
+            (decompositions, hull energies) as a list of dicts of
+            {Entry: amount} and an array of energies **per atom**.
+        """
+        amounts = _get_amounts(compositions, self.elements)
+        groups = collections.defaultdict(list)
+        for i, row in enumerate(amounts):
+            space = frozenset(el for el, amt in zip(self.elements, row) if amt > 0)
+            groups[space].append(i)
+
+        decomps = [None] * len(amounts)
+        hull_energies = np.zeros(len(amounts))
+        for space, inds in groups.items():
+            pd = self._get_space_pd(space)
+            cols = [self.elements.index(el) for el in pd.elements]
+            pd_decomps, pd_energies = pd.get_decomps_and_hull_energies(
+                amounts[inds][:, cols], chunk_size=chunk_size
+            )
+            hull_energies[inds] = pd_energies
+            for i, decomp in zip(inds, pd_decomps):
+                decomps[i] = decomp
+        return decomps, hull_energies
+
+    def get_decomps_and_e_above_hulls(self, entries, allow_negative=False):
+        """
+        Batch version of get_decomp_and_e_above_hull, which is much faster
+        when screening many entries.
+
+        Args:
+            entries: Sequence of PDEntry like objects
+            allow_negative: Whether to allow negative e_above_hulls. Defaults
+                to False.
+
+        Returns:
+            (decomps, energies above convex hull) as a list of dicts of
+            {Entry: amount} and an array.
+        """
+        entries = list(entries)
+        decomps, hull_energies = self.get_decomps_and_hull_energies(
+            [e.composition for e in entries]
+        )
+        ehulls = np.array([e.energy_per_atom for e in entries]) - hull_energies
+        for i, entry in enumerate(entries):
+            if entry in self.stable_entries:
+                decomps[i], ehulls[i] = {entry: 1}, 0
+        if not allow_negative and np.any(ehulls < -PhaseDiagram.numerical_tol):
+            raise ValueError("No valid decomp found!")
+        return decomps, ehulls
+
+    def get_decomp_and_e_above_hull(self, entry, allow_negative=False):
+        """
+        Provides the decomposition and energy above convex hull for an entry.
+
+        Args:
+            entry: A PDEntry like object
+            allow_negative: Whether to allow negative e_above_hulls. Used to
+                calculate equilibrium reaction energies. Defaults to False.
+
+        Returns:
+            (decomp, energy above convex hull)  Stable entries should have
+            energy above hull of 0. The decomposition is provided as a dict of
+            {Entry: amount}.
+        """
+        return self._get_pd(entry.composition).get_decomp_and_e_above_hull(
+            entry, allow_negative=allow_negative
+        )
+
+    def get_e_above_hull(self, entry):
+        """
+        Provides the energy above convex hull for an entry
+
+        Args:
+            entry: A PDEntry like object
+
+        Returns:
+            Energy above convex hull of entry. Stable entries should have
+            energy above hull of 0.
+        """
+        return self.get_decomp_and_e_above_hull(entry)[1]
+
+    def get_equilibrium_reaction_energy(self, entry):
+        """
+        Provides the reaction energy of a stable entry from the neighboring
+        equilibrium stable entries (also known as the inverse distance to
+        hull).
+
+        Args:
+            entry: A PDEntry like object
+
+        Returns:
+            Equilibrium reaction energy of entry. Stable entries should have
+            equilibrium reaction energy <= 0.
+        """
+        if entry not in self.stable_entries:
+            raise ValueError(
+                "Equilibrium reaction energy is available only " "for stable entries."
+            )
+        return self._get_pd(entry.composition).get_equilibrium_reaction_energy(entry)
+
+
+def _get_amounts(compositions, elements):
+    """
+    Converts a sequence of Compositions to a (n, len(elements)) array of the
+    amounts of the elements of a phase diagram. Arrays are returned as is.
+    """
+    if len(compositions) and isinstance(compositions[0], Composition):
+        for comp in compositions:
+            if set(comp.elements).difference(elements):
+                raise ValueError(
+                    "{} has elements not in the phase diagram {}"
+                    "".format(comp, elements)
+                )
+        compositions = [[comp[el] for el in elements] for comp in compositions]
+    return np.array(compositions, dtype=float).reshape(-1, len(elements))
+
+
+def _get_sub_phase_diagram(entries, elements):
+    """
+    Builds a PhaseDiagram in a worker process of PatchedPhaseDiagram.
+
+    Returns:
+        (PhaseDiagram, indices of its all_entries in entries)
+    """
+    pd = PhaseDiagram(entries, elements)
+    index = {id(e): i for i, e in enumerate(entries)}
+    return pd, [index[id(e)] for e in pd.all_entries]
+
+
+def _restore_pd_entries(pd, entries, inds):
+    """
+    Replaces the (unpickled) copies of the entries in a PhaseDiagram returned
+    by _get_sub_phase_diagram by the original entries.
+    """
+    originals = {id(copy): entries[i] for copy, i in zip(pd.all_entries, inds)}
+    pd.all_entries = [originals[id(e)] for e in pd.all_entries]
+    pd.qhull_entries = [originals[id(e)] for e in pd.qhull_entries]
+    pd.el_refs = {el: originals[id(e)] for el, e in pd.el_refs.items()}
+    pd._stable_entries = set(originals[id(e)] for e in pd._stable_entries)
+    return pd
+
+
 class ReactionDiagram:
     """
     Analyzes the possible reactions between a pair of compounds, e.g.,
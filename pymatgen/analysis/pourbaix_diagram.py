@@ -533,6 +533,8 @@ class PourbaixDiagram(MSONable):
 
         self._stable_domains, self._stable_domain_vertices = \
             self.get_pourbaix_domains(self._processed_entries)
+        self._stable_entry_terms = None
+        self._lookup_grid = None
 
     def _convert_entries_to_points(self, pourbaix_entries):
         """
@@ -843,6 +845,92 @@ class PourbaixDiagram(MSONable):
 
         return pourbaix_domains, pourbaix_domain_vertices
 
+    def _get_stable_entry_terms(self):
+        """
+        Returns:
+            (energy, npH, nPhi, normalization_factor) arrays of the stable
+            entries, used to evaluate normalized_energy_at_conditions for
+            many entries at once with the same floating point operations.
+        """
+        if self._stable_entry_terms is None:
+            self._stable_entry_terms = tuple(
+                np.array([getattr(e, attr) for e in self.stable_entries])
+                for attr in ["energy", "npH", "nPhi", "normalization_factor"])
+        return self._stable_entry_terms
+
+    def build_lookup_grid(self, limits=None, resolution=0.05):
+        """
+        Rasterizes the Pourbaix domains into a lookup grid, after which the
+        stable entries at pH, V conditions within the limits are found by
+        table lookup in get_stable_entry_indices, find_stable_entry,
+        get_stable_entry, get_hull_energy and get_decomposition_energy.
+
+        Since the domains are convex, a grid cell whose four corners are in
+        the domain of the same entry lies entirely in that domain. Only the
+        conditions in cells crossed by a domain boundary are evaluated
+        against all the stable entries, so the lookup is exact.
+
+        Args:
+            limits ([[float]]): pH and V limits of the grid. Defaults to
+                [[-2, 16], [-4, 4]].
+            resolution (float or (float, float)): Size of the grid cells in
+                pH and V units. Defaults to 0.05.
+        """
+        if limits is None:
+            limits = [[-2, 16], [-4, 4]]
+        dpH, dV = np.broadcast_to(resolution, 2).astype(float)
+        npH = max(int(np.ceil((limits[0][1] - limits[0][0]) / dpH)), 1)
+        nV = max(int(np.ceil((limits[1][1] - limits[1][0]) / dV)), 1)
+        pH_edges = limits[0][0] + dpH * np.arange(npH + 1)
+        V_edges = limits[1][0] + dV * np.arange(nV + 1)
+
+        self._lookup_grid = None
+        c = self.get_stable_entry_indices(*np.meshgrid(pH_edges, V_edges, indexing="ij"))
+        same = (c[:-1, :-1] == c[1:, :-1]) & (c[:-1, :-1] == c[:-1, 1:]) & \
+            (c[:-1, :-1] == c[1:, 1:])
+        table = np.where(same, c[:-1, :-1], -1)
+        self._lookup_grid = (limits[0][0], limits[1][0], dpH, dV, table)
+
+    def get_stable_entry_indices(self, pH, V):
+        """
+        Gets the indices of the stable entries at pH, V conditions,
+        supports vectorized inputs for pH and V. If build_lookup_grid was
+        called, conditions within the grid are answered by table lookup.
+
+        Args:
+            pH (float or [float]): pH at which to find the stable entries
+            V (float or [float]): V at which to find the stable entries
+
+        Returns:
+            (int or [int]) indices in stable_entries of the stable entries
+            at the conditions.
+        """
+        pH, V = np.broadcast_arrays(np.asarray(pH, dtype=float),
+                                    np.asarray(V, dtype=float))
+        indices = np.full(pH.shape, -1, dtype=int)
+        if self._lookup_grid is not None:
+            pH_min, V_min, dpH, dV, table = self._lookup_grid
+            i = np.floor((pH - pH_min) / dpH).astype(int)
+            j = np.floor((V - V_min) / dV).astype(int)
+            inside = (i >= 0) & (i < table.shape[0]) & (j >= 0) & (j < table.shape[1])
+            indices[inside] = table[i[inside], j[inside]]
+
+        todo = np.nonzero(indices.ravel() < 0)[0]
+        if len(todo) > 0:
+            energy, npH, nPhi, normalization_factor = \
+                (terms[:, None] for terms in self._get_stable_entry_terms())
+            flat_indices = indices.ravel()
+            flat_pH, flat_V = pH.ravel(), V.ravel()
+            # Evaluate in chunks to bound the size of the energy array.
+            chunk_size = max(1, 10 ** 6 // len(self.stable_entries))
+            for start in range(0, len(todo), chunk_size):
+                inds = todo[start:start + chunk_size]
+                energies = (energy + npH * PREFAC * flat_pH[inds] + nPhi * flat_V[inds]) \
+                    * normalization_factor
+                flat_indices[inds] = np.argmin(energies, axis=0)
+            indices = flat_indices.reshape(pH.shape)
+        return int(indices) if indices.ndim == 0 else indices
+
     def find_stable_entry(self, pH, V):
         """
         Finds stable entry at a pH,V condition
@@ -853,9 +941,7 @@ class PourbaixDiagram(MSONable):
         Returns:
 
         """
-        energies_at_conditions = [e.normalized_energy_at_conditions(pH, V)
-                                  for e in self.stable_entries]
-        return self.stable_entries[np.argmin(energies_at_conditions)]
+        return self.get_stable_entry(pH, V)
 
     def get_decomposition_energy(self, entry, pH, V):
         """
@@ -903,18 +989,21 @@ class PourbaixDiagram(MSONable):
             (float or [float]) minimum pourbaix energy at conditions
 
         """
-        all_gs = np.array([e.normalized_energy_at_conditions(
-            pH, V) for e in self.stable_entries])
-        base = np.min(all_gs, axis=0)
-        return base
+        indices = self.get_stable_entry_indices(pH, V)
+        energy, npH, nPhi, normalization_factor = \
+            (terms[indices] for terms in self._get_stable_entry_terms())
+        # Same expression as PourbaixEntry.normalized_energy_at_conditions,
+        # so that the hull energy of a stable entry is exactly its energy.
+        return (energy + npH * PREFAC * pH + nPhi * V) * normalization_factor
 
     def get_stable_entry(self, pH, V):
         """
-        Gets the stable entry at a given pH, V condition
+        Gets the stable entry at a given pH, V condition. If pH or V are
+        arrays, returns an object array of the stable entries.
 
         Args:
-            pH (float): pH at a given condition
-            V (float): V at a given condition
+            pH (float or [float]): pH at a given condition
+            V (float or [float]): V at a given condition
 
         Returns:
             (PourbaixEntry or MultiEntry): pourbaix or multi-entry
@@ -922,9 +1011,12 @@ class PourbaixDiagram(MSONable):
                 pH, V condition
 
         """
-        all_gs = np.array([e.normalized_energy_at_conditions(
-            pH, V) for e in self.stable_entries])
-        return self.stable_entries[np.argmin(all_gs)]
+        indices = self.get_stable_entry_indices(pH, V)
+        if isinstance(indices, int):
+            return self.stable_entries[indices]
+        entries = np.empty(len(self.stable_entries), dtype=object)
+        entries[:] = self.stable_entries
+        return entries[indices]
 
     @property
     def stable_entries(self):
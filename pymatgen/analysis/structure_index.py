@@ -0,0 +1,231 @@
+# coding: utf-8
+# Copyright (c) Pymatgen Development Team.
+# Distributed under the terms of the MIT License.
+
+"""
+This module provides a persistent, on-disk index of structures that is used to
+quickly find the few stored structures that may match a new structure, i.e.,
+to answer "have we seen this structure before" against large databases
+without calling StructureMatcher.fit on every stored structure.
+"""
+
+import json
+import sqlite3
+from functools import partial
+from multiprocessing import Pool
+
+from monty.json import MontyEncoder
+
+from pymatgen.core.structure import Structure
+from pymatgen.analysis.structure_matcher import StructureMatcher
+
+__author__ = "Pymatgen Development Team"
+__date__ = "Oct 16, 2026"
+
+
+def _get_fingerprint(structure, matcher, spacegroup_symprec):
+    """
+    Computes the fingerprint of a structure, i.e., the hash of its composition
+    using the comparator of the matcher, its reduced formula, the number of
+    sites and space group of its reduced cell, its volume per atom and the
+    sorted lengths of its Niggli-reduced lattice. If the matcher scales
+    structures to the same volume, the lengths are normalized by the free
+    length per atom.
+    """
+    s = matcher._process_species([structure])[0]
+    comp_hash = str(matcher._comparator.get_hash(s.composition))
+    formula = s.composition.reduced_formula
+    reduced = matcher._reduce(s)
+    vpa = reduced.volume / len(reduced)
+    lengths = sorted(reduced.lattice.get_niggli_reduced_lattice().abc)
+    if matcher._scale:
+        lengths = [l / vpa ** (1 / 3) for l in lengths]
+    spacegroup = None
+    if spacegroup_symprec is not None:
+        spacegroup = reduced.get_space_group_info(symprec=spacegroup_symprec)[1]
+    return (comp_hash, formula, spacegroup, len(reduced), vpa) + tuple(lengths)
+
+
+class StructureIndex:
+    """
+    Persistent index of structures stored in a sqlite database.
+
+    For each structure, the index stores a fingerprint built with the
+    comparator and the reduction (Niggli and primitive cell) of a
+    StructureMatcher: the composition hash and reduced formula, the number of
+    sites and space group of the reduced cell, the volume per atom and the
+    sorted lengths of the reduced lattice. get_candidates only returns stored
+    structures with the same composition hash, number of sites (unless
+    attempt_supercell is set) and space group, and lattice lengths within
+    ltol, so only those need to be compared with fit. Structures can be added
+    incrementally, and the index can be reopened later from the same file.
+
+    The space group and lattice length prefilters are heuristics: fit can
+    match structures whose space groups differ at a given symprec, or whose
+    Niggli-reduced lattices lie on either side of a reduction boundary. Set
+    spacegroup_symprec to None and lattice_prefilter to False to only use the
+    composition and number of sites, which never exclude a match.
+    """
+
+    def __init__(self, filename, matcher=None, spacegroup_symprec=0.1,
+                 lattice_prefilter=True):
+        """
+        Args:
+            filename (str): Path to the sqlite database. It is created if it
+                does not exist. Use ":memory:" for an index that is not
+                persisted.
+            matcher (StructureMatcher): Matcher used to compute the
+                fingerprints and to fit candidates. Defaults to
+                StructureMatcher() with default parameters. When reopening an
+                existing index, it must be the same as the one used to create
+                it.
+            spacegroup_symprec (float): symprec used to determine the space
+                group of the reduced cells. Defaults to 0.1. Set to None to not
+                use the space group as prefilter.
+            lattice_prefilter (bool): Whether get_candidates only returns
+                structures whose reduced lattice lengths are within ltol of
+                the ones of the structure. Only used when the matcher does
+                not attempt supercells and ltol < 1. Defaults to True.
+        """
+        self.matcher = matcher or StructureMatcher()
+        if self.matcher._subset:
+            raise ValueError("StructureIndex cannot be used with allow_subset.")
+        self.spacegroup_symprec = spacegroup_symprec
+        self.lattice_prefilter = lattice_prefilter
+        self.filename = filename
+        self._conn = sqlite3.connect(filename)
+
+        settings = json.dumps({"matcher": self.matcher.as_dict(),
+                               "spacegroup_symprec": spacegroup_symprec},
+                              sort_keys=True, cls=MontyEncoder)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS settings (settings TEXT)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS structures (key TEXT PRIMARY KEY, "
+                "comp_hash TEXT, formula TEXT, spacegroup INTEGER, "
+                "nsites INTEGER, vpa REAL, l0 REAL, l1 REAL, l2 REAL, "
+                "structure TEXT)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS fingerprint ON structures "
+                "(comp_hash, nsites, spacegroup)")
+            row = self._conn.execute("SELECT settings FROM settings").fetchone()
+            if row is None:
+                self._conn.execute("INSERT INTO settings VALUES (?)", (settings,))
+            elif row[0] != settings:
+                raise ValueError("The index in {} was created with different "
+                                 "matcher settings.".format(filename))
+
+    def _fingerprint(self, structure):
+        return _get_fingerprint(structure, self.matcher, self.spacegroup_symprec)
+
+    def add(self, key, structure):
+        """
+        Adds a structure to the index. An existing structure with the same key
+        is replaced.
+
+        Args:
+            key (str): Key of the structure, e.g., a database id.
+            structure (Structure): Structure to add.
+        """
+        self.add_structures({key: structure})
+
+    def add_structures(self, structures, nproc=None):
+        """
+        Adds structures to the index in a single transaction. Existing
+        structures with the same keys are replaced.
+
+        Args:
+            structures (dict): {key: structure} of structures to add.
+            nproc (int): Number of processes used to compute the
+                fingerprints. Defaults to None, i.e., no parallelization.
+        """
+        keys = list(structures.keys())
+        values = [structures[k] for k in keys]
+        f = partial(_get_fingerprint, matcher=self.matcher,
+                    spacegroup_symprec=self.spacegroup_symprec)
+        if nproc is not None:
+            with Pool(nproc) as p:
+                fingerprints = p.map(f, values)
+        else:
+            fingerprints = [f(s) for s in values]
+        rows = [(str(k),) + fp + (json.dumps(s.as_dict(), cls=MontyEncoder),)
+                for k, fp, s in zip(keys, fingerprints, values)]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO structures VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def get_candidates(self, structure):
+        """
+        Finds the stored structures that may match a structure.
+
+        Args:
+            structure (Structure): Structure to look up.
+
+        Returns:
+            List of keys of the candidate structures.
+        """
+        comp_hash, _, spacegroup, nsites, _, *lengths = self._fingerprint(structure)
+        query = "SELECT key FROM structures WHERE comp_hash = ?"
+        params = [comp_hash]
+        if not self.matcher._supercell:
+            query += " AND nsites = ?"
+            params.append(nsites)
+            if self.lattice_prefilter and self.matcher.ltol < 1:
+                # Superset of the lengths within ltol of either lattice.
+                for i, l in enumerate(lengths):
+                    query += " AND l{0} BETWEEN ? AND ?".format(i)
+                    params.extend([l * (1 - self.matcher.ltol),
+                                   l / (1 - self.matcher.ltol)])
+        if spacegroup is not None:
+            query += " AND spacegroup = ?"
+            params.append(spacegroup)
+        return [row[0] for row in self._conn.execute(query, params)]
+
+    def get_matches(self, structure):
+        """
+        Finds the stored structures that match a structure, by calling fit
+        on the candidates returned by get_candidates.
+
+        Args:
+            structure (Structure): Structure to look up.
+
+        Returns:
+            List of keys of the matching structures.
+        """
+        return [k for k in self.get_candidates(structure)
+                if self.matcher.fit(structure, self.get_structure(k))]
+
+    def get_structure(self, key):
+        """
+        Args:
+            key (str): Key of a stored structure.
+
+        Returns:
+            The stored Structure.
+        """
+        row = self._conn.execute("SELECT structure FROM structures WHERE key = ?",
+                                 (str(key),)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return Structure.from_dict(json.loads(row[0]))
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self._conn.close()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM structures").fetchone()[0]
+
+    def __contains__(self, key):
+        return self._conn.execute("SELECT 1 FROM structures WHERE key = ?",
+                                  (str(key),)).fetchone() is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
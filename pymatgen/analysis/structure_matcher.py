@@ -8,6 +8,10 @@ This module provides classes to perform fitting of structures.
 
 import itertools
 import abc
+import collections
+from functools import partial
+from multiprocessing import Pool
+from typing import Dict, List
 
 import numpy as np
 
@@ -423,7 +427,8 @@ class StructureMatcher(MSONable):
 
         return int(round(fu)), True
 
-    def _get_lattices(self, target_lattice, s, supercell_size=1):
+    def _get_lattices(self, target_lattice, s, supercell_size=1,
+                      sort_by_distortion=False):
         """
         Yields lattices for s with lengths and angles close to the
         lattice of target_s. If supercell_size is specified, the
@@ -432,20 +437,24 @@ class StructureMatcher(MSONable):
 
         Args:
             s, target_s: Structure objects
+            sort_by_distortion (bool): Whether to yield the least distorted
+                lattices first.
         """
         lattices = s.lattice.find_all_mappings(
             target_lattice, ltol=self.ltol, atol=self.angle_tol,
-            skip_rotation_matrix=True)
+            skip_rotation_matrix=True, sort_by_distortion=sort_by_distortion)
         for l, _, scale_m in lattices:
             if abs(abs(np.linalg.det(scale_m)) - supercell_size) < 0.5:
                 yield l, scale_m
 
-    def _get_supercells(self, struct1, struct2, fu, s1_supercell):
+    def _get_supercells(self, struct1, struct2, fu, s1_supercell,
+                        sort_by_distortion=False):
         """
         Computes all supercells of one structure close to the lattice of the
         other
         if s1_supercell == True, it makes the supercells of struct1, otherwise
-        it makes them of s2
+        it makes them of s2. If sort_by_distortion == True, the least
+        distorted supercells are yielded first
 
         yields: s1, s2, supercell_matrix, average_lattice, supercell_matrix
         """
@@ -459,13 +468,15 @@ class StructureMatcher(MSONable):
             s2_fc = np.array(s2.frac_coords)
             if fu == 1:
                 cc = np.array(s1.cart_coords)
-                for l, sc_m in self._get_lattices(s2.lattice, s1, fu):
+                for l, sc_m in self._get_lattices(s2.lattice, s1, fu,
+                                                  sort_by_distortion):
                     fc = l.get_fractional_coords(cc)
                     fc -= np.floor(fc)
                     yield fc, s2_fc, av_lat(l, s2.lattice), sc_m
             else:
                 fc_init = np.array(s1.frac_coords)
-                for l, sc_m in self._get_lattices(s2.lattice, s1, fu):
+                for l, sc_m in self._get_lattices(s2.lattice, s1, fu,
+                                                  sort_by_distortion):
                     fc = np.dot(fc_init, np.linalg.inv(sc_m))
                     lp = lattice_points_in_supercell(sc_m)
                     fc = (fc[:, None, :] + lp[None, :, :]).reshape((-1, 3))
@@ -651,18 +662,30 @@ class StructureMatcher(MSONable):
         and finds fu, the supercell size to make struct1 comparable to
         s2
         """
-        struct1 = struct1.copy()
-        struct2 = struct2.copy()
+        struct1 = self._reduce(struct1, niggli)
+        struct2 = self._reduce(struct2, niggli)
+        return self._scale_reduced(struct1, struct2)
 
+    def _reduce(self, struct, niggli=True):
+        """
+        Returns the reduced (niggli and primitive) structure used for
+        matching. This only depends on the structure itself, so it can be
+        computed once per structure when many pairs are compared.
+        """
+        struct = struct.copy()
         if niggli:
-            struct1 = struct1.get_reduced_structure(reduction_algo="niggli")
-            struct2 = struct2.get_reduced_structure(reduction_algo="niggli")
+            struct = struct.get_reduced_structure(reduction_algo="niggli")
 
         # primitive cell transformation
         if self._primitive_cell:
-            struct1 = struct1.get_primitive_structure()
-            struct2 = struct2.get_primitive_structure()
+            struct = struct.get_primitive_structure()
+        return struct
 
+    def _scale_reduced(self, struct1, struct2):
+        """
+        Finds fu, the supercell size to make struct1 comparable to struct2,
+        and rescales the lattices of two reduced structures in place.
+        """
         if self._supercell:
             fu, s1_supercell = self._get_supercell_size(struct1, struct2)
         else:
@@ -727,7 +750,11 @@ class StructureMatcher(MSONable):
 
         best_match = None
         # loop over all lattices
-        for s1fc, s2fc, avg_l, sc_m in self._get_supercells(struct1, struct2, fu, s1_supercell):
+        # When stopping at the first match, the least distorted supercells
+        # are the most likely to match and are tried first.
+        for s1fc, s2fc, avg_l, sc_m in self._get_supercells(
+                struct1, struct2, fu, s1_supercell,
+                sort_by_distortion=break_on_match):
             # compute fractional tolerance
             normalization = (len(s1fc) / avg_l.volume) ** (1 / 3)
             inv_abc = np.array(avg_l.reciprocal_lattice.abc)
@@ -758,14 +785,70 @@ class StructureMatcher(MSONable):
 
         return None
 
-    def group_structures(self, s_list, anonymous=False):
+    def _fit_reduced(self, struct1, struct2, anonymous=False):
+        """
+        Equivalent of fit (or fit_anonymous) for structures that have
+        already been processed and reduced with _process_species and _reduce.
+        """
+        struct1, struct2, fu, s1_supercell = self._scale_reduced(
+            struct1.copy(), struct2.copy())
+        if anonymous:
+            return bool(self._anonymous_match(struct1, struct2, fu, s1_supercell,
+                                              break_on_match=True, single_match=True))
+        match = self._match(struct1, struct2, fu, s1_supercell,
+                            break_on_match=True)
+        return match is not None and match[0] <= self.stol
+
+    def _group_reduced(self, structures, anonymous=False):
+        """
+        Greedily groups reduced structures, in order, by matching the first
+        unmatched structure against all remaining ones.
+
+        Returns:
+            List of lists of indices into structures.
+        """
+        unmatched = list(range(len(structures)))
+        groups = []
+        while len(unmatched) > 0:
+            i = unmatched.pop(0)
+            inds = [j for j in unmatched
+                    if self._fit_reduced(structures[i], structures[j], anonymous)]
+            groups.append([i] + inds)
+            unmatched = [j for j in unmatched if j not in inds]
+        return groups
+
+    def _reduce_with_spacegroup(self, struct, symprec=None):
+        reduced = self._reduce(struct)
+        if symprec is None:
+            return reduced, None
+        return reduced, reduced.get_space_group_info(symprec=symprec)[1]
+
+    def group_structures(self, s_list, anonymous=False, nproc=None,
+                         spacegroup_symprec=None):
         """
         Given a list of structures, use fit to group
         them by structural equality.
 
+        Structures are first bucketed by composition hash and, unless
+        attempt_supercell is set, by the number of sites in their reduced
+        cells (structures with different numbers of sites can never match).
+        The niggli and primitive reduction of each structure is computed only
+        once, and the buckets can be matched in parallel. None of this changes
+        the result compared to calling fit on all pairs.
+
         Args:
             s_list ([Structure]): List of structures to be grouped
             anonymous (bool): Whether to use anonymous mode.
+            nproc (int): Number of processes used to reduce the structures
+                and to match the buckets. Defaults to None, i.e., no
+                parallelization.
+            spacegroup_symprec (float): If set, structures are also bucketed
+                by the space group of their reduced cells, determined with
+                this symprec. This avoids most of the fits for large sets of
+                candidates, but unlike the other prefilters it is a
+                heuristic: fit can match structures whose space groups differ
+                at a given symprec, and such structures end up in different
+                groups. Defaults to None, i.e., no space group prefilter.
 
         Returns:
             A list of lists of matched structures
@@ -786,31 +869,42 @@ class StructureMatcher(MSONable):
         else:
             c_hash = self._comparator.get_hash
 
-        def s_hash(s):
-            return c_hash(s[1].composition)
-
-        sorted_s_list = sorted(enumerate(s_list), key=s_hash)
-        all_groups = []
-
-        # For each pre-grouped list of structures, perform actual matching.
-        for k, g in itertools.groupby(sorted_s_list, key=s_hash):
-            unmatched = list(g)
-            while len(unmatched) > 0:
-                i, refs = unmatched.pop(0)
-                matches = [i]
-                if anonymous:
-                    inds = filter(lambda i: self.fit_anonymous(refs,
-                                                               unmatched[i][1]), list(range(len(unmatched))))
-                else:
-                    inds = filter(lambda i: self.fit(refs, unmatched[i][1]),
-                                  list(range(len(unmatched))))
-                inds = list(inds)
-                matches.extend([unmatched[i][0] for i in inds])
-                unmatched = [unmatched[i] for i in range(len(unmatched))
-                             if i not in inds]
-                all_groups.append([original_s_list[i] for i in matches])
-
-        return all_groups
+        comp_hashes = [c_hash(s.composition) for s in s_list]
+        sorted_inds = sorted(range(len(s_list)), key=lambda i: comp_hashes[i])
+
+        f = partial(self._reduce_with_spacegroup, symprec=spacegroup_symprec)
+        if nproc is not None:
+            with Pool(nproc) as p:
+                reduced = p.map(f, s_list)
+        else:
+            reduced = [f(s) for s in s_list]
+
+        # Within a composition bucket, structures with a different number of
+        # reduced sites (or space group) never match, so the greedy grouping
+        # can be done independently on each sub-bucket.
+        buckets = collections.OrderedDict()  # type: Dict[tuple, List[int]]
+        for i in sorted_inds:
+            key = (comp_hashes[i],
+                   None if self._supercell else len(reduced[i][0]),
+                   reduced[i][1])
+            buckets.setdefault(key, []).append(i)
+
+        bucket_structures = [[reduced[i][0] for i in inds] for inds in buckets.values()]
+        f = partial(self._group_reduced, anonymous=anonymous)
+        if nproc is not None:
+            with Pool(nproc) as p:
+                bucket_groups = p.map(f, bucket_structures)
+        else:
+            bucket_groups = [f(structures) for structures in bucket_structures]
+
+        # Restore the order of the groups found by matching the composition
+        # buckets directly, i.e., by position of their first structure.
+        position = {i: pos for pos, i in enumerate(sorted_inds)}
+        groups = [[inds[j] for j in g]
+                  for inds, groups in zip(buckets.values(), bucket_groups)
+                  for g in groups]
+        groups.sort(key=lambda g: position[g[0]])
+        return [[original_s_list[i] for i in g] for g in groups]
 
     def as_dict(self):
         """
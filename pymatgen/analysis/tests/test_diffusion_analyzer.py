@@ -177,6 +177,30 @@ class DiffusionAnalyzerTest(PymatgenTest):
             self.assertArrayAlmostEqual(data[:, -1], d.mscd)
             os.remove("test.csv")
 
+    def test_fft(self):
+        with open(os.path.join(test_dir, "DiffusionAnalyzer.json")) as f:
+            dd = json.load(f)
+        d = DiffusionAnalyzer.from_dict(dd)
+        for chunk_size in [None, 7]:
+            d2 = DiffusionAnalyzer(d.structure, d.disp, d.specie,
+                                   d.temperature, d.time_step, d.step_skip,
+                                   use_fft=True, chunk_size=chunk_size)
+            self.assertAlmostEqual(d2.conductivity, d.conductivity, 4)
+            self.assertAlmostEqual(d2.chg_conductivity, d.chg_conductivity, 4)
+            self.assertAlmostEqual(d2.diffusivity, d.diffusivity, 7)
+            self.assertAlmostEqual(d2.chg_diffusivity, d.chg_diffusivity, 7)
+            self.assertArrayAlmostEqual(d2.msd, d.msd)
+            self.assertArrayAlmostEqual(d2.mscd, d.mscd)
+            self.assertArrayAlmostEqual(d2.msd_components, d.msd_components)
+            self.assertArrayAlmostEqual(d2.sq_disp_ions, d.sq_disp_ions)
+            self.assertArrayAlmostEqual(d2.max_ion_displacements,
+                                        d.max_ion_displacements)
+            self.assertArrayAlmostEqual(d2.corrected_displacements,
+                                        d.corrected_displacements)
+        d3 = DiffusionAnalyzer.from_dict(d2.as_dict())
+        self.assertTrue(d3.use_fft)
+        self.assertEqual(d3.chunk_size, 7)
+
     def test_init_npt(self):
         # Diffusion vasprun.xmls are rather large. We are only going to use a
         # very small preprocessed run for testing. Note that the results are
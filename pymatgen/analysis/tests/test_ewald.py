@@ -64,6 +64,31 @@ class EwaldSummationTest(unittest.TestCase):
         ham2 = EwaldSummation(self.original_s)
         self.assertAlmostEqual(ham2.real_space_energy, -502.23549897772602, 4)
 
+    def test_chunk_size(self):
+        ham = EwaldSummation(self.s, compute_forces=True)
+        ham2 = EwaldSummation(self.s, compute_forces=True, chunk_size=5)
+        self.assertTrue(np.allclose(ham.real_space_energy_matrix,
+                                    ham2.real_space_energy_matrix))
+        self.assertTrue(np.allclose(ham.forces, ham2.forces))
+        self.assertAlmostEqual(ham2.real_space_energy, -502.23549897772602, 4)
+
+    def test_compute_sub_structures(self):
+        ham = EwaldSummation(self.s)
+        subs = []
+        partial_energies = []
+        for removed in [[0], [0, 1], [2, 5, 7]]:
+            sub = self.s.copy()
+            sub.remove_sites(removed)
+            subs.append(sub)
+            partial_energies.append(ham.compute_partial_energy(removed))
+            self.assertAlmostEqual(ham.compute_sub_structure(sub),
+                                   partial_energies[-1], 6)
+        self.assertTrue(np.allclose(ham.compute_sub_structures(subs),
+                                    partial_energies))
+        sub = self.s.copy()
+        sub.translate_sites([0], [0.1, 0, 0])
+        self.assertRaises(ValueError, ham.compute_sub_structure, sub)
+
     def test_from_dict(self):
         ham = EwaldSummation(self.s, compute_forces=True)
         ham2 = EwaldSummation.from_dict(ham.as_dict())
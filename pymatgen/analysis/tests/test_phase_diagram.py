@@ -355,6 +355,33 @@ class PhaseDiagramTest(unittest.TestCase):
         decomp, e = pd.get_decomp_and_e_above_hull(PDEntry("H", 1))
         self.assertAlmostEqual(e, 1)
         self.assertAlmostEqual(decomp[entry], 1.0)
+        decomps, e = pd.get_decomps_and_e_above_hulls([PDEntry("H", 1)])
+        self.assertAlmostEqual(e[0], 1)
+        self.assertAlmostEqual(decomps[0][entry], 1.0)
+
+    def test_get_decomps_and_e_above_hulls(self):
+        entries = list(self.pd.all_entries)
+        decomps, ehulls = self.pd.get_decomps_and_e_above_hulls(entries)
+        for entry, decomp, ehull in zip(entries, decomps, ehulls):
+            ref_decomp, ref_ehull = self.pd.get_decomp_and_e_above_hull(entry)
+            self.assertAlmostEqual(ehull, ref_ehull)
+            self.assertEqual(decomp.keys(), ref_decomp.keys())
+            for k, v in decomp.items():
+                self.assertAlmostEqual(v, ref_decomp[k])
+
+        comps = [Composition("Li3Fe7O11"), Composition("LiFeO2"), Composition("Li")]
+        decomps, energies = self.pd.get_decomps_and_hull_energies(comps, chunk_size=2)
+        for comp, decomp, energy in zip(comps, decomps, energies):
+            self.assertAlmostEqual(
+                energy * comp.num_atoms, self.pd.get_hull_energy(comp)
+            )
+            self.assertEqual(decomp.keys(), self.pd.get_decomposition(comp).keys())
+        amounts = [[comp[el] for el in self.pd.elements] for comp in comps]
+        for e1, e2 in zip(self.pd.get_decomps_and_hull_energies(amounts)[1], energies):
+            self.assertAlmostEqual(e1, e2)
+        self.assertRaises(
+            ValueError, self.pd.get_decomps_and_hull_energies, [Composition("Mn")]
+        )
 
     def test_get_critical_compositions_fractional(self):
         c1 = Composition("Fe2O3").fractional_composition
@@ -557,6 +584,67 @@ class CompoundPhaseDiagramTest(unittest.TestCase):
         self.assertIsNotNone(str(self.pd))
 
 
+class PatchedPhaseDiagramTest(unittest.TestCase):
+    def setUp(self):
+        self.entries = list(EntrySet.from_csv(str(module_dir / "pdentries_test.csv")))
+        self.entries += [
+            PDEntry("Mn", -9.0),
+            PDEntry("Mn2O3", -40.0),
+            PDEntry("MnO2", -20.0),
+            PDEntry("LiMn", -12.0),
+            PDEntry("FeMn", -17.0),
+        ]
+        self.pd = PhaseDiagram(self.entries)
+        self.ppd = PatchedPhaseDiagram(self.entries)
+
+    def test_pds(self):
+        self.assertEqual(
+            sorted("-".join(sorted(el.symbol for el in s)) for s in self.ppd.pds),
+            ["Fe-Li-O", "Fe-Mn", "Li-Mn", "Mn-O"],
+        )
+        self.assertEqual(self.ppd.stable_entries, self.pd.stable_entries)
+        self.assertEqual(self.ppd.el_refs, self.pd.el_refs)
+
+    def test_get_e_above_hull(self):
+        for entry in self.entries:
+            self.assertAlmostEqual(
+                self.ppd.get_e_above_hull(entry), self.pd.get_e_above_hull(entry)
+            )
+            decomp = self.ppd.get_decomposition(entry.composition)
+            ref = self.pd.get_decomposition(entry.composition)
+            self.assertEqual(decomp.keys(), ref.keys())
+            for k, v in decomp.items():
+                self.assertAlmostEqual(v, ref[k])
+        for entry in self.ppd.stable_entries:
+            self.assertAlmostEqual(
+                self.ppd.get_equilibrium_reaction_energy(entry),
+                self.pd.get_equilibrium_reaction_energy(entry),
+            )
+        decomps, ehulls = self.ppd.get_decomps_and_e_above_hulls(self.entries)
+        ref = self.pd.get_decomps_and_e_above_hulls(self.entries)
+        for decomp, ref_decomp in zip(decomps, ref[0]):
+            self.assertEqual(decomp.keys(), ref_decomp.keys())
+        for ehull, ref_ehull in zip(ehulls, ref[1]):
+            self.assertAlmostEqual(ehull, ref_ehull)
+
+    def test_get_hull_energy(self):
+        # Li-Mn-O and Li-Fe-Mn are not subsystems of any entry.
+        for comp in ["LiMnO2", "LiFeMn", "Li2FeMnO4"]:
+            comp = Composition(comp)
+            self.assertAlmostEqual(
+                self.ppd.get_hull_energy(comp), self.pd.get_hull_energy(comp)
+            )
+        ppd = PatchedPhaseDiagram(self.entries, nproc=2)
+        self.assertEqual(ppd.stable_entries, self.ppd.stable_entries)
+        for entry in ppd.stable_entries:
+            self.assertTrue(any(entry is e for e in self.entries))
+        for entry in self.entries:
+            self.assertAlmostEqual(
+                ppd.get_e_above_hull(entry), self.pd.get_e_above_hull(entry)
+            )
+        self.assertFalse(hasattr(ppd, "get_composition_chempots"))
+
+
 class ReactionDiagramTest(unittest.TestCase):
     def setUp(self):
         module_dir = os.path.dirname(os.path.abspath(__file__))
@@ -195,6 +195,22 @@ class PourbaixDiagramTest(unittest.TestCase):
         entry = self.pbx.get_stable_entry(0, 0)
         self.assertEqual(entry.entry_id, "ion-0")
 
+    def test_lookup_grid(self):
+        pbx = PourbaixDiagram(self.test_data['Zn'], filter_solids=True)
+        ph, v = np.meshgrid(np.linspace(-3, 17, 101), np.linspace(-5, 5, 103))
+        hull = np.min([[e.normalized_energy_at_conditions(p, u) for e in pbx.stable_entries]
+                       for p, u in zip(ph.ravel(), v.ravel())], axis=1)
+        np.testing.assert_array_almost_equal(pbx.get_hull_energy(ph, v).ravel(), hull)
+        indices = pbx.get_stable_entry_indices(ph, v)
+        self.assertEqual(indices.shape, ph.shape)
+
+        pbx.build_lookup_grid(resolution=0.1)
+        np.testing.assert_array_equal(pbx.get_stable_entry_indices(ph, v), indices)
+        np.testing.assert_array_almost_equal(pbx.get_hull_energy(ph, v).ravel(), hull)
+        self.assertEqual(pbx.find_stable_entry(10, 2).name, "ZnO(s)")
+        entries = pbx.get_stable_entry(ph, v)
+        self.assertEqual(entries[0, 0], pbx.get_stable_entry(ph[0, 0], v[0, 0]))
+
     def test_multielement_parallel(self):
         # Simple test to ensure that multiprocessing is working
         test_entries = self.test_data["Ag-Te-N"]
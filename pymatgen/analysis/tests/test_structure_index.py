@@ -0,0 +1,73 @@
+# coding: utf-8
+# Copyright (c) Pymatgen Development Team.
+# Distributed under the terms of the MIT License.
+
+
+import unittest
+import os
+import json
+
+from monty.json import MontyDecoder
+from monty.tempfile import ScratchDir
+
+from pymatgen.analysis.structure_index import StructureIndex
+from pymatgen.analysis.structure_matcher import StructureMatcher, \
+    ElementComparator
+from pymatgen.util.testing import PymatgenTest
+
+test_dir = os.path.join(os.path.dirname(__file__), "..", "..", "..",
+                        'test_files')
+
+
+class StructureIndexTest(PymatgenTest):
+
+    def setUp(self):
+        with open(os.path.join(test_dir, "TiO2_entries.json"), 'r') as fp:
+            entries = json.load(fp, cls=MontyDecoder)
+        self.structures = {str(i): e.structure for i, e in enumerate(entries)}
+
+    def test_get_candidates(self):
+        sm = StructureMatcher()
+        index = StructureIndex(":memory:", sm, spacegroup_symprec=None)
+        index.add_structures(self.structures)
+        self.assertEqual(len(index), len(self.structures))
+        for k, s in self.structures.items():
+            candidates = index.get_candidates(s)
+            self.assertIn(k, candidates)
+            matches = [k2 for k2, s2 in self.structures.items() if sm.fit(s, s2)]
+            self.assertEqual(sorted(index.get_matches(s)), sorted(matches))
+
+        s = self.structures["0"].copy()
+        s.replace_species({"Ti": "Zr"})
+        self.assertEqual(index.get_candidates(s), [])
+
+        unfiltered = StructureIndex(":memory:", sm, spacegroup_symprec=None,
+                                    lattice_prefilter=False)
+        unfiltered.add_structures(self.structures)
+        for s in self.structures.values():
+            self.assertLessEqual(set(index.get_candidates(s)),
+                                 set(unfiltered.get_candidates(s)))
+
+    def test_persistence(self):
+        with ScratchDir("."):
+            with StructureIndex("index.db") as index:
+                for k, s in list(self.structures.items())[:3]:
+                    index.add(k, s)
+            with StructureIndex("index.db") as index:
+                self.assertEqual(len(index), 3)
+                self.assertIn("0", index)
+                self.assertNotIn("3", index)
+                self.assertIn("0", index.get_matches(self.structures["0"]))
+                self.assertEqual(index.get_structure("1"), self.structures["1"])
+                index.add("3", self.structures["3"])
+                self.assertEqual(len(index), 4)
+                self.assertRaises(KeyError, index.get_structure, "10000")
+            self.assertRaises(ValueError, StructureIndex, "index.db",
+                              StructureMatcher(comparator=ElementComparator()))
+
+        self.assertRaises(ValueError, StructureIndex, ":memory:",
+                          StructureMatcher(allow_subset=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
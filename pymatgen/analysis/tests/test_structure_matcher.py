@@ -317,6 +317,28 @@ class StructureMatcherTest(PymatgenTest):
         out = sm.group_structures(self.struct_list, anonymous=True)
         self.assertEqual(list(map(len, out)), [4, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1])
 
+    def test_group_structures_parallel(self):
+        sm = StructureMatcher()
+        structures = self.struct_list + [s * (1, 1, 2) for s in self.struct_list[:3]]
+        ids = {id(s): i for i, s in enumerate(structures)}
+        serial = [[ids[id(s)] for s in g] for g in sm.group_structures(structures)]
+        # Same groups, in the same order, when matching buckets in parallel.
+        parallel = [[ids[id(s)] for s in g] for g in sm.group_structures(structures, nproc=2)]
+        self.assertEqual(serial, parallel)
+        # Reference implementation calling fit directly.
+        unmatched = sorted(range(len(structures)),
+                           key=lambda i: sm._comparator.get_hash(structures[i].composition))
+        ref = []
+        while unmatched:
+            i = unmatched.pop(0)
+            matches = [j for j in unmatched if sm.fit(structures[i], structures[j])]
+            unmatched = [j for j in unmatched if j not in matches]
+            ref.append([i] + matches)
+        self.assertEqual(ref, serial)
+
+        out = sm.group_structures(self.struct_list, spacegroup_symprec=0.1)
+        self.assertEqual(sum(map(len, out)), len(self.struct_list))
+
     def test_mix(self):
         structures = [self.get_structure("Li2O"),
                       self.get_structure("Li2O2"),
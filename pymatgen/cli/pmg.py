@@ -8,28 +8,47 @@ A master convenience script with many tools for vasp and structure analysis.
 """
 
 import argparse
+import importlib
 import sys
 import itertools
 
 from tabulate import tabulate, tabulate_formats
-from pymatgen import Structure, SETTINGS
-from pymatgen.io.vasp import Incar, Potcar
-
-from pymatgen.cli.pmg_analyze import analyze
-from pymatgen.cli.pmg_config import configure_pmg
-from pymatgen.cli.pmg_potcar import generate_potcar
-from pymatgen.cli.pmg_plot import plot
-from pymatgen.cli.pmg_structure import analyze_structures
-from pymatgen.cli.pmg_query import do_query
+from pymatgen import SETTINGS
 from pymatgen import __version__
 
 
+def _lazy_command(module_name, func_name):
+    """
+    Wrap a subcommand handler so that its module (and the heavy analysis
+    and plotting modules it depends on) is only imported when the
+    subcommand is actually run.
+
+    :param module_name: Module within pymatgen.cli providing the handler.
+    :param func_name: Name of the handler function.
+    :return: Callable taking the parsed args.
+    """
+    def command(args):
+        module = importlib.import_module("pymatgen.cli." + module_name)
+        return getattr(module, func_name)(args)
+    command.__name__ = func_name
+    return command
+
+
+configure_pmg = _lazy_command("pmg_config", "configure_pmg")
+analyze = _lazy_command("pmg_analyze", "analyze")
+do_query = _lazy_command("pmg_query", "do_query")
+plot = _lazy_command("pmg_plot", "plot")
+analyze_structures = _lazy_command("pmg_structure", "analyze_structures")
+generate_potcar = _lazy_command("pmg_potcar", "generate_potcar")
+
+
 def parse_view(args):
     """
     Handle view commands.
 
     :param args: Args from command.
     """
+    from pymatgen.core.structure import Structure
     from pymatgen.vis.structure_vtk import StructureVis
     excluded_bonding_elements = args.exclude_bonding[0].split(",") \
         if args.exclude_bonding else []
@@ -46,6 +65,7 @@ def diff_incar(args):
 
     :param args: Args from command.
     """
+    from pymatgen.io.vasp.inputs import Incar
     filepath1 = args.incars[0]
     filepath2 = args.incars[1]
     incar1 = Incar.from_file(filepath1)
@@ -74,6 +94,8 @@ def main():
     """
     Handle main.
     """
+    from pymatgen.io.vasp.inputs import Potcar
+
     parser = argparse.ArgumentParser(
         description="""
     pmg is a convenient script that uses pymatgen to perform many
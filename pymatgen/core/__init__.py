@@ -7,10 +7,47 @@ This package contains core modules and classes for representing structures and
 operations on them.
 """
 
-from .periodic_table import Element, Specie, DummySpecie
-from .composition import Composition
-from .structure import Structure, IStructure, Molecule, IMolecule
-from .lattice import Lattice
-from .sites import Site, PeriodicSite
-from .operations import SymmOp
-from .units import Unit, FloatWithUnit, ArrayWithUnit
+import importlib
+import sys
+
+# The classes below are only imported on first access (see __getattr__), so
+# that importing a single module such as pymatgen.core.periodic_table does not
+# pull in the whole package.
+_LAZY_IMPORTS = {
+    "Element": "pymatgen.core.periodic_table",
+    "Specie": "pymatgen.core.periodic_table",
+    "DummySpecie": "pymatgen.core.periodic_table",
+    "Composition": "pymatgen.core.composition",
+    "Structure": "pymatgen.core.structure",
+    "IStructure": "pymatgen.core.structure",
+    "Molecule": "pymatgen.core.structure",
+    "IMolecule": "pymatgen.core.structure",
+    "Lattice": "pymatgen.core.lattice",
+    "Site": "pymatgen.core.sites",
+    "PeriodicSite": "pymatgen.core.sites",
+    "SymmOp": "pymatgen.core.operations",
+    "Unit": "pymatgen.core.units",
+    "FloatWithUnit": "pymatgen.core.units",
+    "ArrayWithUnit": "pymatgen.core.units",
+}
+
+
+def __getattr__(name):
+    """
+    Imports the core classes on first access.
+    """
+    if name in _LAZY_IMPORTS:
+        obj = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is only supported from python 3.7 (PEP 562).
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
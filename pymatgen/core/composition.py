@@ -16,6 +16,7 @@ import re
 from typing import Tuple, List
 from functools import total_ordering
 
+import numpy as np
 from monty.serialization import loadfn
 from monty.fractions import gcd, gcd_float
 from monty.json import MSONable
@@ -235,14 +236,29 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
 
     def __hash__(self):
         """
-        Minimally effective hash function that just distinguishes between
-        Compositions with different elements.
+        Hash of the set of species. The amounts are not hashed, since __eq__
+        compares them within amount_tolerance, which no rounding of the
+        amounts can reproduce. Since Compositions are immutable, the hash is
+        computed only once.
         """
-        hashcode = 0
-        for el, amt in self.items():
-            if abs(amt) > Composition.amount_tolerance:
-                hashcode += el.Z
-        return hashcode
+        return self._get_cached("hash", lambda: hash(frozenset(
+            sp for sp, amt in self._data.items()
+            if abs(amt) > Composition.amount_tolerance)))
+
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        d.pop("_cache", None)
+        return d
+
+    def _get_cached(self, key, func):
+        """
+        Returns a memoized derived quantity of the Composition, computing it
+        with func on the first call.
+        """
+        cache = self.__dict__.setdefault("_cache", {})
+        if key not in cache:
+            cache[key] = func()
+        return cache[key]
 
     @property
     def average_electroneg(self) -> float:
@@ -295,6 +311,9 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
         Returns a formula string, with elements sorted by electronegativity,
         e.g., Li4 Fe4 P4 O16.
         """
+        return self._get_cached("formula", self._get_formula)
+
+    def _get_formula(self):
         sym_amt = self.get_el_amt_dict()
         syms = sorted(sym_amt.keys(), key=lambda sym: get_el_sp(sym).X)
         formula = [s + formula_double_format(sym_amt[s], False) for s in syms]
@@ -346,7 +365,8 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
         Returns:
             Normalized composition which the number of species sum to 1.
         """
-        return self / self._natoms
+        return self._get_cached("fractional_composition",
+                                lambda: self / self._natoms)
 
     @property
     def reduced_composition(self) -> 'Composition':
@@ -365,8 +385,12 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
             A normalized composition and a multiplicative factor, i.e.,
             Li4Fe4P4O16 returns (Composition("LiFePO4"), 4).
         """
-        factor = self.get_reduced_formula_and_factor()[1]
-        return self / factor, factor
+        def get_reduced_composition_and_factor():
+            factor = self.get_reduced_formula_and_factor()[1]
+            return self / factor, factor
+
+        return self._get_cached("reduced_composition_and_factor",
+                                get_reduced_composition_and_factor)
 
     def get_reduced_formula_and_factor(self, iupac_ordering=False) -> Tuple[str, float]:
         """
@@ -386,6 +410,11 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
             A pretty normalized formula and a multiplicative factor, i.e.,
             Li4Fe4P4O16 returns (LiFePO4, 4).
         """
+        return self._get_cached(
+            ("reduced_formula_and_factor", iupac_ordering),
+            lambda: self._get_reduced_formula_and_factor(iupac_ordering))
+
+    def _get_reduced_formula_and_factor(self, iupac_ordering):
         all_int = all(abs(x - round(x)) < Composition.amount_tolerance
                       for x in self.values())
         if not all_int:
@@ -650,6 +679,23 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable):
             d[e.symbol] += a
         return d
 
+    def get_el_amt_vector(self):
+        """
+        Returns:
+            Fixed-length array of the (unreduced) amounts of the elements,
+            indexed by atomic number - 1, e.g., for use in vectorized
+            operations on many compositions. Amounts of species of the same
+            element are summed.
+        """
+        vector = np.zeros(len(Element))
+        for sp, amt in self.items():
+            if not isinstance(sp, (Element, Specie)) or isinstance(sp, DummySpecie):
+                raise ValueError("Only Elements and Species have a fixed "
+                                 "position in the amount vector, got "
+                                 "{}".format(sp))
+            vector[sp.Z - 1] += amt
+        return vector
+
     def as_dict(self):
         """
         Returns:
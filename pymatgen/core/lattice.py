@@ -576,6 +576,7 @@ class Lattice(MSONable):
             ltol: float = 1e-5,
             atol: float = 1,
             skip_rotation_matrix: bool = False,
+            sort_by_distortion: bool = False,
     ) -> Iterator[Tuple["Lattice", Optional[np.ndarray], np.ndarray]]:
         """
         Finds all mappings between current lattice and another lattice.
@@ -587,6 +588,13 @@ class Lattice(MSONable):
             atol (float): Tolerance for matching angles. Defaults to 1.
             skip_rotation_matrix (bool): Whether to skip calculation of the
                 rotation matrix
+            sort_by_distortion (bool): Whether to yield the mappings in order
+                of increasing distortion of the aligned lattice parameters
+                from those of other_lattice, i.e., the sum of the squared
+                relative length differences and squared angle differences
+                (in radians). This requires all mappings to be computed
+                before the first is yielded. Defaults to False, i.e., the
+                mappings are yielded in the order they are found.
 
         Yields:
             (aligned_lattice, rotation_matrix, scale_matrix) if a mapping is
@@ -627,27 +635,54 @@ class Lattice(MSONable):
             angles = np.arccos(x) * 180.0 / pi
             return angles
 
-        alphab = np.abs(get_angles(c_b, c_c, l_b, l_c) - alpha) < atol
-        betab = np.abs(get_angles(c_a, c_c, l_a, l_c) - beta) < atol
-        gammab = np.abs(get_angles(c_a, c_b, l_a, l_b) - gamma) < atol
-
-        for i, all_j in enumerate(gammab):
+        d_alpha = get_angles(c_b, c_c, l_b, l_c) - alpha
+        d_beta = get_angles(c_a, c_c, l_a, l_c) - beta
+        d_gamma = get_angles(c_a, c_b, l_a, l_b) - gamma
+        alphab = np.abs(d_alpha) < atol
+        betab = np.abs(d_beta) < atol
+        gammab = np.abs(d_gamma) < atol
+
+        # The (i, j, k) triples are screened with array operations, in blocks
+        # of vectors a to bound the size of the boolean array.
+        block = max(1, int(1e6 // max(len(f_b) * len(f_c), 1)))
+        found = []  # type: List[Tuple[float, np.ndarray, Optional[np.ndarray], np.ndarray]]
+        for start in range(0, len(f_a), block):
             inds = np.logical_and(
-                all_j[:, None], np.logical_and(alphab, betab[i][None, :])
+                gammab[start:start + block, :, None],
+                np.logical_and(alphab[None, :, :], betab[start:start + block, None, :])
             )
-            for j, k in np.argwhere(inds):
-                scale_m = np.array((f_a[i], f_b[j], f_c[k]), dtype=np.int)  # type: ignore
-                if abs(np.linalg.det(scale_m)) < 1e-8:
-                    continue
-
-                aligned_m = np.array((c_a[i], c_b[j], c_c[k]))
-
-                if skip_rotation_matrix:
-                    rotation_m = None
-                else:
-                    rotation_m = np.linalg.solve(aligned_m, other_lattice.matrix)
+            i, j, k = np.nonzero(inds)
+            if len(i) == 0:
+                continue
+            i += start
+            scale_m = np.stack((f_a[i], f_b[j], f_c[k]), axis=1).astype(int)
+            nonsingular = np.abs(np.linalg.det(scale_m)) >= 1e-8
+            i, j, k, scale_m = i[nonsingular], j[nonsingular], k[nonsingular], scale_m[nonsingular]
+            aligned_m = np.stack((c_a[i], c_b[j], c_c[k]), axis=1)
+
+            if skip_rotation_matrix:
+                rotation_m = np.full(len(i), None, dtype=object)
+            else:
+                rotation_m = np.linalg.solve(aligned_m, np.broadcast_to(other_lattice.matrix, aligned_m.shape))
+
+            if sort_by_distortion:
+                distortion = (
+                    (l_a[i] / lengths[0] - 1) ** 2
+                    + (l_b[j] / lengths[1] - 1) ** 2
+                    + (l_c[k] / lengths[2] - 1) ** 2
+                    + np.radians(d_alpha[j, k]) ** 2
+                    + np.radians(d_beta[i, k]) ** 2
+                    + np.radians(d_gamma[i, j]) ** 2
+                )
+                found.extend(zip(distortion, aligned_m, rotation_m, scale_m))
+            else:
+                for m in zip(aligned_m, rotation_m, scale_m):
+                    yield Lattice(m[0]), m[1], m[2]
 
-                yield Lattice(aligned_m), rotation_m, scale_m
+        if sort_by_distortion:
+            found.sort(key=lambda x: x[0])
+            for _, aligned, rotation, scale in found:
+                yield Lattice(aligned), rotation, scale
 
     def find_mapping(
             self,
@@ -22,9 +22,20 @@ from pymatgen.core.units import Mass, Length, FloatWithUnit, Unit, \
     SUPPORTED_UNIT_NAMES
 from pymatgen.util.string import formula_double_format
 
-# Loads element data from json file
-with open(str(Path(__file__).absolute().parent / "periodic_table.json"), "rt") as f:
-    _pt_data = json.load(f)
+_pt_data = None
+
+
+def _get_pt_data():
+    """
+    Loads the element data from the json file on first use, so that importing
+    the module stays cheap.
+    """
+    global _pt_data
+    if _pt_data is None:
+        with open(str(Path(__file__).absolute().parent / "periodic_table.json"), "rt") as f:
+            _pt_data = json.load(f)
+    return _pt_data
+
 
 _pt_row_sizes = (2, 8, 8, 18, 18, 32, 32)
 
@@ -413,7 +424,13 @@ class Element(Enum):
             {oxidation state: ionic radii}. Radii are given in ang.
         """
         self.symbol = "%s" % symbol
-        d = _pt_data[symbol]
+
+    def _load_data(self):
+        """
+        Loads the data of the element. This is done on first access of the
+        data rather than when the Element enum is created.
+        """
+        d = _get_pt_data()[self.symbol]
 
         # Store key variables for quick access
         self.Z = d["Atomic no"]
@@ -456,6 +473,11 @@ class Element(Enum):
         return self._atomic_mass
 
     def __getattr__(self, item):
+        if item in ["Z", "long_name", "_data", "_atomic_radius", "_atomic_mass"]:
+            if "_data" in self.__dict__:
+                raise AttributeError("Element has no attribute %s!" % item)
+            self._load_data()
+            return getattr(self, item)
         if item in ["mendeleev_no", "electrical_resistivity",
                     "velocity_of_sound", "reflectivity",
                     "refractive_index", "poissons_ratio", "molar_volume",
@@ -794,7 +816,7 @@ class Element(Enum):
         Returns:
             Element with atomic number z.
         """
-        for sym, data in _pt_data.items():
+        for sym, data in _get_pt_data().items():
             if data["Atomic no"] == z:
                 return Element(sym)
         raise ValueError("No element with this atomic number %s" % z)
@@ -811,7 +833,7 @@ class Element(Enum):
         .. note::
             The 18 group number system is used, i.e., Noble gases are group 18.
         """
-        for sym in _pt_data.keys():
+        for sym in _get_pt_data().keys():
             el = Element(sym)
             if el.row == row and el.group == group:
                 return el
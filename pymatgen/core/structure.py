@@ -18,7 +18,7 @@ import warnings
 from fnmatch import fnmatch
 import re
 import functools
-from typing import Dict, List, Tuple, Optional, Union, Iterator, Set, Sequence, Iterable
+from typing import Dict, List, Tuple, Optional, Union, Iterator, Set, Sequence, Iterable, Mapping
 import numpy as np
 
 from tabulate import tabulate
@@ -146,6 +146,418 @@ class PeriodicNeighbor(PeriodicSite):
         return (self, self.nn_distance, self.index, self.image)[i]
 
 
+class PeriodicSiteArray(collections.abc.MutableSequence):
+    """
+    Array-backed sequence of PeriodicSites used as the site storage of
+    array-backed structures (see the array_backed argument of
+    IStructure). Species are stored as indices into a table of unique
+    Compositions and fractional coordinates as a single Nx3 array, so that
+    bulk properties such as frac_coords or the composition never have to
+    touch individual site objects. PeriodicSite objects are only created
+    when a site is indexed, and are cached so that in-place modifications of
+    a returned site are reflected in the structure.
+
+    Any change to the ordering or length of the sequence (insertion,
+    deletion, sorting) converts the storage into a plain list of sites.
+    """
+
+    def __init__(self,
+                 lattice: Lattice,
+                 species_table: List[Composition],
+                 species_indices: np.ndarray,
+                 frac_coords: np.ndarray,
+                 properties: Mapping[str, Sequence] = None):
+        """
+        Args:
+            lattice (Lattice): Lattice shared by all sites.
+            species_table ([Composition]): Unique species on the sites.
+            species_indices (array of int): Index into species_table for
+                each site.
+            frac_coords (Nx3 array): Fractional coordinates of each site.
+            properties (dict): Site properties as a dict of sequences.
+        """
+        self._lattice = lattice
+        self._species_table = list(species_table)
+        self._species_indices = np.asarray(species_indices, dtype=int)
+        self._frac_coords = np.array(frac_coords, dtype=float).reshape((-1, 3))
+        self._properties = {k: list(v) for k, v in (properties or {}).items()}
+        # Sites which have been handed out, by index.
+        self._cache = {}  # type: Dict[int, PeriodicSite]
+        # Plain list storage once the sequence has been structurally modified.
+        self._list = None  # type: Optional[List[PeriodicSite]]
+
+    @classmethod
+    def from_species_and_coords(cls,
+                                lattice: Lattice,
+                                species: Sequence,
+                                frac_coords: np.ndarray,
+                                properties: Mapping[str, Sequence] = None):
+        """
+        Builds the array storage from flexible species input, performing the
+        same validation as PeriodicSite but only once per unique species.
+
+        Args:
+            lattice (Lattice): Lattice shared by all sites.
+            species: Sequence of species on each site. Same input as
+                IStructure.
+            frac_coords (Nx3 array): Fractional coordinates of each site.
+            properties (dict): Site properties as a dict of sequences.
+
+        Returns:
+            PeriodicSiteArray
+        """
+        table = []  # type: List[Composition]
+        lookup = {}  # type: Dict
+        indices = np.empty(len(species), dtype=int)
+        for i, sp in enumerate(species):
+            try:
+                key = sp
+                ind = lookup.get(key)
+            except TypeError:
+                # Unhashable input, e.g. a dict of species and occupancies.
+                key = Composition(sp)
+                ind = lookup.get(key)
+            if ind is None:
+                comp = key
+                if not isinstance(comp, Composition):
+                    try:
+                        comp = Composition({get_el_sp(comp): 1})
+                    except TypeError:
+                        comp = Composition(comp)
+                if comp.num_atoms > 1 + Composition.amount_tolerance:
+                    raise ValueError("Species occupancies sum to more than 1!")
+                ind = len(table)
+                table.append(comp)
+                lookup[key] = ind
+            indices[i] = ind
+        return cls(lattice, table, indices, frac_coords, properties)
+
+    @classmethod
+    def from_sites(cls, sites: Sequence[PeriodicSite]):
+        """
+        Builds the array storage from a sequence of PeriodicSites sharing a
+        lattice.
+
+        Args:
+            sites ([PeriodicSite]): Sites.
+
+        Returns:
+            PeriodicSiteArray
+        """
+        prop_keys = []  # type: List[str]
+        for site in sites:
+            for k in site.properties:
+                if k not in prop_keys:
+                    prop_keys.append(k)
+        props = {k: [site.properties.get(k, None) for site in sites]
+                 for k in prop_keys}
+        frac_coords = np.array([site.frac_coords for site in sites])
+        return cls.from_species_and_coords(
+            sites[0].lattice, [site.species for site in sites],
+            frac_coords, props)
+
+    @property
+    def is_array_backed(self) -> bool:
+        """
+        True if the sites are still stored as arrays, i.e., the sequence has
+        not been converted to a plain list of sites.
+        """
+        return self._list is None
+
+    @property
+    def lattice(self) -> Lattice:
+        """
+        Lattice shared by all sites.
+        """
+        return self._lattice
+
+    @lattice.setter
+    def lattice(self, lattice: Lattice):
+        self._lattice = lattice
+        for site in (self._list if self._list is not None else self._cache.values()):
+            site.lattice = lattice
+
+    @property
+    def frac_coords(self) -> np.ndarray:
+        """
+        Fractional coordinates of all sites as a new Nx3 array.
+        """
+        if self._list is not None:
+            return np.array([site.frac_coords for site in self._list])
+        fcoords = self._frac_coords.copy()
+        for i, site in self._cache.items():
+            fcoords[i] = site.frac_coords
+        return fcoords
+
+    @property
+    def species_and_occu(self) -> List[Composition]:
+        """
+        Species of all sites as a list of Compositions.
+        """
+        if self._list is not None:
+            return [site.species for site in self._list]
+        table = self._species_table
+        species = [table[i] for i in self._species_indices]
+        for i, site in self._cache.items():
+            species[i] = site.species
+        return species
+
+    @property
+    def composition(self) -> Composition:
+        """
+        Total composition of all sites.
+        """
+        if self._list is not None or self._cache:
+            elmap = collections.defaultdict(float)  # type: Dict[Specie, float]
+            for comp in self.species_and_occu:
+                for sp, occu in comp.items():
+                    elmap[sp] += occu
+            return Composition(elmap)
+        counts = np.bincount(self._species_indices,
+                             minlength=len(self._species_table))
+        elmap = collections.defaultdict(float)
+        for comp, n in zip(self._species_table, counts):
+            if n:
+                for sp, occu in comp.items():
+                    elmap[sp] += occu * n
+        return Composition(elmap)
+
+    @property
+    def site_properties(self) -> Dict[str, List]:
+        """
+        Site properties as a dict of lists. Properties missing on a site are
+        set to None.
+        """
+        if self._list is not None:
+            sites = self._list  # type: Sequence[PeriodicSite]
+            cached = dict(enumerate(sites))
+            props = {}  # type: Dict[str, List]
+        else:
+            cached = self._cache
+            props = {k: list(v) for k, v in self._properties.items()}
+        for i, site in cached.items():
+            for k in props:
+                props[k][i] = site.properties.get(k, None)
+            for k, v in site.properties.items():
+                if k not in props:
+                    props[k] = [None] * len(self)
+                    props[k][i] = v
+        return props
+
+    def to_unit_cell(self):
+        """
+        Move the fractional coordinates of all sites into the unit cell in
+        place.
+        """
+        if self._list is not None:
+            for site in self._list:
+                site.to_unit_cell(in_place=True)
+            return
+        self._frac_coords = np.mod(self._frac_coords, 1)
+        for site in self._cache.values():
+            site.to_unit_cell(in_place=True)
+
+    def _get_site(self, i: int) -> PeriodicSite:
+        site = self._cache.get(i)
+        if site is None:
+            props = {k: v[i] for k, v in self._properties.items()}
+            site = PeriodicSite(self._species_table[self._species_indices[i]],
+                                self._frac_coords[i].copy(), self._lattice,
+                                properties=props, skip_checks=True)
+            self._cache[i] = site
+        return site
+
+    def _to_list(self) -> List[PeriodicSite]:
+        if self._list is None:
+            self._list = [self._get_site(i) for i in range(len(self))]
+            self._cache = {}
+            self._frac_coords = np.empty((0, 3))
+            self._species_indices = np.empty(0, dtype=int)
+            self._properties = {}
+        return self._list
+
+    def __len__(self):
+        if self._list is not None:
+            return len(self._list)
+        return len(self._frac_coords)
+
+    def __getitem__(self, i):
+        if self._list is not None:
+            return self._list[i]
+        if isinstance(i, slice):
+            return [self._get_site(ii) for ii in range(*i.indices(len(self)))]
+        n = len(self)
+        if not -n <= i < n:
+            raise IndexError("site index out of range")
+        return self._get_site(int(i) % n)
+
+    def __iter__(self):
+        if self._list is not None:
+            return iter(self._list)
+        return (self._get_site(i) for i in range(len(self)))
+
+    def __setitem__(self, i, site):
+        if self._list is None and isinstance(i, (int, np.integer)):
+            n = len(self)
+            if not -n <= i < n:
+                raise IndexError("site index out of range")
+            self._cache[int(i) % n] = site
+        else:
+            self._to_list()[i] = site
+
+    def __delitem__(self, i):
+        del self._to_list()[i]
+
+    def insert(self, index, value):
+        """
+        Insert a site before index.
+        """
+        self._to_list().insert(index, value)
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the sites in place.
+        """
+        self._to_list().sort(key=key, reverse=reverse)
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Sequence) or len(self) != len(other):
+            return False
+        return all(s1 == s2 for s1, s2 in zip(self, other))
+
+    def __repr__(self):
+        return "PeriodicSiteArray(%d sites%s)" % (
+            len(self), "" if self._list is None else ", list storage")
+
+
+class NeighborIndex:
+    """
+    Persistent neighbor list of a periodic structure for a fixed cutoff
+    radius. The index is built once with the cell-list search in
+    pymatgen.optimization.neighbors and can then answer neighbor list
+    queries for any radius up to the cutoff by filtering the stored pairs.
+
+    When the structure is modified, calling update with the modified
+    structure recomputes only the pairs involving sites whose coordinates
+    changed (e.g., after translate_sites, perturb of a few sites or
+    replacing a site), as long as the lattice and the number of sites are
+    unchanged. Otherwise the index is rebuilt from scratch.
+
+    The stored pairs are grouped by center index, but the order of the
+    neighbors of a given center may differ from that of a fresh search after
+    an incremental update.
+    """
+
+    # Beyond this fraction of moved sites, a full rebuild is cheaper than
+    # an incremental update.
+    max_update_fraction = 0.5
+
+    def __init__(self, structure: "IStructure", r: float, numerical_tol: float = 1e-8):
+        """
+        Args:
+            structure (IStructure/Structure): Structure to index.
+            r (float): Cutoff radius of the index.
+            numerical_tol (float): Numerical tolerance for distances. Same
+                definition as in IStructure.get_neighbor_list.
+        """
+        self.r = float(r)
+        self.numerical_tol = numerical_tol
+        self._build(structure)
+
+    def _search(self, center_coords: np.ndarray) -> Tuple[np.ndarray, ...]:
+        from pymatgen.optimization.neighbors import find_points_in_spheres  # type: ignore
+        return find_points_in_spheres(self._cart_coords,
+                                      np.ascontiguousarray(center_coords, dtype=float),
+                                      r=self.r, pbc=np.array([1, 1, 1], dtype=int),
+                                      lattice=self._lattice_matrix,
+                                      tol=self.numerical_tol)
+
+    def _build(self, structure: "IStructure"):
+        self._lattice_matrix = np.array(structure.lattice.matrix, dtype=float)
+        self._frac_coords = structure.frac_coords
+        self._cart_coords = np.ascontiguousarray(
+            structure.lattice.get_cartesian_coords(self._frac_coords), dtype=float)
+        self.center_indices, self.points_indices, self.images, self.distances = \
+            self._search(self._cart_coords)
+
+    def _update_sites(self, moved: np.ndarray):
+        moved_mask = np.zeros(len(self._frac_coords), dtype=bool)
+        moved_mask[moved] = True
+        keep = ~(moved_mask[self.center_indices] | moved_mask[self.points_indices])
+
+        centers, points, images, distances = self._search(self._cart_coords[moved])
+        centers = moved[centers]
+        # Pairs from an unmoved center to a moved site are the reverse of the
+        # pairs just found. Pairs between two moved sites are found both ways.
+        rev = ~moved_mask[points]
+
+        center_indices = np.concatenate([self.center_indices[keep], centers, points[rev]])
+        order = np.argsort(center_indices, kind="stable")
+        self.center_indices = center_indices[order]
+        self.points_indices = np.concatenate(
+            [self.points_indices[keep], points, centers[rev]])[order]
+        self.images = np.concatenate(
+            [self.images[keep], images, -images[rev]])[order]
+        self.distances = np.concatenate(
+            [self.distances[keep], distances, distances[rev]])[order]
+
+    def update(self, structure: "IStructure") -> bool:
+        """
+        Brings the index in sync with a (possibly modified) structure.
+
+        Args:
+            structure (IStructure/Structure): Structure the index belongs to.
+
+        Returns:
+            (bool) True if the index was up to date or could be updated
+            incrementally, False if it had to be rebuilt.
+        """
+        fcoords = structure.frac_coords
+        if len(fcoords) != len(self._frac_coords) or \
+                not np.array_equal(structure.lattice.matrix, self._lattice_matrix):
+            self._build(structure)
+            return False
+        moved = np.where(np.any(fcoords != self._frac_coords, axis=1))[0]
+        if len(moved) == 0:
+            return True
+        if len(moved) > self.max_update_fraction * len(fcoords):
+            self._build(structure)
+            return False
+        self._frac_coords = fcoords
+        self._cart_coords = np.ascontiguousarray(
+            structure.lattice.get_cartesian_coords(fcoords), dtype=float)
+        self._update_sites(moved)
+        return True
+
+    def query(self, r: float = None, exclude_self: bool = True) -> Tuple[np.ndarray, ...]:
+        """
+        Neighbor list within a radius no larger than the cutoff of the index.
+
+        Args:
+            r (float): Radius of sphere. Defaults to the cutoff of the index.
+            exclude_self (bool): Whether to exclude atoms neighboring
+                themselves within the numerical tolerance.
+
+        Returns:
+            (center_indices, points_indices, offset_vectors, distances), as
+            in IStructure.get_neighbor_list.
+        """
+        r = self.r if r is None else float(r)
+        if r > self.r:
+            raise ValueError("Radius %s exceeds the cutoff %s of the neighbor index." % (r, self.r))
+        cond = np.ones(len(self.distances), dtype=bool)
+        if r < self.r:
+            # Same criterion as the search itself, which works with a single
+            # precision radius.
+            r32 = np.float32(r)
+            cond &= self.distances ** 2 < float(r32 * r32) + self.numerical_tol
+        if exclude_self:
+            cond &= ~((self.center_indices == self.points_indices) &
+                      (self.distances <= self.numerical_tol))
+        return (self.center_indices[cond], self.points_indices[cond],
+                self.images[cond], self.distances[cond])
+
+
 class SiteCollection(collections.abc.Sequence, metaclass=ABCMeta):
     """
     Basic SiteCollection. Essentially a sequence of Sites or PeriodicSites.
@@ -626,7 +1038,8 @@ class IStructure(SiteCollection, MSONable):
                  validate_proximity: bool = False,
                  to_unit_cell: bool = False,
                  coords_are_cartesian: bool = False,
-                 site_properties: dict = None):
+                 site_properties: dict = None,
+                 array_backed: bool = False):
         """
         Create a periodic structure.
 
@@ -661,6 +1074,13 @@ class IStructure(SiteCollection, MSONable):
                 dict of sequences, e.g., {"magmom":[5,5,5,5]}. The sequences
                 have to be the same length as the atomic species and
                 fractional_coords. Defaults to None for no properties.
+            array_backed (bool): Whether to store species, coordinates and
+                site properties in contiguous arrays (see
+                :class:`PeriodicSiteArray`) instead of a tuple of
+                PeriodicSites. PeriodicSite objects are then only created
+                when sites are indexed, which makes construction and bulk
+                properties such as frac_coords much faster for large
+                structures. Defaults to False.
         """
         if len(species) != len(coords):
             raise StructureError("The list of atomic species must be of the"
@@ -672,19 +1092,28 @@ class IStructure(SiteCollection, MSONable):
         else:
             self._lattice = Lattice(lattice)
 
-        sites = []
-        for i, sp in enumerate(species):
-            prop = None
-            if site_properties:
-                prop = {k: v[i]
-                        for k, v in site_properties.items()}
-
-            sites.append(
-                PeriodicSite(sp, coords[i], self._lattice,
-                             to_unit_cell,
-                             coords_are_cartesian=coords_are_cartesian,
-                             properties=prop))
-        self._sites = tuple(sites)
+        if array_backed:
+            fcoords = np.array(coords, dtype=float).reshape((-1, 3))
+            if coords_are_cartesian:
+                fcoords = self._lattice.get_fractional_coords(fcoords)
+            if to_unit_cell:
+                fcoords = np.mod(fcoords, 1)
+            self._sites = PeriodicSiteArray.from_species_and_coords(
+                self._lattice, species, fcoords, site_properties)
+        else:
+            sites = []
+            for i, sp in enumerate(species):
+                prop = None
+                if site_properties:
+                    prop = {k: v[i]
+                            for k, v in site_properties.items()}
+
+                sites.append(
+                    PeriodicSite(sp, coords[i], self._lattice,
+                                 to_unit_cell,
+                                 coords_are_cartesian=coords_are_cartesian,
+                                 properties=prop))
+            self._sites = tuple(sites)
         if validate_proximity and not self.is_valid():
             raise StructureError(("Structure contains sites that are ",
                                   "less than 0.01 Angstrom apart!"))
@@ -695,7 +1124,8 @@ class IStructure(SiteCollection, MSONable):
                    sites: List[PeriodicSite],
                    charge: float = None,
                    validate_proximity: bool = False,
-                   to_unit_cell: bool = False):
+                   to_unit_cell: bool = False,
+                   array_backed: bool = False):
         """
         Convenience constructor to make a Structure from a list of sites.
 
@@ -707,6 +1137,8 @@ class IStructure(SiteCollection, MSONable):
                 that are less than 0.01 Ang apart. Defaults to False.
             to_unit_cell (bool): Whether to translate sites into the unit
                 cell.
+            array_backed (bool): Whether to use array-backed site storage.
+                Defaults to False.
 
         Returns:
             (Structure) Note that missing properties are set as None.
@@ -734,7 +1166,8 @@ class IStructure(SiteCollection, MSONable):
                    charge=charge,
                    site_properties=props,
                    validate_proximity=validate_proximity,
-                   to_unit_cell=to_unit_cell)
+                   to_unit_cell=to_unit_cell,
+                   array_backed=array_backed)
 
     @classmethod
     def from_spacegroup(cls,
@@ -959,6 +1392,15 @@ class IStructure(SiteCollection, MSONable):
         """
         return self._sites
 
+    @property
+    def is_array_backed(self) -> bool:
+        """
+        True if the sites are stored in contiguous arrays, i.e., the
+        structure was created with array_backed=True and has not been
+        structurally modified since.
+        """
+        return isinstance(self._sites, PeriodicSiteArray) and self._sites.is_array_backed
+
     @property
     def lattice(self):
         """
@@ -966,6 +1408,44 @@ class IStructure(SiteCollection, MSONable):
         """
         return self._lattice
 
+    @property
+    def cart_coords(self):
+        """
+        Returns a np.array of the cartesian coordinates of sites in the
+        structure.
+        """
+        if self.is_array_backed:
+            return self._lattice.get_cartesian_coords(self._sites.frac_coords)
+        return super().cart_coords
+
+    @property
+    def species_and_occu(self):
+        """
+        List of species and occupancies at each site of the structure.
+        """
+        if self.is_array_backed:
+            return self._sites.species_and_occu
+        return super().species_and_occu
+
+    @property
+    def composition(self):
+        """
+        (Composition) Returns the composition
+        """
+        if self.is_array_backed:
+            return self._sites.composition
+        return super().composition
+
+    @property
+    def site_properties(self):
+        """
+        Returns the site properties as a dict of sequences. E.g.,
+        {"magmom": (5,-5), "charge": (-4,4)}.
+        """
+        if self.is_array_backed:
+            return self._sites.site_properties
+        return super().site_properties
+
     @property
     def density(self):
         """
@@ -1068,6 +1548,19 @@ class IStructure(SiteCollection, MSONable):
         f_lat = lattice_points_in_supercell(scale_matrix)
         c_lat = new_lattice.get_cartesian_coords(f_lat)
 
+        new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
+
+        if self.is_array_backed:
+            nlat = len(c_lat)
+            cart_coords = (self.cart_coords[:, None, :] + c_lat[None, :, :]).reshape((-1, 3))
+            props = {k: [v for v in vals for _ in range(nlat)]
+                     for k, vals in self.site_properties.items()}
+            return Structure(new_lattice,
+                             [sp for sp in self.species_and_occu for _ in range(nlat)],
+                             cart_coords, charge=new_charge,
+                             coords_are_cartesian=True, site_properties=props,
+                             array_backed=True)
+
         new_sites = []
         for site in self:
             for v in c_lat:
@@ -1078,7 +1571,6 @@ class IStructure(SiteCollection, MSONable):
                     skip_checks=True)
                 new_sites.append(s)
 
-        new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
         return Structure.from_sites(new_sites, charge=new_charge)
 
     def __rmul__(self, scaling_matrix):
@@ -1092,6 +1584,8 @@ class IStructure(SiteCollection, MSONable):
         """
         Fractional coordinates as a Nx3 numpy array.
         """
+        if self.is_array_backed:
+            return self._sites.frac_coords
         return np.array([site.frac_coords for site in self._sites])
 
     @property
@@ -1289,6 +1783,9 @@ class IStructure(SiteCollection, MSONable):
                 numerical tolerance distance, default to True
         Returns: (center_indices, points_indices, offset_vectors, distances)
 
+        When sites is None, the result is obtained from the NeighborIndex
+        cached on the structure (see get_neighbor_index), so that repeated
+        calls on the same structure do not repeat the search.
         """
         try:
             from pymatgen.optimization.neighbors import find_points_in_spheres  # type: ignore
@@ -1296,7 +1793,8 @@ class IStructure(SiteCollection, MSONable):
             return self._get_neighbor_list_py(r, sites, exclude_self=exclude_self)
         else:
             if sites is None:
-                sites = self.sites
+                return self.get_neighbor_index(r, numerical_tol=numerical_tol).query(
+                    r, exclude_self=exclude_self)
             site_coords = np.array([site.coords for site in sites], dtype=float)
             cart_coords = np.ascontiguousarray(np.array(self.cart_coords), dtype=float)
             lattice_matrix = np.ascontiguousarray(np.array(self.lattice.matrix), dtype=float)
@@ -1312,6 +1810,36 @@ class IStructure(SiteCollection, MSONable):
             return tuple((center_indices[cond], points_indices[cond],
                           images[cond], distances[cond]))
 
+    def get_neighbor_index(self, r: float, numerical_tol: float = 1e-8) -> NeighborIndex:
+        """
+        Returns the NeighborIndex cached on the structure, with a cutoff of at
+        least r. The cached index is reused for queries at smaller radii,
+        updated incrementally if only a few sites have moved since it was
+        built, and rebuilt if a larger cutoff is requested. Requires the
+        pymatgen.optimization.neighbors extension.
+
+        Args:
+            r (float): Minimum cutoff radius of the index.
+            numerical_tol (float): Numerical tolerance for distances. Same
+                definition as in get_neighbor_list.
+
+        Returns:
+            NeighborIndex
+        """
+        index = getattr(self, "_neighbor_index", None)
+        if index is None or index.r < r or index.numerical_tol != numerical_tol:
+            index = NeighborIndex(self, r, numerical_tol=numerical_tol)
+            self._neighbor_index = index
+        else:
+            index.update(self)
+        return index
+
+    def __getstate__(self):
+        # The neighbor index is a cache and can be large. Do not pickle it.
+        state = self.__dict__.copy()
+        state.pop("_neighbor_index", None)
+        return state
+
     def get_all_neighbors(self, r: float,
                           include_index: bool = False,
                           include_image: bool = False,
@@ -1356,10 +1884,10 @@ class IStructure(SiteCollection, MSONable):
             [PeriodicNeighbor] where PeriodicNeighbor is a namedtuple containing
             (site, distance, index, image).
         """
-        if sites is None:
-            sites = self.sites
         center_indices, points_indices, images, distances = \
             self.get_neighbor_list(r=r, sites=sites, numerical_tol=numerical_tol)
+        if sites is None:
+            sites = self.sites
         if len(points_indices) < 1:
             return [[]] * len(sites)
         f_coords = self.frac_coords[points_indices] + images
@@ -1634,11 +2162,15 @@ class IStructure(SiteCollection, MSONable):
         if site_properties:
             props.update(site_properties)
         if not sanitize:
+            # Only pass array_backed when needed so that subclasses with
+            # their own constructor signature keep working.
+            kwargs = {"array_backed": True} if self.is_array_backed else {}
             return self.__class__(self._lattice,
                                   self.species_and_occu,
                                   self.frac_coords,
                                   charge=self._charge,
-                                  site_properties=props)
+                                  site_properties=props,
+                                  **kwargs)
         reduced_latt = self._lattice.get_lll_reduced_lattice()
         new_sites = []
         for i, site in enumerate(self):
@@ -2974,7 +3506,8 @@ class Structure(IStructure, collections.abc.MutableSequence):
                  validate_proximity: bool = False,
                  to_unit_cell: bool = False,
                  coords_are_cartesian: bool = False,
-                 site_properties: dict = None):
+                 site_properties: dict = None,
+                 array_backed: bool = False):
         """
         Create a periodic structure.
 
@@ -3008,14 +3541,19 @@ class Structure(IStructure, collections.abc.MutableSequence):
                 dict of sequences, e.g., {"magmom":[5,5,5,5]}. The sequences
                 have to be the same length as the atomic species and
                 fractional_coords. Defaults to None for no properties.
+            array_backed (bool): Whether to store the sites in contiguous
+                arrays. See IStructure. Modifications that change the number
+                or order of sites switch the structure back to a list of
+                PeriodicSites. Defaults to False.
         """
         super().__init__(
             lattice, species, coords, charge=charge,
             validate_proximity=validate_proximity, to_unit_cell=to_unit_cell,
             coords_are_cartesian=coords_are_cartesian,
-            site_properties=site_properties)
+            site_properties=site_properties, array_backed=array_backed)
 
-        self._sites = list(self._sites)  # type: ignore
+        if not array_backed:
+            self._sites = list(self._sites)  # type: ignore
 
     def __setitem__(self, i, site):
         """
@@ -3103,6 +3641,9 @@ class Structure(IStructure, collections.abc.MutableSequence):
     @lattice.setter
     def lattice(self, lattice):
         self._lattice = lattice
+        if isinstance(self._sites, PeriodicSiteArray):
+            self._sites.lattice = lattice
+            return
         for site in self._sites:
             site.lattice = lattice
 
@@ -3522,8 +4063,11 @@ class Structure(IStructure, collections.abc.MutableSequence):
         """
         s = self * scaling_matrix
         if to_unit_cell:
-            for site in s:
-                site.to_unit_cell(in_place=True)
+            if s.is_array_backed:
+                s.sites.to_unit_cell()
+            else:
+                for site in s:
+                    site.to_unit_cell(in_place=True)
         self._sites = s.sites
         self._lattice = s.lattice
 
@@ -3983,7 +4527,32 @@ class StructureError(Exception):
     pass
 
 
-with open(os.path.join(os.path.dirname(__file__),
-                       "func_groups.json"), "rt") as f:
-    FunctionalGroups = {k: Molecule(v["species"], v["coords"])
-                        for k, v in json.load(f).items()}
+class _FunctionalGroups(collections.abc.Mapping):
+    """
+    Read-only mapping of functional group names to Molecules. The groups are
+    only read from func_groups.json on first access, so that importing this
+    module does not build Molecules (and load the periodic table data).
+    """
+
+    def __init__(self):
+        self._groups = None  # type: Optional[Dict[str, Molecule]]
+
+    def _get_groups(self) -> Dict[str, Molecule]:
+        if self._groups is None:
+            with open(os.path.join(os.path.dirname(__file__),
+                                   "func_groups.json"), "rt") as f:
+                self._groups = {k: Molecule(v["species"], v["coords"])
+                                for k, v in json.load(f).items()}
+        return self._groups
+
+    def __getitem__(self, key):
+        return self._get_groups()[key]
+
+    def __iter__(self):
+        return iter(self._get_groups())
+
+    def __len__(self):
+        return len(self._get_groups())
+
+
+FunctionalGroups = _FunctionalGroups()
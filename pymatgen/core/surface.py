@@ -17,7 +17,7 @@ as well as::
     Surface Science, 2013, 617, 53–59, doi:10.1016/j.susc.2013.05.016.
 """
 
-from functools import reduce
+from functools import reduce, partial
 from math import gcd
 import math
 import itertools
@@ -26,6 +26,7 @@ import warnings
 import copy
 import os
 import json
+from multiprocessing import Pool
 
 import numpy as np
 from scipy.spatial.distance import squareform
@@ -895,6 +896,9 @@ class SlabGenerator:
         a, b, c = self.oriented_unit_cell.lattice.matrix
         self._proj_height = abs(np.dot(normal, c))
         self.reorient_lattice = reorient_lattice
+        # Reduced oriented unit cells, keyed by the in-plane lattice
+        # parameters of the slabs, which are the same for most shifts.
+        self._reduced_oucs = {}
 
     def get_slab(self, shift=0, tol=0.1, energy=None):
         """
@@ -965,12 +969,15 @@ class SlabGenerator:
         if self.primitive:
             # find a reduced ouc
             slab_l = slab.lattice
-            ouc = ouc.get_primitive_structure(constrain_latt={"a": slab_l.a, "b": slab_l.b,
-                                                              "alpha": slab_l.alpha,
-                                                              "beta": slab_l.beta,
-                                                              "gamma": slab_l.gamma})
-            # Check this is the correct oriented unit cell
-            ouc = self.oriented_unit_cell if slab_l.a != ouc.lattice.a or slab_l.b != ouc.lattice.b else ouc
+            constrain_latt = {"a": slab_l.a, "b": slab_l.b, "alpha": slab_l.alpha,
+                              "beta": slab_l.beta, "gamma": slab_l.gamma}
+            key = tuple(sorted(constrain_latt.items()))
+            if key not in self._reduced_oucs:
+                ouc = ouc.get_primitive_structure(constrain_latt=constrain_latt)
+                # Check this is the correct oriented unit cell
+                ouc = self.oriented_unit_cell if slab_l.a != ouc.lattice.a or slab_l.b != ouc.lattice.b else ouc
+                self._reduced_oucs[key] = ouc
+            ouc = self._reduced_oucs[key]
 
         return Slab(slab.lattice, slab.species_and_occu,
                     slab.frac_coords, self.miller_index,
@@ -1053,7 +1060,7 @@ class SlabGenerator:
         return c_ranges
 
     def get_slabs(self, bonds=None, ftol=0.1, tol=0.1, max_broken_bonds=0,
-                  symmetrize=False, repair=False):
+                  symmetrize=False, repair=False, termination_signature=False):
         """
         This method returns a list of slabs that are generated using the list of
         shift values from the method, _calculate_possible_shifts(). Before the
@@ -1081,6 +1088,12 @@ class SlabGenerator:
             repair (bool): Whether to repair terminations with broken bonds
                 or just omit them. Set to False as repairing terminations can
                 lead to many possible slabs as oppose to just omitting them.
+            termination_signature (bool): Whether to only compare slabs whose
+                surface layers (the species within ftol of the top and bottom
+                surfaces) are the same when removing duplicate terminations.
+                This is faster for surfaces with many terminations, but a site
+                close to the ftol cutoff can keep two equivalent terminations
+                apart. Defaults to False.
 
         Returns:
             ([Slab]) List of all possible terminations of a particular surface.
@@ -1107,7 +1120,7 @@ class SlabGenerator:
                              scale=False)
 
         new_slabs = []
-        for g in m.group_structures(slabs):
+        for g in _group_slabs(m, slabs, ftol, termination_signature):
             # For each unique termination, symmetrize the
             # surfaces by removing sites from the bottom.
             if symmetrize:
@@ -1118,7 +1131,8 @@ class SlabGenerator:
 
         match = StructureMatcher(ltol=tol, stol=tol, primitive_cell=False,
                                  scale=False)
-        new_slabs = [g[0] for g in match.group_structures(new_slabs)]
+        new_slabs = [g[0] for g in _group_slabs(match, new_slabs, ftol,
+                                                termination_signature)]
 
         return sorted(new_slabs, key=lambda s: s.energy)
 
@@ -1704,7 +1718,8 @@ def generate_all_slabs(structure, max_index, min_slab_size, min_vacuum_size,
                        bonds=None, tol=0.1, ftol=0.1, max_broken_bonds=0,
                        lll_reduce=False, center_slab=False, primitive=True,
                        max_normal_search=None, symmetrize=False, repair=False,
-                       include_reconstructions=False, in_unit_planes=False):
+                       include_reconstructions=False, in_unit_planes=False,
+                       nproc=None, termination_signature=False):
     """
     A function that finds all different slabs up to a certain miller index.
     Slabs oriented under certain Miller indices that are equivalent to other
@@ -1758,19 +1773,33 @@ def generate_all_slabs(structure, max_index, min_slab_size, min_vacuum_size,
             or just omit them
         include_reconstructions (bool): Whether to include reconstructed
             slabs available in the reconstructions_archive.json file.
+        nproc (int): Number of processes used to generate the slabs of the
+            different Miller indices in parallel. Defaults to None, i.e., no
+            parallelization.
+        termination_signature (bool): Whether to only compare slabs with
+            the same surface layers when removing duplicate terminations.
+            See SlabGenerator.get_slabs. Defaults to False.
     """
     all_slabs = []
 
-    for miller in get_symmetrically_distinct_miller_indices(structure,
-                                                            max_index):
-        gen = SlabGenerator(structure, miller, min_slab_size,
-                            min_vacuum_size, lll_reduce=lll_reduce,
-                            center_slab=center_slab, primitive=primitive,
-                            max_normal_search=max_normal_search,
-                            in_unit_planes=in_unit_planes)
-        slabs = gen.get_slabs(bonds=bonds, tol=tol, ftol=ftol, symmetrize=symmetrize,
-                              max_broken_bonds=max_broken_bonds, repair=repair)
+    millers = get_symmetrically_distinct_miller_indices(structure, max_index)
+    gen_kwargs = dict(min_slab_size=min_slab_size,
+                      min_vacuum_size=min_vacuum_size, lll_reduce=lll_reduce,
+                      center_slab=center_slab, primitive=primitive,
+                      max_normal_search=max_normal_search,
+                      in_unit_planes=in_unit_planes)
+    slabs_kwargs = dict(bonds=bonds, tol=tol, ftol=ftol, symmetrize=symmetrize,
+                        max_broken_bonds=max_broken_bonds, repair=repair,
+                        termination_signature=termination_signature)
+    f = partial(_get_slabs, structure, gen_kwargs=gen_kwargs,
+                slabs_kwargs=slabs_kwargs)
+    if nproc is not None:
+        with Pool(nproc) as p:
+            all_miller_slabs = p.map(f, millers)
+    else:
+        all_miller_slabs = map(f, millers)
 
+    for miller, slabs in zip(millers, all_miller_slabs):
         if len(slabs) > 0:
             logger.debug("%s has %d slabs... " % (miller, len(slabs)))
             all_slabs.extend(slabs)
@@ -1795,6 +1824,69 @@ def generate_all_slabs(structure, max_index, min_slab_size, min_vacuum_size,
     return all_slabs
 
 
+def _get_slabs(structure, miller_index, gen_kwargs, slabs_kwargs):
+    """
+    Generates the slabs of a Miller index, for generate_all_slabs.
+    """
+    gen = SlabGenerator(structure, miller_index, **gen_kwargs)
+    return gen.get_slabs(**slabs_kwargs)
+
+
+def _get_termination_signature(slab, ftol):
+    """
+    Computes a cheap signature of the terminations of a slab, i.e., its
+    composition and the sets of species within ftol (in Angstrom, along the
+    surface normal) of its top and bottom surfaces, sorted so that flipping
+    the slab does not change the signature.
+
+    The signature is a heuristic: only the composition is invariant under
+    StructureMatcher. A site close to the ftol cutoff can be counted in the
+    surface layer of one slab and not in the one of a slab that
+    StructureMatcher would consider equivalent, in which case both
+    terminations are kept. It is therefore only used when requested with the
+    termination_signature argument of SlabGenerator.get_slabs.
+    """
+    # The surfaces are on either side of the largest gap between the
+    # heights, i.e., the vacuum, even if the slab wraps around the cell.
+    h = abs(np.dot(slab.lattice.matrix[2], slab.normal))
+    heights = (slab.frac_coords[:, 2] % 1) * h
+    sorted_heights = np.sort(heights)
+    gaps = np.diff(np.append(sorted_heights, sorted_heights[0] + h))
+    i = np.argmax(gaps)
+    surfaces = []
+    for extreme in (sorted_heights[i], sorted_heights[(i + 1) % len(slab)]):
+        dists = np.abs(heights - extreme) % h
+        dists = np.minimum(dists, h - dists)
+        surfaces.append(tuple(sorted({site.species_string for site, d in zip(slab, dists) if d <= ftol})))
+    return slab.composition.formula, tuple(sorted(surfaces))
+
+
+def _group_slabs(matcher, slabs, ftol, termination_signature=False):
+    """
+    Groups equivalent slabs with a StructureMatcher, after partitioning them
+    by their composition hash and number of sites, which the matcher (without
+    supercells) requires to be the same. If termination_signature is True, the
+    slabs are partitioned by their termination signatures instead, which is
+    faster but may keep equivalent slabs apart. The groups are returned in the
+    order of their first slab in slabs.
+    """
+    partitions = {}
+    for slab in slabs:
+        if termination_signature:
+            key = _get_termination_signature(slab, ftol)
+        else:
+            key = (matcher._comparator.get_hash(slab.composition), len(slab))
+        partitions.setdefault(key, []).append(slab)
+    groups = []
+    for partition in partitions.values():
+        if len(partition) == 1:
+            groups.append(partition)
+        else:
+            groups.extend(matcher.group_structures(partition))
+    order = {id(slab): i for i, slab in enumerate(slabs)}
+    return sorted(groups, key=lambda g: min(order[id(slab)] for slab in g))
+
+
 def get_slab_regions(slab, blength=3.5):
     """
     Function to get the ranges of the slab regions. Useful for discerning where
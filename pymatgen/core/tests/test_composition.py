@@ -18,6 +18,7 @@ __email__ = "shyuep@gmail.com"
 __status__ = "Production"
 __date__ = "Nov 10, 2012"
 
+import math
 import unittest
 
 from pymatgen.core.periodic_table import Element, Specie
@@ -340,6 +341,40 @@ class CompositionTest(PymatgenTest):
         self.assertEqual(comp1.__hash__(), comp2.__hash__(),
                          "Hashcode equality test failed!")
 
+    def test_hash(self):
+        comps = [Composition(f) for f in ["FeO", "Fe2O3", "Fe3O4", "FeO2", "Fe2O"]]
+        self.assertEqual(len(set(comps)), len(comps))
+        # Compositions which are equal within amount_tolerance hash the same
+        amt = (500000 - 1 / math.pi) / 1e6
+        c1 = Composition({"Fe": amt - 1e-9, "O": 0.5})
+        c2 = Composition({"Fe": amt + 1e-9, "O": 0.5})
+        self.assertEqual(c1, c2)
+        self.assertEqual(hash(c1), hash(c2))
+        self.assertEqual(len({c1, c2}), 1)
+        self.assertEqual(hash(Composition({"Fe": 0.1 + 0.2, "O": 1 / 3})),
+                         hash(Composition({"Fe": 0.3, "O": 1 - 2 / 3})))
+        self.assertEqual(hash(Composition("Li2O").fractional_composition),
+                         hash(Composition({"Li": 2 / 3, "O": 1 / 3})))
+
+    def test_cached_properties(self):
+        c = Composition("Li4Fe4P4O16")
+        self.assertIs(c.reduced_composition, c.reduced_composition)
+        self.assertIs(c.fractional_composition, c.fractional_composition)
+        self.assertEqual(c.reduced_formula, "LiFePO4")
+        self.assertEqual(c.get_reduced_formula_and_factor(iupac_ordering=True),
+                         ("LiFePO4", 4))
+        self.assertEqual(c.formula, "Li4 Fe4 P4 O16")
+        # The cache is not pickled
+        self.assertNotIn("_cache", c.__getstate__())
+
+    def test_get_el_amt_vector(self):
+        v = Composition({"Fe2+": 1, "Fe3+": 2, "O": 4}).get_el_amt_vector()
+        self.assertEqual(v.shape, (118,))
+        self.assertEqual(v[25], 3)
+        self.assertEqual(v[7], 4)
+        self.assertEqual(v.sum(), 7)
+        self.assertRaises(ValueError, Composition({"X": 1}).get_el_amt_vector)
+
     def test_comparisons(self):
         c1 = Composition({'S': 1})
         c1_1 = Composition({'S': 1.00000000000001})
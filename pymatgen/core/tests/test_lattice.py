@@ -290,6 +290,25 @@ class LatticeTestCase(PymatgenTest):
         for l, _, _ in latt.find_all_mappings(latt, ltol=0.05, atol=11):
             self.assertTrue(isinstance(l, Lattice))
 
+    def test_find_all_mappings_sort_by_distortion(self):
+        latt = Lattice.from_parameters(3, 3.05, 3.1, 89, 90.5, 91)
+        target = Lattice.cubic(3.05)
+        unsorted = list(latt.find_all_mappings(target, ltol=0.05, atol=2))
+        mappings = list(latt.find_all_mappings(target, ltol=0.05, atol=2,
+                                               sort_by_distortion=True))
+        self.assertEqual(len(mappings), len(unsorted))
+        self.assertGreater(len(mappings), 1)
+        distortions = []
+        for aligned, rot, scale in mappings:
+            self.assertArrayAlmostEqual(np.dot(scale, latt.matrix),
+                                        aligned.matrix)
+            self.assertArrayAlmostEqual(np.dot(aligned.matrix, rot),
+                                        target.matrix)
+            distortions.append(
+                np.sum((np.array(aligned.abc) / 3.05 - 1) ** 2) +
+                np.sum(np.radians(np.array(aligned.angles) - 90) ** 2))
+        self.assertArrayAlmostEqual(distortions, sorted(distortions))
+
     def test_mapping_symmetry(self):
         l = Lattice.cubic(1)
         l2 = Lattice.orthorhombic(1.1001, 1, 1)
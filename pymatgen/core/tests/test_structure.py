@@ -222,6 +222,33 @@ class IStructureTest(PymatgenTest):
         self.assertEqual(new_struct[1].charge, 2)
         self.assertAlmostEqual(new_struct.volume, structure.volume)
 
+    def test_array_backed(self):
+        s = IStructure(self.lattice, ["Si", {"Fe": 0.5, "Mn": 0.5}],
+                       [[0, 0, 0], [0.75, 0.5, 0.75]],
+                       site_properties={'magmom': [5, -5]}, array_backed=True)
+        self.assertTrue(s.is_array_backed)
+        self.assertEqual(len(s), 2)
+        self.assertEqual(s.composition, Composition("SiFe0.5Mn0.5"))
+        self.assertArrayAlmostEqual(s.frac_coords, [[0, 0, 0], [0.75, 0.5, 0.75]])
+        self.assertArrayAlmostEqual(s.cart_coords, self.lattice.get_cartesian_coords(s.frac_coords))
+        self.assertEqual(s.site_properties, {'magmom': [5, -5]})
+        self.assertEqual(s[1].magmom, -5)
+        self.assertIs(s[1], s[-1])
+        self.assertEqual(s, IStructure(self.lattice, ["Si", {"Fe": 0.5, "Mn": 0.5}],
+                                       [[0, 0, 0], [0.75, 0.5, 0.75]],
+                                       site_properties={'magmom': [5, -5]}))
+        self.assertTrue(s.copy().is_array_backed)
+        self.assertEqual(IStructure.from_dict(s.as_dict()), s)
+
+        supercell = s * (2, 1, 3)
+        self.assertTrue(supercell.is_array_backed)
+        ref = IStructure(self.lattice, ["Si", {"Fe": 0.5, "Mn": 0.5}],
+                         [[0, 0, 0], [0.75, 0.5, 0.75]],
+                         site_properties={'magmom': [5, -5]}) * (2, 1, 3)
+        self.assertArrayAlmostEqual(supercell.frac_coords, ref.frac_coords)
+        self.assertEqual(supercell.site_properties, ref.site_properties)
+        self.assertEqual(supercell.species_and_occu, ref.species_and_occu)
+
     def test_interpolate(self):
         coords = list()
         coords.append([0, 0, 0])
@@ -835,6 +862,48 @@ class StructureTest(PymatgenTest):
                                     [0.75, 0.5, 0.75],
                                     decimal=6)
 
+    def test_array_backed(self):
+        s = Structure(self.structure.lattice, ["Si", "Si"],
+                      [[0, 0, 0], [0.75, 0.5, 0.75]], array_backed=True)
+        s[0] = "Fe"
+        s.translate_sites([1], [0.1, 0, 0])
+        self.assertTrue(s.is_array_backed)
+        self.assertEqual(s.formula, "Fe1 Si1")
+        self.assertArrayAlmostEqual(s.frac_coords, [[0, 0, 0], [0.85, 0.5, 0.75]])
+        s.scale_lattice(50)
+        self.assertAlmostEqual(s[0].lattice.volume, 50)
+        s.make_supercell([2, 1, 1])
+        self.assertTrue(s.is_array_backed)
+        self.assertEqual(s.formula, "Fe2 Si2")
+        s.append("O", [0.1, 0.1, 0.1], properties={"magmom": 2})
+        self.assertFalse(s.is_array_backed)
+        self.assertEqual(s.formula, "Fe2 Si2 O1")
+        self.assertEqual(s.site_properties["magmom"], [None] * 4 + [2])
+        del s[0]
+        self.assertEqual(s.formula, "Fe1 Si2 O1")
+
+    def test_neighbor_index(self):
+        def pairs(res):
+            c, p, images, d = res
+            return sorted(zip(c, p, map(tuple, np.round(images).astype(int)), np.round(d, 6)))
+
+        s = self.structure * 3
+        index = s.get_neighbor_index(5)
+        self.assertEqual(pairs(s.get_neighbor_list(3)), pairs(s.copy().get_neighbor_list(3)))
+        self.assertIs(s.get_neighbor_index(4), index)
+
+        s.translate_sites([0, 4], [0.05, -0.02, 0.1])
+        s[2] = "Fe"
+        self.assertTrue(index.update(s))
+        self.assertEqual(pairs(index.query(4)), pairs(s.copy().get_neighbor_list(4)))
+        self.assertEqual(pairs(s.get_neighbor_list(4.5)), pairs(s.copy().get_neighbor_list(4.5)))
+        self.assertIs(s.get_neighbor_index(4), index)
+        self.assertRaises(ValueError, index.query, 6)
+
+        s.append("Si", [0.1, 0.2, 0.3])
+        self.assertEqual(pairs(s.get_neighbor_list(4)), pairs(s.copy().get_neighbor_list(4)))
+        self.assertIsNot(s.get_neighbor_index(6), index)
+
     def test_mul(self):
         self.structure *= [2, 1, 1]
         self.assertEqual(self.structure.formula, "Si4")
@@ -399,6 +399,10 @@ class SlabGeneratorTest(PymatgenTest):
             bonds={("P", "O"): 3, ("Fe", "O"): 3},
             max_broken_bonds=2)), 2)
 
+        # Here the termination signatures do not keep equivalent slabs apart.
+        self.assertEqual(len(gen.get_slabs(termination_signature=True)),
+                         len(gen.get_slabs()))
+
         # At this threshold, only the origin and center Li results in
         # clustering. All other sites are non-clustered. So the of
         # slabs is of sites in LiFePO4 unit cell - 2 + 1.
@@ -724,6 +728,17 @@ class MillerIndexFinderTests(PymatgenTest):
         self.assertEqual(len(hcp_indices_100), 6)
         self.assertTrue(all([len(hkl) == 4 for hkl in hcp_indices_100]))
 
+    def test_generate_all_slabs_nproc(self):
+        slabs = generate_all_slabs(self.lifepo4, 1, 10, 10,
+                                   bonds={("P", "O"): 3})
+        slabs2 = generate_all_slabs(self.lifepo4, 1, 10, 10,
+                                    bonds={("P", "O"): 3}, nproc=2)
+        self.assertEqual(len(slabs), len(slabs2))
+        for s1, s2 in zip(slabs, slabs2):
+            self.assertEqual(s1.miller_index, s2.miller_index)
+            self.assertAlmostEqual(s1.shift, s2.shift)
+            self.assertEqual(s1, s2)
+
     def test_generate_all_slabs(self):
 
         slabs = generate_all_slabs(self.cscl, 1, 10, 10)
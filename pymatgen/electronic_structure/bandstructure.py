@@ -204,7 +204,6 @@ class BandStructure:
         """
         self.efermi = efermi
         self.lattice_rec = lattice
-        self.kpoints = []
         self.labels_dict = {}
         self.structure = structure
         self.projections = projections or {}
@@ -217,22 +216,85 @@ class BandStructure:
             raise Exception("if projections are provided a structure object"
                             " needs also to be given")
 
-        for k in kpoints:
-            # let see if this kpoint has been assigned a label
-            label = None
-            for c in labels_dict:
-                if np.linalg.norm(k - np.array(labels_dict[c])) < 0.0001:
-                    label = c
-                    self.labels_dict[label] = Kpoint(
-                        k, lattice, label=label,
-                        coords_are_cartesian=coords_are_cartesian)
-            self.kpoints.append(
-                Kpoint(k, lattice, label=label,
-                       coords_are_cartesian=coords_are_cartesian))
+        # The kpoints are stored as coordinate arrays. The Kpoint objects are
+        # only created when the kpoints attribute is first accessed.
+        coords = np.array(kpoints, dtype=float).reshape(-1, 3)
+        # Each kpoint gets the (last) label whose coordinates are within
+        # 1e-4 of it.
+        label_index = np.full(len(coords), -1, dtype=int)
+        label_names = list(labels_dict.keys())
+        for i, c in enumerate(label_names):
+            match = np.linalg.norm(coords - np.array(labels_dict[c]),
+                                   axis=1) < 0.0001
+            if np.any(match):
+                label_index[match] = i
+                self.labels_dict[c] = Kpoint(
+                    coords[np.nonzero(match)[0][-1]], lattice, label=c,
+                    coords_are_cartesian=coords_are_cartesian)
+        self._kpoints_labels = [label_names[i] if i >= 0 else None
+                                for i in label_index]
+        if coords_are_cartesian:
+            self._kpoints_frac_coords = lattice.get_fractional_coords(coords)
+        else:
+            self._kpoints_frac_coords = coords
+        self._kpoints_cart_coords = lattice.get_cartesian_coords(
+            self._kpoints_frac_coords)
+        self._kpoints = None
+
         self.bands = {spin: np.array(v) for spin, v in eigenvals.items()}
         self.nb_bands = len(eigenvals[Spin.up])
         self.is_spin_polarized = len(self.bands) == 2
 
+    @property
+    def kpoints(self):
+        """
+        The list of kpoints (as Kpoint objects) in the band structure.
+        """
+        if self._kpoints is None:
+            self._kpoints = [self._get_kpoint(i)
+                             for i in range(len(self._kpoints_labels))]
+        return self._kpoints
+
+    @kpoints.setter
+    def kpoints(self, kpoints):
+        self._kpoints = list(kpoints)
+        self._kpoints_labels = [k.label for k in self._kpoints]
+        self._kpoints_frac_coords = np.array(
+            [k.frac_coords for k in self._kpoints]).reshape(-1, 3)
+        self._kpoints_cart_coords = np.array(
+            [k.cart_coords for k in self._kpoints]).reshape(-1, 3)
+
+    @property
+    def kpoints_frac_coords(self):
+        """
+        The fractional coordinates of all kpoints as a (nkpoints, 3) array.
+        """
+        return np.copy(self._kpoints_frac_coords)
+
+    @property
+    def kpoints_cart_coords(self):
+        """
+        The cartesian coordinates of all kpoints as a (nkpoints, 3) array.
+        """
+        return np.copy(self._kpoints_cart_coords)
+
+    @property
+    def kpoints_labels(self):
+        """
+        The labels of all kpoints as a list (None for unlabelled kpoints).
+        """
+        return list(self._kpoints_labels)
+
+    def _get_kpoint(self, index):
+        """
+        Returns the Kpoint object at index without building the full list of
+        kpoints.
+        """
+        if self._kpoints is not None:
+            return self._kpoints[index]
+        return Kpoint(np.copy(self._kpoints_frac_coords[index]),
+                      self.lattice_rec, label=self._kpoints_labels[index])
+
     def get_projection_on_elements(self):
         """
         Method returning a dictionary of projections on elements.
@@ -244,16 +306,21 @@ class BandStructure:
             returns an empty dict
         """
         result = {}
-        structure = self.structure
+        if len(self.projections) == 0:
+            return result
+        sites_by_specie = collections.OrderedDict()
+        for i, site in enumerate(self.structure):
+            sites_by_specie.setdefault(str(site.specie), []).append(i)
+        species = list(sites_by_specie.keys())
         for spin, v in self.projections.items():
-            result[spin] = [[collections.defaultdict(float)
-                             for i in range(len(self.kpoints))]
-                            for j in range(self.nb_bands)]
-            for i, j, k in itertools.product(range(self.nb_bands),
-                                             range(len(self.kpoints)),
-                                             range(structure.num_sites)):
-                result[spin][i][j][str(structure[k].specie)] += np.sum(
-                    v[i, j, :, k])
+            # Sum over orbitals, then over the sites of each specie.
+            v_sites = np.sum(v, axis=2)
+            v_species = np.stack([np.sum(v_sites[:, :, inds], axis=2)
+                                  for inds in sites_by_specie.values()],
+                                 axis=-1)
+            result[spin] = [[collections.defaultdict(float, zip(species, vals))
+                             for vals in band]
+                            for band in v_species.tolist()]
         return result
 
     def get_projections_on_elements_and_orbitals(self, el_orb_spec):
@@ -276,22 +343,29 @@ class BandStructure:
         result = {}
         structure = self.structure
         el_orb_spec = {get_el_sp(el): orbs for el, orbs in el_orb_spec.items()}
+        nkpts = len(self._kpoints_labels)
         for spin, v in self.projections.items():
             result[spin] = [[{str(e): collections.defaultdict(float)
                               for e in el_orb_spec}
-                             for i in range(len(self.kpoints))]
+                             for i in range(nkpts)]
                             for j in range(self.nb_bands)]
 
-            for i, j, k in itertools.product(
-                    range(self.nb_bands), range(len(self.kpoints)),
-                    range(structure.num_sites)):
-                sp = structure[k].specie
-                for orb_i in range(len(v[i][j])):
-                    o = Orbital(orb_i).name[0]
-                    if sp in el_orb_spec:
-                        if o in el_orb_spec[sp]:
-                            result[spin][i][j][str(sp)][o] += v[i][j][
-                                orb_i][k]
+            orbitals = [Orbital(orb_i).name[0] for orb_i in range(v.shape[2])]
+            for sp, orbs in el_orb_spec.items():
+                site_inds = [k for k, site in enumerate(structure)
+                             if site.specie == sp]
+                if not site_inds:
+                    continue
+                v_sp = np.sum(v[:, :, :, site_inds], axis=3)
+                for o in set(orbs):
+                    orb_inds = [i for i, name in enumerate(orbitals)
+                                if name == o]
+                    if not orb_inds:
+                        continue
+                    values = np.sum(v_sp[:, :, orb_inds], axis=2).tolist()
+                    for i, j in itertools.product(range(self.nb_bands),
+                                                  range(nkpts)):
+                        result[spin][i][j][str(sp)][o] = values[i][j]
         return result
 
     def is_metal(self, efermi_tol=1e-4):
@@ -336,21 +410,15 @@ class BandStructure:
                     "kpoint": [], "energy": None, "projections": {}}
         max_tmp = -float("inf")
         index = None
-        kpointvbm = None
         for spin, v in self.bands.items():
-            for i, j in zip(*np.where(v < self.efermi)):
-                if v[i, j] > max_tmp:
-                    max_tmp = float(v[i, j])
-                    index = j
-                    kpointvbm = self.kpoints[j]
-
-        list_ind_kpts = []
-        if kpointvbm.label is not None:
-            for i in range(len(self.kpoints)):
-                if self.kpoints[i].label == kpointvbm.label:
-                    list_ind_kpts.append(i)
-        else:
-            list_ind_kpts.append(index)
+            below = np.where(v < self.efermi, v, -np.inf)
+            i, j = np.unravel_index(np.argmax(below), below.shape)
+            if below[i, j] > max_tmp:
+                max_tmp = float(below[i, j])
+                index = int(j)
+        kpointvbm = self._get_kpoint(index)
+
+        list_ind_kpts = self._get_equivalent_kpoint_indices(index)
         # get all other bands sharing the vbm
         list_ind_band = collections.defaultdict(list)
         for spin in self.bands:
@@ -395,21 +463,15 @@ class BandStructure:
         max_tmp = float("inf")
 
         index = None
-        kpointcbm = None
         for spin, v in self.bands.items():
-            for i, j in zip(*np.where(v >= self.efermi)):
-                if v[i, j] < max_tmp:
-                    max_tmp = float(v[i, j])
-                    index = j
-                    kpointcbm = self.kpoints[j]
-
-        list_index_kpoints = []
-        if kpointcbm.label is not None:
-            for i in range(len(self.kpoints)):
-                if self.kpoints[i].label == kpointcbm.label:
-                    list_index_kpoints.append(i)
-        else:
-            list_index_kpoints.append(index)
+            above = np.where(v >= self.efermi, v, np.inf)
+            i, j = np.unravel_index(np.argmin(above), above.shape)
+            if above[i, j] < max_tmp:
+                max_tmp = float(above[i, j])
+                index = int(j)
+        kpointcbm = self._get_kpoint(index)
+
+        list_index_kpoints = self._get_equivalent_kpoint_indices(index)
 
         # get all other bands sharing the cbm
         list_index_band = collections.defaultdict(list)
@@ -428,6 +490,16 @@ class BandStructure:
                 'kpoint': kpointcbm, 'energy': max_tmp,
                 'projections': proj}
 
+    def _get_equivalent_kpoint_indices(self, index):
+        """
+        Returns the indices of all kpoints sharing the label of the kpoint at
+        index, or just [index] if it is not labelled.
+        """
+        label = self._kpoints_labels[index]
+        if label is None:
+            return [index]
+        return [i for i, l in enumerate(self._kpoints_labels) if l == label]
+
     def get_band_gap(self):
         r"""
         Returns band gap data.
@@ -546,11 +618,9 @@ class BandStructure:
         d = {"@module": self.__class__.__module__,
              "@class": self.__class__.__name__,
              "lattice_rec": self.lattice_rec.as_dict(), "efermi": self.efermi,
-             "kpoints": []}
+             "kpoints": self._kpoints_frac_coords.tolist()}
         # kpoints are not kpoint objects dicts but are frac coords (this makes
         # the dict smaller and avoids the repetition of the lattice
-        for k in self.kpoints:
-            d["kpoints"].append(k.as_dict()["fcoords"])
         d["bands"] = {str(int(spin)): self.bands[spin]
                       for spin in self.bands}
         d["is_metal"] = self.is_metal()
@@ -686,26 +756,20 @@ class BandStructureSymmLine(BandStructure, MSONable):
         super().__init__(
             kpoints, eigenvals, lattice, efermi, labels_dict,
             coords_are_cartesian, structure, projections)
-        self.distance = []
         self.branches = []
         one_group = []
         branches_tmp = []
-        # get labels and distance for each kpoint
-        previous_kpoint = self.kpoints[0]
-        previous_distance = 0.0
-
-        previous_label = self.kpoints[0].label
-        for i in range(len(self.kpoints)):
-            label = self.kpoints[i].label
-            if label is not None and previous_label is not None:
-                self.distance.append(previous_distance)
-            else:
-                self.distance.append(
-                    np.linalg.norm(self.kpoints[i].cart_coords -
-                                   previous_kpoint.cart_coords) +
-                    previous_distance)
-            previous_kpoint = self.kpoints[i]
-            previous_distance = self.distance[i]
+        labels = self._kpoints_labels
+        # get distance for each kpoint: the distance does not increase
+        # between two consecutive labelled kpoints (e.g., X|U)
+        steps = np.linalg.norm(np.diff(self._kpoints_cart_coords, axis=0),
+                               axis=1)
+        labelled = np.array([l is not None for l in labels], dtype=bool)
+        steps[labelled[1:] & labelled[:-1]] = 0.0
+        self.distance = [0.0] + np.cumsum(steps).tolist()
+
+        previous_label = labels[0]
+        for i, label in enumerate(labels):
             if label:
                 if previous_label:
                     if len(one_group) != 0:
@@ -719,7 +783,7 @@ class BandStructureSymmLine(BandStructure, MSONable):
         for b in branches_tmp:
             self.branches.append(
                 {"start_index": b[0], "end_index": b[-1],
-                 "name": str(self.kpoints[b[0]].label) + "-" + str(self.kpoints[b[-1]].label)})
+                 "name": str(labels[b[0]]) + "-" + str(labels[b[-1]])})
 
         self.is_spin_polarized = False
         if len(self.bands) == 2:
@@ -742,15 +806,7 @@ class BandStructureSymmLine(BandStructure, MSONable):
         # if the kpoint has no label it can"t have a repetition along the band
         # structure line object
 
-        if self.kpoints[index].label is None:
-            return [index]
-
-        list_index_kpoints = []
-        for i in range(len(self.kpoints)):
-            if self.kpoints[i].label == self.kpoints[index].label:
-                list_index_kpoints.append(i)
-
-        return list_index_kpoints
+        return self._get_equivalent_kpoint_indices(index)
 
     def get_branch(self, index):
         r"""
@@ -794,25 +850,15 @@ class BandStructureSymmLine(BandStructure, MSONable):
             max_index = -1000
             # spin_index = None
             for i in range(self.nb_bands):
-                below = False
-                above = False
-                for j in range(len(self.kpoints)):
-                    if self.bands[Spin.up][i][j] < self.efermi:
-                        below = True
-                    if self.bands[Spin.up][i][j] > self.efermi:
-                        above = True
+                below = np.any(self.bands[Spin.up][i] < self.efermi)
+                above = np.any(self.bands[Spin.up][i] > self.efermi)
                 if above and below:
                     if i > max_index:
                         max_index = i
                         # spin_index = Spin.up
                 if self.is_spin_polarized:
-                    below = False
-                    above = False
-                    for j in range(len(self.kpoints)):
-                        if self.bands[Spin.down][i][j] < self.efermi:
-                            below = True
-                        if self.bands[Spin.down][i][j] > self.efermi:
-                            above = True
+                    below = np.any(self.bands[Spin.down][i] < self.efermi)
+                    above = np.any(self.bands[Spin.down][i] > self.efermi)
                     if above and below:
                         if i > max_index:
                             max_index = i
@@ -847,11 +893,9 @@ class BandStructureSymmLine(BandStructure, MSONable):
         d = {"@module": self.__class__.__module__,
              "@class": self.__class__.__name__,
              "lattice_rec": self.lattice_rec.as_dict(), "efermi": self.efermi,
-             "kpoints": []}
+             "kpoints": self._kpoints_frac_coords.tolist()}
         # kpoints are not kpoint objects dicts but are frac coords (this makes
         # the dict smaller and avoids the repetition of the lattice
-        for k in self.kpoints:
-            d["kpoints"].append(k.as_dict()["fcoords"])
         d["branches"] = self.branches
         d["bands"] = {str(int(spin)): self.bands[spin].tolist()
                       for spin in self.bands}
@@ -970,11 +1014,9 @@ class LobsterBandStructureSymmLine(BandStructureSymmLine):
         d = {"@module": self.__class__.__module__,
              "@class": self.__class__.__name__,
              "lattice_rec": self.lattice_rec.as_dict(), "efermi": self.efermi,
-             "kpoints": []}
+             "kpoints": self._kpoints_frac_coords.tolist()}
         # kpoints are not kpoint objects dicts but are frac coords (this makes
         # the dict smaller and avoids the repetition of the lattice
-        for k in self.kpoints:
-            d["kpoints"].append(k.as_dict()["fcoords"])
         d["branches"] = self.branches
         d["bands"] = {str(int(spin)): self.bands[spin].tolist()
                       for spin in self.bands}
@@ -1086,10 +1128,10 @@ class LobsterBandStructureSymmLine(BandStructureSymmLine):
         result = {}
         for spin, v in self.projections.items():
             result[spin] = [[collections.defaultdict(float)
-                             for i in range(len(self.kpoints))]
+                             for i in range(len(self._kpoints_labels))]
                             for j in range(self.nb_bands)]
             for i, j in itertools.product(range(self.nb_bands),
-                                          range(len(self.kpoints))):
+                                          range(len(self._kpoints_labels))):
                 for key, item in v[i][j].items():
                     for key2, item2 in item.items():
                         specie = str(Element(re.split(r"[0-9]+", key)[0]))
@@ -1118,11 +1160,11 @@ class LobsterBandStructureSymmLine(BandStructureSymmLine):
         for spin, v in self.projections.items():
             result[spin] = [[{str(e): collections.defaultdict(float)
                               for e in el_orb_spec}
-                             for i in range(len(self.kpoints))]
+                             for i in range(len(self._kpoints_labels))]
                             for j in range(self.nb_bands)]
 
             for i, j in itertools.product(range(self.nb_bands),
-                                          range(len(self.kpoints))):
+                                          range(len(self._kpoints_labels))):
                 for key, item in v[i][j].items():
                     for key2, item2 in item.items():
                         specie = str(Element(re.split(r"[0-9]+", key)[0]))
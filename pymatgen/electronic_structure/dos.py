@@ -637,21 +637,131 @@ class CompleteDos(Dos):
     .. attribute:: pdos
 
         Dict of partial densities of the form {Site:{Orbital:{Spin:Densities}}}
+
+    .. attribute:: pdos_tensor
+
+        If the CompleteDos was created with dense_pdos=True, all partial
+        densities as a single array with indices [site_index, orbital_index,
+        spin_index, energy_index], where the indices refer to pdos_sites,
+        pdos_orbitals and pdos_spins. Orbitals that are not present for a site
+        are zero. The densities in pdos are views on this array. None
+        otherwise.
     """
 
-    def __init__(self, structure, total_dos, pdoss):
+    def __init__(self, structure, total_dos, pdoss, dense_pdos=False):
         """
         Args:
             structure: Structure associated with this particular DOS.
             total_dos: total Dos for structure
             pdoss: The pdoss are supplied as an {Site:{Orbital:{
                 Spin:Densities}}}
+            dense_pdos: Whether to store the pdoss as one dense array (see
+                pdos_tensor). The site, element and orbital projected
+                DOS are then summed with array operations instead of
+                adding the densities one by one, which is much faster for
+                large structures. Defaults to False.
         """
         super().__init__(
             total_dos.efermi, energies=total_dos.energies,
             densities={k: np.array(d) for k, d in total_dos.densities.items()})
         self.pdos = pdoss
         self.structure = structure
+        self.pdos_tensor = None
+        if dense_pdos:
+            self._build_pdos_tensor()
+
+    def _build_pdos_tensor(self):
+        """
+        Stores the pdos in pdos_tensor and replaces the densities in pdos by
+        views on it.
+        """
+        self.pdos_sites = list(self.pdos.keys())
+        self._pdos_site_index = {site: i for i, site in enumerate(self.pdos_sites)}
+        self.pdos_orbitals = []
+        spins = set()
+        for atom_dos in self.pdos.values():
+            for orb, pdos in atom_dos.items():
+                if orb not in self.pdos_orbitals:
+                    self.pdos_orbitals.append(orb)
+                spins.update(pdos.keys())
+        self.pdos_spins = sorted(spins, key=lambda spin: -int(spin))
+        orbital_index = {orb: j for j, orb in enumerate(self.pdos_orbitals)}
+
+        tensor = np.zeros((len(self.pdos_sites), len(self.pdos_orbitals),
+                           len(self.pdos_spins), len(self.energies)))
+        self._pdos_mask = np.zeros(tensor.shape[:2], dtype=bool)
+        pdoss = {}
+        for i, (site, atom_dos) in enumerate(self.pdos.items()):
+            pdoss[site] = {}
+            for orb, pdos in atom_dos.items():
+                j = orbital_index[orb]
+                self._pdos_mask[i, j] = True
+                pdoss[site][orb] = {}
+                for k, spin in enumerate(self.pdos_spins):
+                    if spin in pdos:
+                        tensor[i, j, k] = pdos[spin]
+                        pdoss[site][orb][spin] = tensor[i, j, k]
+        self.pdos_tensor = tensor
+        self.pdos = pdoss
+
+    def _sum_pdos_tensor(self, site_groups, orbital_groups):
+        """
+        Sums the pdos_tensor over groups of sites and orbitals.
+
+        Args:
+            site_groups: Group key for each site in pdos_sites, or None to
+                leave a site out.
+            orbital_groups: Group key for each orbital in pdos_orbitals, or
+                None to leave an orbital out.
+
+        Returns:
+            Dict of {(site_group, orbital_group): {Spin: densities}} for all
+            combinations for which at least one site has an orbital.
+        """
+        def one_hot(groups):
+            keys = []
+            for g in groups:
+                if g is not None and g not in keys:
+                    keys.append(g)
+            matrix = np.zeros((len(groups), len(keys)))
+            for i, g in enumerate(groups):
+                if g is not None:
+                    matrix[i, keys.index(g)] = 1
+            return keys, matrix
+
+        site_keys, site_matrix = one_hot(site_groups)
+        orbital_keys, orbital_matrix = one_hot(orbital_groups)
+        summed = np.einsum("ia,ijke,jb->abke", site_matrix, self.pdos_tensor,
+                           orbital_matrix, optimize=True)
+        present = np.dot(np.dot(site_matrix.T, self._pdos_mask),
+                         orbital_matrix) > 0
+        return {(a, b): {spin: summed[ia, ib, k]
+                         for k, spin in enumerate(self.pdos_spins)}
+                for ia, a in enumerate(site_keys)
+                for ib, b in enumerate(orbital_keys) if present[ia, ib]}
+
+    def _get_site_groups(self, site):
+        """
+        Returns the site groups for _sum_pdos_tensor that select a single
+        site.
+        """
+        groups = [None] * len(self.pdos_sites)
+        groups[self._pdos_site_index[site]] = True
+        return groups
+
+    @staticmethod
+    def _get_orbital_type(orb):
+        """
+        Returns the OrbitalType of an orbital key of pdos.
+        """
+        return _get_orb_type(orb)
+
+    @staticmethod
+    def _get_orbital(orb):
+        """
+        Returns the Orbital of an orbital key of pdos.
+        """
+        return orb
 
     def get_site_orbital_dos(self, site, orbital):
         """
@@ -676,6 +786,11 @@ class CompleteDos(Dos):
         Returns:
             Dos containing summed orbital densities for site.
         """
+        if self.pdos_tensor is not None:
+            i = self._pdos_site_index[site]
+            site_dos = {spin: self.pdos_tensor[i, :, k].sum(axis=0)
+                        for k, spin in enumerate(self.pdos_spins)}
+            return Dos(self.efermi, self.energies, site_dos)
         site_dos = functools.reduce(add_densities, self.pdos[site].values())
         return Dos(self.efermi, self.energies, site_dos)
 
@@ -689,6 +804,12 @@ class CompleteDos(Dos):
         Returns:
             dict of {orbital: Dos}, e.g. {"s": Dos object, ...}
         """
+        if self.pdos_tensor is not None:
+            summed = self._sum_pdos_tensor(
+                self._get_site_groups(site),
+                [_get_orb_type(orb) for orb in self.pdos_orbitals])
+            return {orb: Dos(self.efermi, self.energies, densities)
+                    for (_, orb), densities in summed.items()}
         spd_dos = dict()
         for orb, pdos in self.pdos[site].items():
             orbital_type = _get_orb_type(orb)
@@ -710,11 +831,26 @@ class CompleteDos(Dos):
             A dict {"e_g": Dos, "t2g": Dos} containing summed e_g and t2g DOS
             for the site.
         """
+        if self.pdos_tensor is not None:
+            groups = []
+            for orb in self.pdos_orbitals:
+                orb = self._get_orbital(orb)
+                if orb in (Orbital.dxy, Orbital.dxz, Orbital.dyz):
+                    groups.append("t2g")
+                elif orb in (Orbital.dx2, Orbital.dz2):
+                    groups.append("e_g")
+                else:
+                    groups.append(None)
+            summed = self._sum_pdos_tensor(
+                self._get_site_groups(site), groups)
+            return {"t2g": Dos(self.efermi, self.energies, summed[(True, "t2g")]),
+                    "e_g": Dos(self.efermi, self.energies, summed[(True, "e_g")])}
         t2g_dos = []
         eg_dos = []
         for s, atom_dos in self.pdos.items():
             if s == site:
                 for orb, pdos in atom_dos.items():
+                    orb = self._get_orbital(orb)
                     if orb in (Orbital.dxy, Orbital.dxz, Orbital.dyz):
                         t2g_dos.append(pdos)
                     elif orb in (Orbital.dx2, Orbital.dz2):
@@ -731,10 +867,16 @@ class CompleteDos(Dos):
         Returns:
             dict of {orbital: Dos}, e.g. {"s": Dos object, ...}
         """
+        if self.pdos_tensor is not None:
+            summed = self._sum_pdos_tensor(
+                [True] * len(self.pdos_sites),
+                [self._get_orbital_type(orb) for orb in self.pdos_orbitals])
+            return {orb: Dos(self.efermi, self.energies, densities)
+                    for (_, orb), densities in summed.items()}
         spd_dos = {}
         for atom_dos in self.pdos.values():
             for orb, pdos in atom_dos.items():
-                orbital_type = _get_orb_type(orb)
+                orbital_type = self._get_orbital_type(orb)
                 if orbital_type not in spd_dos:
                     spd_dos[orbital_type] = pdos
                 else:
@@ -750,6 +892,12 @@ class CompleteDos(Dos):
         Returns:
             dict of {Element: Dos}
         """
+        if self.pdos_tensor is not None:
+            summed = self._sum_pdos_tensor(
+                [site.specie for site in self.pdos_sites],
+                [True] * len(self.pdos_orbitals))
+            return {el: Dos(self.efermi, self.energies, densities)
+                    for (el, _), densities in summed.items()}
 
         el_dos = {}
         for site, atom_dos in self.pdos.items():
@@ -773,11 +921,17 @@ class CompleteDos(Dos):
             dict of {Element: {"S": densities, "P": densities, "D": densities}}
         """
         el = get_el_sp(el)
+        if self.pdos_tensor is not None:
+            summed = self._sum_pdos_tensor(
+                [True if site.specie == el else None for site in self.pdos_sites],
+                [self._get_orbital_type(orb) for orb in self.pdos_orbitals])
+            return {orb: Dos(self.efermi, self.energies, densities)
+                    for (_, orb), densities in summed.items()}
         el_dos = {}
         for site, atom_dos in self.pdos.items():
             if site.specie == el:
                 for orb, pdos in atom_dos.items():
-                    orbital_type = _get_orb_type(orb)
+                    orbital_type = self._get_orbital_type(orb)
                     if orbital_type not in el_dos:
                         el_dos[orbital_type] = pdos
                     else:
@@ -894,68 +1048,22 @@ class LobsterCompleteDos(CompleteDos):
         """
 
         warnings.warn("Are the orbitals correctly oriented? Are you sure?")
-        t2g_dos = []
-        eg_dos = []
-        for s, atom_dos in self.pdos.items():
-            if s == site:
-
-                for orb, pdos in atom_dos.items():
-                    if _get_orb_lobster(orb) in (Orbital.dxy, Orbital.dxz, Orbital.dyz):
-                        t2g_dos.append(pdos)
-                    elif _get_orb_lobster(orb) in (Orbital.dx2, Orbital.dz2):
-                        eg_dos.append(pdos)
-        return {"t2g": Dos(self.efermi, self.energies,
-                           functools.reduce(add_densities, t2g_dos)),
-                "e_g": Dos(self.efermi, self.energies,
-                           functools.reduce(add_densities, eg_dos))}
+        return super().get_site_t2g_eg_resolved_dos(site)
 
-    def get_spd_dos(self):
+    @staticmethod
+    def _get_orbital_type(orb):
         """
-        Get orbital projected Dos.
-        For example, if 3s and 4s are included in the basis of some element, they will be both summed in the orbital
-        projected DOS
-
-        Returns:
-            dict of {orbital: Dos}, e.g. {"s": Dos object, ...}
+        Returns the OrbitalType of an orbital string of pdos, e.g. "4s".
+        Note that, e.g., 3s and 4s are both summed in the orbital projected DOS.
         """
-        spd_dos = {}
-        for atom_dos in self.pdos.values():
-            for orb, pdos in atom_dos.items():
-                orbital_type = _get_orb_type_lobster(orb)
-                if orbital_type not in spd_dos:
-                    spd_dos[orbital_type] = pdos
-                else:
-                    spd_dos[orbital_type] = \
-                        add_densities(spd_dos[orbital_type], pdos)
+        return _get_orb_type_lobster(orb)
 
-        return {orb: Dos(self.efermi, self.energies, densities)
-                for orb, densities in spd_dos.items()}
-
-    def get_element_spd_dos(self, el):
+    @staticmethod
+    def _get_orbital(orb):
         """
-        Get element and spd projected Dos
-
-
-        Args:
-            el: Element in Structure.composition associated with LobsterCompleteDos
-
-        Returns:
-            dict of {Element: {"S": densities, "P": densities, "D": densities}}
+        Returns the Orbital of an orbital string of pdos, e.g. "3d_xy".
         """
-        el = get_el_sp(el)
-        el_dos = {}
-        for site, atom_dos in self.pdos.items():
-            if site.specie == el:
-                for orb, pdos in atom_dos.items():
-                    orbital_type = _get_orb_type_lobster(orb)
-                    if orbital_type not in el_dos:
-                        el_dos[orbital_type] = pdos
-                    else:
-                        el_dos[orbital_type] = \
-                            add_densities(el_dos[orbital_type], pdos)
-
-        return {orb: Dos(self.efermi, self.energies, densities)
-                for orb, densities in el_dos.items()}
+        return _get_orb_lobster(orb)
 
     @classmethod
     def from_dict(cls, d):
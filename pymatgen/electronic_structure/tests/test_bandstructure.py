@@ -100,6 +100,24 @@ class BandStructureSymmLine_test(PymatgenTest):
 
         self.assertAlmostEqual(self.bs2.efermi, 2.6211967, "wrong fermi energy")
 
+    def test_kpoints_arrays(self):
+        bs = self.bs2
+        self.assertIsNone(bs._kpoints)
+        self.assertEqual(bs.kpoints_frac_coords.shape, (len(bs.kpoints_labels), 3))
+        self.assertArrayAlmostEqual(bs.kpoints_frac_coords[31], [0.5, 0.25, 0.75])
+        self.assertArrayAlmostEqual(bs.kpoints_cart_coords[31],
+                                    [0.64918757, 1.29837513, 0.0])
+        self.assertEqual(bs.kpoints_labels[31], "W")
+        self.assertEqual(bs.get_equivalent_kpoints(31),
+                         [i for i, l in enumerate(bs.kpoints_labels) if l == "W"])
+        self.assertIsNone(bs._kpoints)
+
+        kpoints = bs.kpoints
+        self.assertIs(kpoints, bs.kpoints)
+        self.assertEqual([k.label for k in kpoints], bs.kpoints_labels)
+        self.assertArrayAlmostEqual([k.frac_coords for k in kpoints],
+                                    bs.kpoints_frac_coords)
+
     def test_get_branch(self):
         self.assertAlmostEqual(self.bs2.get_branch(110)[0]['name'], "U-W")
 
@@ -153,6 +153,34 @@ class CompleteDosTest(unittest.TestCase):
                                1.756888888888886, 7)
         self.assertRaises(ValueError, dos.get_interpolated_value, 1000)
 
+    def test_dense_pdos(self):
+        dos = self.dos
+        dense = CompleteDos(dos.structure, dos, dos.pdos, dense_pdos=True)
+        self.assertIsNone(dos.pdos_tensor)
+        self.assertEqual(dense.pdos_tensor.shape,
+                         (len(dos.structure), len(dense.pdos_orbitals), 2, 301))
+        site = dos.structure[4]
+        # The pdos are views on the tensor.
+        i, j = dense.pdos_sites.index(site), dense.pdos_orbitals.index(Orbital.dxy)
+        self.assertTrue(np.shares_memory(dense.pdos[site][Orbital.dxy][Spin.up],
+                                         dense.pdos_tensor[i, j, 0]))
+        self.assertTrue(np.allclose(dense.pdos[site][Orbital.dxy][Spin.down],
+                                    dos.pdos[site][Orbital.dxy][Spin.down]))
+
+        def assert_same(d1, d2):
+            self.assertEqual(set(d1.keys()), set(d2.keys()))
+            for k in d1:
+                for spin in [Spin.up, Spin.down]:
+                    self.assertTrue(np.allclose(d1[k].densities[spin], d2[k].densities[spin]))
+
+        assert_same(dense.get_spd_dos(), dos.get_spd_dos())
+        assert_same(dense.get_element_dos(), dos.get_element_dos())
+        for el in dos.structure.composition.elements:
+            assert_same(dense.get_element_spd_dos(el), dos.get_element_spd_dos(el))
+        assert_same(dense.get_site_spd_dos(site), dos.get_site_spd_dos(site))
+        assert_same(dense.get_site_t2g_eg_resolved_dos(site), dos.get_site_t2g_eg_resolved_dos(site))
+        assert_same({0: dense.get_site_dos(site)}, {0: dos.get_site_dos(site)})
+
     def test_to_from_dict(self):
         d = self.dos.as_dict()
         dos = CompleteDos.from_dict(d)
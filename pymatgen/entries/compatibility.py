@@ -7,8 +7,11 @@ functionals.
 """
 
 import abc
+import itertools
+import math
 import os
 import warnings
+from multiprocessing import Pool
 from collections import defaultdict
 from typing import Optional, Sequence, Union, List
 
@@ -27,6 +30,7 @@ from pymatgen.entries.computed_entries import (CompositionEnergyAdjustment,
                                                ConstantEnergyAdjustment,
                                                TemperatureEnergyAdjustment)
 from pymatgen.io.vasp.sets import MITRelaxSet, MPRelaxSet
+from pymatgen.util.sequence import get_chunks
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 MU_H2O = -2.4583  # Free energy of formation of water, eV/H2O, used by MaterialsProjectAqueousCompatibility
@@ -569,7 +573,6 @@ class Compatibility(MSONable, metaclass=abc.ABCMeta):
         processed_entry_list = []
 
         for entry in entries:
-            ignore_entry = False
             # if clean is True, remove all previous adjustments from the entry
             if clean:
                 entry.energy_adjustments = []
@@ -578,36 +581,47 @@ class Compatibility(MSONable, metaclass=abc.ABCMeta):
             try:
                 adjustments = self.get_adjustments(entry)
             except CompatibilityError as exc:
-                ignore_entry = True
                 print(exc)
                 continue
 
-            for ea in adjustments:
-                # Has this correction already been applied?
-                if (ea.name, ea.cls, ea.value) in [(ea.name, ea.cls, ea.value) for ea in entry.energy_adjustments]:
-                    # we already applied this exact correction. Do nothing.
-                    pass
-                elif (ea.name, ea.cls) in [(ea.name, ea.cls) for ea in entry.energy_adjustments]:
-                    # we already applied a correction with the same name
-                    # but a different value. Something is wrong.
-                    ignore_entry = True
-                    warnings.warn("Entry {} already has an energy adjustment called {}, but its "
-                                  "value differs from the value of {:.3f} calculated here. This "
-                                  "Entry will be discarded."
-                                  .format(entry.entry_id,
-                                          ea.name,
-                                          ea.value
-                                          )
-                                  )
-                else:
-                    # Add the correction to the energy_adjustments list
-                    entry.energy_adjustments.append(ea)
-
-            if not ignore_entry:
+            if self._apply_adjustments(entry, adjustments):
                 processed_entry_list.append(entry)
 
         return processed_entry_list
 
+    @staticmethod
+    def _apply_adjustments(entry, adjustments):
+        """
+        Adds energy adjustments to an entry, unless they were already applied.
+
+        Returns:
+            (bool) False if the entry already has an adjustment with the same
+            name but a different value and must be discarded, True otherwise.
+        """
+        ignore_entry = False
+        for ea in adjustments:
+            # Has this correction already been applied?
+            if (ea.name, ea.cls, ea.value) in [(ea.name, ea.cls, ea.value) for ea in entry.energy_adjustments]:
+                # we already applied this exact correction. Do nothing.
+                pass
+            elif (ea.name, ea.cls) in [(ea.name, ea.cls) for ea in entry.energy_adjustments]:
+                # we already applied a correction with the same name
+                # but a different value. Something is wrong.
+                ignore_entry = True
+                warnings.warn("Entry {} already has an energy adjustment called {}, but its "
+                              "value differs from the value of {:.3f} calculated here. This "
+                              "Entry will be discarded."
+                              .format(entry.entry_id,
+                                      ea.name,
+                                      ea.value
+                                      )
+                              )
+            else:
+                # Add the correction to the energy_adjustments list
+                entry.energy_adjustments.append(ea)
+
+        return not ignore_entry
+
     @staticmethod
     def explain(entry):
         """
@@ -921,28 +935,157 @@ class MaterialsProject2020Compatibility(Compatibility):
         Raises:
             CompatibilityError if the entry is not compatible
         """
+        return self._get_adjustments(entry)
+
+    def process_entries(self, entries: Union[ComputedEntry, list], clean: bool = True, nproc: Optional[int] = None):
+        """
+        Process a sequence of entries with the MP2020 correction scheme. Note
+        that this method will change the data of the original entries.
+
+        Entries are grouped by their POTCARs, chemical system, anion types,
+        oxidation states and Hubbard U values, and the POTCAR check and
+        corrections are computed once per group. Only the element amounts
+        differ between the entries of a group.
+
+        Args:
+            entries: ComputedEntry or [ComputedEntry]
+            clean: bool, whether to remove any previously-applied energy adjustments.
+                If True, all EnergyAdjustment are removed prior to processing the Entry.
+                Default is True.
+            nproc (int): Number of processes used to compute the adjustments
+                of chunks of entries in parallel. Only worth it for very large
+                sets of entries, or entries whose anion types must be
+                determined from their structures. Defaults to None, i.e., no
+                parallelization.
+
+        Returns:
+            A list of adjusted entries.  Entries in the original list which
+            are not compatible are excluded.
+        """
+        # convert input arg to a list if not already
+        if isinstance(entries, ComputedEntry):
+            entries = [entries]
+        entries = list(entries)
+
+        # if clean is True, remove all previous adjustments from the entries
+        if clean:
+            for entry in entries:
+                entry.energy_adjustments = []
+
+        if nproc is not None and len(entries) > 1:
+            chunk_size = int(math.ceil(len(entries) / (4 * nproc)))
+            with Pool(nproc) as p:
+                all_adjustments = list(itertools.chain.from_iterable(
+                    p.map(self.get_all_adjustments, get_chunks(entries, size=chunk_size))))
+        else:
+            all_adjustments = self.get_all_adjustments(entries)
+
+        processed_entry_list = []
+        for entry, adjustments in zip(entries, all_adjustments):
+            if isinstance(adjustments, CompatibilityError):
+                print(adjustments)
+                continue
+            if self._apply_adjustments(entry, adjustments):
+                processed_entry_list.append(entry)
+
+        return processed_entry_list
+
+    def get_all_adjustments(self, entries: Sequence[ComputedEntry]):
+        """
+        Batch version of get_adjustments, which computes the POTCAR check and
+        corrections once per group of entries with the same POTCARs, chemical
+        system, anion types, oxidation states and Hubbard U values.
+
+        Args:
+            entries: A list of ComputedEntry or ComputedStructureEntry objects.
+
+        Returns:
+            A list with, for each entry, either the list of EnergyAdjustment to
+            be applied to it, or the CompatibilityError raised if it is not
+            compatible.
+        """
+        cache: dict = {}
+        all_adjustments = []
+        for entry in entries:
+            try:
+                all_adjustments.append(self._get_adjustments(entry, cache))
+            except CompatibilityError as exc:
+                all_adjustments.append(exc)
+        return all_adjustments
+
+    def _get_adjustments(self, entry, cache=None):
+        """
+        Computes the adjustments of an entry. Results of the POTCAR check and
+        corrections for each group of entries are stored in cache if given.
+        """
+        cache = {} if cache is None else cache
         if entry.parameters.get("run_type") not in ["GGA", "GGA+U"]:
             raise CompatibilityError("Entry {} has invalid run type {}. Must be GGA or GGA+U. Discarding."
                                      .format(entry.entry_id,
                                              entry.parameters.get("run_type")))
 
+        comp = entry.composition
+
         # check the POTCAR symbols
         # this should return ufloat(0, 0) or raise a CompatibilityError or ValueError
-        pc = PotcarCorrection(MPRelaxSet, check_hash=self.check_potcar_hash)
-        pc.get_correction(entry)
+        potcar_spec = entry.parameters.get("potcar_spec")
+        if potcar_spec:
+            psp = tuple((d.get("titel"), d.get("hash")) for d in potcar_spec if d)
+        else:
+            psp = tuple(entry.parameters.get("potcar_symbols") or ())
+        key = ("potcar", psp, frozenset(comp.elements))
+        if key not in cache:
+            if "potcar_check" not in cache:
+                cache["potcar_check"] = PotcarCorrection(MPRelaxSet, check_hash=self.check_potcar_hash)
+            try:
+                cache["potcar_check"].get_correction(entry)
+                cache[key] = None
+            except CompatibilityError as exc:
+                cache[key] = exc
+        if cache[key] is not None:
+            raise cache[key]
+
+        # Skip single elements
+        if len(comp) == 1:
+            return []
+
+        sf_type, ox_type = self._get_anion_types(entry)
+        oxidation_states = entry.data.get("oxidation_states")
+        calc_u = entry.parameters.get("hubbards", None)
+        calc_u = {} if calc_u is None else calc_u
+        key = ("corrections", tuple(comp.elements), sf_type, ox_type,
+               frozenset(oxidation_states.items()) if oxidation_states else None,
+               frozenset(calc_u.items()))
+        if key not in cache:
+            try:
+                cache[key] = self._get_corrections(comp.elements, sf_type, ox_type, oxidation_states, calc_u)
+            except CompatibilityError as exc:
+                cache[key] = exc
+        if isinstance(cache[key], CompatibilityError):
+            raise cache[key]
 
         # apply energy adjustments
         adjustments: List[CompositionEnergyAdjustment] = []
+        for sym, adj_per_atom, uncertainty_per_atom, name in cache[key]:
+            adjustments.append(CompositionEnergyAdjustment(adj_per_atom,
+                                                           comp[sym],
+                                                           uncertainty_per_atom=uncertainty_per_atom,
+                                                           name=name
+                                                           ))
+        return adjustments
 
+    def _get_anion_types(self, entry):
+        """
+        Determines the sulfide and oxide types of an entry.
+
+        Returns:
+            (sulfide type, oxide type), where each is None if the entry does
+            not contain S or O, respectively.
+        """
         comp = entry.composition
         rform = comp.reduced_formula
-        # sorted list of elements, ordered by electronegativity
-        elements = sorted([el for el in comp.elements if comp[el] > 0], key=lambda el: el.X)
-
-        # Skip single elements
-        if len(comp) == 1:
-            return adjustments
 
+        sf_type = None
         # Check for sulfide corrections
         if Element("S") in comp:
             sf_type = "sulfide"
@@ -955,13 +1098,7 @@ class MaterialsProject2020Compatibility(Compatibility):
             if sf_type == "polysulfide":
                 sf_type = "sulfide"
 
-            if sf_type == "sulfide":
-                adjustments.append(CompositionEnergyAdjustment(self.comp_correction["S"],
-                                                               comp["S"],
-                                                               uncertainty_per_atom=self.comp_errors["S"],
-                                                               name="MP2020 anion correction (S)"
-                                                               ))
-
+        ox_type = None
         # Check for oxide, peroxide, superoxide, and ozonide corrections.
         if Element("O") in comp:
             if self.correct_peroxide:
@@ -1009,50 +1146,61 @@ class MaterialsProject2020Compatibility(Compatibility):
             if ox_type == "hydroxide":
                 ox_type = "oxide"
 
-            adjustments.append(
-                        CompositionEnergyAdjustment(self.comp_correction[ox_type],
-                                                    comp["O"],
-                                                    uncertainty_per_atom=self.comp_errors[ox_type],
-                                                    name="MP2020 anion correction ({})".format(ox_type)
-                                                    )
-                                )
+        return sf_type, ox_type
+
+    def _get_corrections(self, elements, sf_type, ox_type, oxidation_states, calc_u):
+        """
+        Computes the corrections for a chemical system.
+
+        Returns:
+            List of (element symbol, correction per atom, uncertainty per atom,
+            name) of the corrections.
+
+        Raises:
+            CompatibilityError if a U value is invalid.
+        """
+        corrections = []
+        # sorted list of elements, ordered by electronegativity
+        sorted_elements = sorted(elements, key=lambda el: el.X)
+
+        if sf_type == "sulfide":
+            corrections.append(("S", self.comp_correction["S"], self.comp_errors["S"],
+                                "MP2020 anion correction (S)"))
+
+        if ox_type is not None:
+            corrections.append(("O", self.comp_correction[ox_type], self.comp_errors[ox_type],
+                                "MP2020 anion correction ({})".format(ox_type)))
 
         # Check for anion corrections
         for anion in ["Br", "I", "Se", "Si", "Sb", "Te", "H", "N", "F", "Cl"]:
-            if Element(anion) in comp and anion in self.comp_correction:
+            if Element(anion) in sorted_elements and anion in self.comp_correction:
                 apply_correction = False
                 # only apply anion corrections if the element is an anion
                 # first check for a pre-populated oxidation states key
                 # the key is expected to comprise a dict corresponding to the first element output by
                 # Composition.oxi_state_guesses(), e.g. {'Al': 3.0, 'S': 2.0, 'O': -2.0} for 'Al2SO4'
-                if entry.data.get("oxidation_states"):
-                    if entry.data["oxidation_states"].get(anion, 0) < 0:
+                if oxidation_states:
+                    if oxidation_states.get(anion, 0) < 0:
                         apply_correction = True
                 else:
                     # if the oxidation_states key is not populated, only apply the correction if the anion
                     # is the most electronegative element
-                    most_electroneg = elements[-1].symbol
+                    most_electroneg = sorted_elements[-1].symbol
 
                     if anion == most_electroneg:
                         apply_correction = True
 
                 if apply_correction:
-                    adjustments.append(
-                            CompositionEnergyAdjustment(self.comp_correction[anion],
-                                                        comp[anion],
-                                                        uncertainty_per_atom=self.comp_errors[anion],
-                                                        name="MP2020 anion correction"
-                                                        )
-                                    )
+                    corrections.append((anion, self.comp_correction[anion], self.comp_errors[anion],
+                                        "MP2020 anion correction"))
+
         # GGA / GGA+U mixing scheme corrections
-        calc_u = entry.parameters.get("hubbards", None)
-        calc_u = defaultdict(int) if calc_u is None else calc_u
-        most_electroneg = elements[-1].symbol
+        most_electroneg = sorted_elements[-1].symbol
         ucorr = self.u_corrections.get(most_electroneg, defaultdict(float))
         usettings = self.u_settings.get(most_electroneg, defaultdict(float))
         uerrors = self.u_errors.get(most_electroneg, defaultdict(float))
 
-        for el in comp.elements:
+        for el in elements:
             sym = el.symbol
             # Check for bad U values
             if calc_u.get(sym, 0) != usettings.get(sym, 0):
@@ -1060,15 +1208,10 @@ class MaterialsProject2020Compatibility(Compatibility):
                     "Invalid U value of {:.1f} on {}".format(calc_u.get(sym, 0), sym)
                 )
             if sym in ucorr:
-                adjustments.append(
-                            CompositionEnergyAdjustment(ucorr[sym],
-                                                        comp[el],
-                                                        uncertainty_per_atom=uerrors[sym],
-                                                        name="MP2020 GGA/GGA+U mixing correction ({})".format(sym)
-                                                        )
-                                    )
+                corrections.append((sym, ucorr[sym], uerrors[sym],
+                                    "MP2020 GGA/GGA+U mixing correction ({})".format(sym)))
 
-        return adjustments
+        return corrections
 
 
 class MITCompatibility(CorrectionsList):
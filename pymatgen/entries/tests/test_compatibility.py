@@ -2,6 +2,7 @@
 # Copyright (c) Pymatgen Development Team.
 # Distributed under the terms of the MIT License.
 
+import copy
 import warnings
 
 """
@@ -1063,6 +1064,32 @@ class MaterialsProject2020CompatibilityTest(unittest.TestCase):
         entries = self.compat.process_entries([self.entry1, self.entry2, self.entry3])
         self.assertEqual(len(entries), 2)
 
+    def test_process_entries_batch(self):
+        entries = [self.entry1, self.entry2, self.entry3, self.entry_sulfide]
+        expected = []
+        for e in entries:
+            e = copy.deepcopy(e)
+            try:
+                expected.append(self.compat.get_adjustments(e))
+            except CompatibilityError:
+                expected.append(None)
+
+        all_adjustments = self.compat.get_all_adjustments(entries)
+        self.assertEqual(len(all_adjustments), len(entries))
+        for adjustments, exp in zip(all_adjustments, expected):
+            if exp is None:
+                self.assertIsInstance(adjustments, CompatibilityError)
+            else:
+                self.assertEqual([(ea.name, ea.value, ea.uncertainty) for ea in adjustments],
+                                 [(ea.name, ea.value, ea.uncertainty) for ea in exp])
+
+        for nproc in [None, 2]:
+            processed = self.compat.process_entries(copy.deepcopy(entries), nproc=nproc)
+            self.assertEqual([e.composition.reduced_formula for e in processed],
+                             ["Fe2O3", "Fe3O4", "FeS"])
+            self.assertAlmostEqual(processed[0].correction, -2.182 * 2 - 0.74 * 3)
+            self.assertAlmostEqual(processed[1].correction, -2.182 * 3 - 0.74 * 4)
+
     def test_msonable(self):
         compat_dict = self.compat.as_dict()
         decoder = MontyDecoder()
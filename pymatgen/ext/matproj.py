@@ -15,10 +15,14 @@ https://www.materialsproject.org/dashboard.
 import sys
 import itertools
 import json
+import os
 import platform
 import re
+import threading
 import warnings
+import hashlib
 from time import sleep
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, unique
 from collections import defaultdict
 
@@ -177,6 +181,7 @@ class MPRester:
 
         self.session = requests.Session()
         self.session.headers = {"x-api-key": self.api_key}
+        self._thread_sessions = threading.local()
         if include_user_agent:
             pymatgen_info = "pymatgen/" + pmg_version
             python_info = "Python/{}.{}.{}".format(
@@ -230,20 +235,56 @@ class MPRester:
         """
         self.session.close()
 
-    def _make_request(self, sub_url, payload=None, method="GET", mp_decode=True):
+    def _get_session(self):
+        """
+        Returns the session of the current thread. Worker threads of
+        concurrent queries get their own session, with the same headers as
+        the main session.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self.session
+        session = getattr(self._thread_sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers = self.session.headers.copy()
+            self._thread_sessions.session = session
+        return session
+
+    def _get_cache_path(self, cache_dir, sub_url, payload, method):
+        key = json.dumps([self.preamble, sub_url, method, payload], sort_keys=True)
+        return os.path.join(cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _make_request(self, sub_url, payload=None, method="GET", mp_decode=True, cache_dir=None):
         response = None
         url = self.preamble + sub_url
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = self._get_cache_path(cache_dir, sub_url, payload, method)
         try:
-            if method == "POST":
-                response = self.session.post(url, data=payload, verify=True)
+            if cache_path is not None and os.path.exists(cache_path):
+                with open(cache_path, "rt") as f:
+                    text = f.read()
             else:
-                response = self.session.get(url, params=payload, verify=True)
-            if response.status_code in [200, 400]:
+                session = self._get_session()
+                if method == "POST":
+                    response = session.post(url, data=payload, verify=True)
+                else:
+                    response = session.get(url, params=payload, verify=True)
+                text = response.text
+            if response is None or response.status_code in [200, 400]:
                 if mp_decode:
-                    data = json.loads(response.text, cls=MontyDecoder)
+                    data = json.loads(text, cls=MontyDecoder)
                 else:
-                    data = json.loads(response.text)
+                    data = json.loads(text)
                 if data["valid_response"]:
+                    if cache_path is not None and response is not None:
+                        # Write to a temporary file first, so that an
+                        # interrupted query never leaves a partial response.
+                        os.makedirs(cache_dir, exist_ok=True)
+                        tmp_path = "{}.{}.tmp".format(cache_path, threading.get_ident())
+                        with open(tmp_path, "wt") as f:
+                            f.write(text)
+                        os.replace(tmp_path, cache_path)
                     if data.get("warning"):
                         warnings.warn(data["warning"])
                     return data["response"]
@@ -929,6 +970,8 @@ class MPRester:
         chunk_size=500,
         max_tries_per_chunk=5,
         mp_decode=True,
+        num_workers=1,
+        cache_dir=None,
     ):
         r"""
 
@@ -988,6 +1031,14 @@ class MPRester:
             mp_decode (bool): Whether to do a decoding to a Pymatgen object
                 where possible. In some cases, it might be useful to just get
                 the raw python dict, i.e., set to False.
+            num_workers (int): Number of chunks fetched concurrently. Defaults
+                to 1.
+            cache_dir (str): Directory in which the responses are cached,
+                keyed by the endpoint and query payload. Each chunk is written
+                as soon as it is fetched, so an interrupted query that is run
+                again with the same cache_dir resumes from the chunks already
+                fetched. Delete the directory to fetch fresh data. Defaults to
+                None, i.e., no caching.
 
         Returns:
             List of results. E.g.,
@@ -996,6 +1047,37 @@ class MPRester:
             {u'formula': {u'K': 1, u'O': 3.0}},
             ...]
         """
+        return list(
+            self.iter_query(
+                criteria,
+                properties,
+                chunk_size=chunk_size,
+                max_tries_per_chunk=max_tries_per_chunk,
+                mp_decode=mp_decode,
+                num_workers=num_workers,
+                cache_dir=cache_dir,
+            )
+        )
+
+    def iter_query(
+        self,
+        criteria,
+        properties,
+        chunk_size=500,
+        max_tries_per_chunk=5,
+        mp_decode=True,
+        num_workers=1,
+        cache_dir=None,
+    ):
+        """
+        Same as query, but returns a generator of the results, which yields
+        the results of each chunk as soon as it is fetched (in order) instead
+        of keeping all the results in memory. See query for the description of
+        the arguments.
+
+        Yields:
+            Results, e.g., {u'formula': {u'O': 1, u'Li': 2.0}}.
+        """
         if not isinstance(criteria, dict):
             criteria = self.parse_criteria(criteria)
         payload = {
@@ -1003,43 +1085,46 @@ class MPRester:
             "properties": json.dumps(properties),
         }
         if chunk_size == 0:
-            return self._make_request(
-                "/query", payload=payload, method="POST", mp_decode=mp_decode
+            yield from self._make_request(
+                "/query", payload=payload, method="POST", mp_decode=mp_decode,
+                cache_dir=cache_dir,
             )
+            return
 
         count_payload = payload.copy()
         count_payload["options"] = json.dumps({"count_only": True})
-        num_results = self._make_request("/query", payload=count_payload, method="POST")
+        num_results = self._make_request(
+            "/query", payload=count_payload, method="POST", cache_dir=cache_dir
+        )
         if num_results <= chunk_size:
-            return self._make_request(
-                "/query", payload=payload, method="POST", mp_decode=mp_decode
+            yield from self._make_request(
+                "/query", payload=payload, method="POST", mp_decode=mp_decode,
+                cache_dir=cache_dir,
             )
+            return
 
-        data = []
         mids = [
             d["material_id"]
-            for d in self.query(criteria, ["material_id"], chunk_size=0)
+            for d in self.query(criteria, ["material_id"], chunk_size=0, cache_dir=cache_dir)
         ]
-        chunks = get_chunks(mids, size=chunk_size)
+        chunks = list(get_chunks(mids, size=chunk_size))
         progress_bar = PBar(total=len(mids))
-        for chunk in chunks:
+
+        def get_chunk(chunk):
             chunk_criteria = criteria.copy()
             chunk_criteria.update({"material_id": {"$in": chunk}})
             num_tries = 0
             while num_tries < max_tries_per_chunk:
                 try:
-                    data.extend(
-                        self.query(
-                            chunk_criteria,
-                            properties,
-                            chunk_size=0,
-                            mp_decode=mp_decode,
-                        )
+                    return self.query(
+                        chunk_criteria,
+                        properties,
+                        chunk_size=0,
+                        mp_decode=mp_decode,
+                        cache_dir=cache_dir,
                     )
-                    break
                 except MPRestError as e:
-                    # pylint: disable=E1101
-                    match = re.search(r"error status code (\d+)", e.message)
+                    match = re.search(r"error status code (\d+)", str(e))
                     if match:
                         if not match.group(1).startswith("5"):
                             raise e
@@ -1051,8 +1136,27 @@ class MPRester:
                             )
                         )
                         sleep(5)
-            progress_bar.update(len(chunk))
-        return data
+            return []
+
+        if num_workers <= 1:
+            for chunk in chunks:
+                yield from get_chunk(chunk)
+                progress_bar.update(len(chunk))
+            return
+
+        # Keep a bounded number of chunks in flight, and yield them in order.
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = []
+            chunk_iter = iter(chunks)
+            for chunk in itertools.islice(chunk_iter, 2 * num_workers):
+                futures.append((chunk, executor.submit(get_chunk, chunk)))
+            while futures:
+                chunk, future = futures.pop(0)
+                data = future.result()
+                for next_chunk in itertools.islice(chunk_iter, 1):
+                    futures.append((next_chunk, executor.submit(get_chunk, next_chunk)))
+                yield from data
+                progress_bar.update(len(chunk))
 
     def submit_structures(
         self,
@@ -2,10 +2,18 @@
 # Copyright (c) Pymatgen Development Team.
 # Distributed under the terms of the MIT License.
 import re
+import os
+import json
+import threading
 import unittest
 import warnings
 import random
+import socketserver
 import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+
+from monty.tempfile import ScratchDir
 import ruamel.yaml as yaml
 from pymatgen import SETTINGS, __version__ as pmg_version, SETTINGS_FILE
 from pymatgen.ext.matproj import MPRester, MPRestError, TaskType
@@ -572,5 +580,103 @@ class MPResterTest(PymatgenTest):
         self.assertIsInstance(d["MAPI_DB_VERSION"]["LOG"][db_version], int)
 
 
+class _StubMAPIHandler(BaseHTTPRequestHandler):
+    """
+    Serves /query from a list of fake documents, failing on the materials in
+    the failing set of the server.
+    """
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        payload = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+        criteria = json.loads(payload["criteria"])
+        properties = json.loads(payload["properties"])
+        docs = self.server.docs
+        if "material_id" in criteria:
+            mids = set(criteria["material_id"]["$in"])
+            if mids & self.server.failing:
+                self.send_response(404)
+                self.end_headers()
+                return
+            docs = [d for d in docs if d["material_id"] in mids]
+        self.server.requests.append(payload)
+        if "options" in payload:
+            response = len(docs)
+        else:
+            response = [{p: d[p] for p in properties} for d in docs]
+        body = json.dumps({"valid_response": True, "response": response}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, HTTPServer):
+    # http.server.ThreadingHTTPServer is only available from python 3.7.
+    daemon_threads = True
+
+
+class MPResterStubTest(unittest.TestCase):
+    def setUp(self):
+        self.server = _Server(("127.0.0.1", 0), _StubMAPIHandler)
+        self.server.docs = [
+            {"material_id": "mp-{}".format(i), "energy": -float(i)} for i in range(20)
+        ]
+        self.server.requests = []
+        self.server.failing = set()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        warnings.simplefilter("ignore")
+        self.rester = MPRester(
+            "foo",
+            endpoint="http://127.0.0.1:{}".format(self.server.server_address[1]),
+            notify_db_version=False,
+        )
+
+    def tearDown(self):
+        warnings.simplefilter("default")
+        self.rester.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_query(self):
+        props = ["material_id", "energy"]
+        data = self.rester.query({"nelements": 2}, props, chunk_size=3, num_workers=4)
+        self.assertEqual(data, self.server.docs)
+        data = list(self.rester.iter_query({"nelements": 2}, props, chunk_size=3))
+        self.assertEqual(data, self.server.docs)
+
+    def test_cache_and_resume(self):
+        props = ["material_id", "energy"]
+        with ScratchDir("."):
+            self.server.failing = {"mp-10"}
+            self.assertRaises(
+                MPRestError, self.rester.query, {"nelements": 2}, props,
+                chunk_size=3, cache_dir="cache",
+            )
+            # count, ids and the chunks before the failing one.
+            self.assertEqual(len(self.server.requests), 2 + 3)
+
+            self.server.failing = set()
+            self.server.requests = []
+            data = self.rester.query(
+                {"nelements": 2}, props, chunk_size=3, num_workers=2, cache_dir="cache"
+            )
+            self.assertEqual(data, self.server.docs)
+            # Only the chunks that were not fetched before are requested.
+            self.assertEqual(len(self.server.requests), 4)
+            self.assertFalse(any(f.endswith(".tmp") for f in os.listdir("cache")))
+
+            self.server.requests = []
+            data = self.rester.query(
+                {"nelements": 2}, props, chunk_size=3, cache_dir="cache"
+            )
+            self.assertEqual(data, self.server.docs)
+            self.assertEqual(self.server.requests, [])
+
+
 if __name__ == "__main__":
     unittest.main()
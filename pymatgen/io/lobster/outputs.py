@@ -9,6 +9,7 @@ on LOBSTER see www.cohp.de.
 
 import collections
 import fnmatch
+import itertools
 import os
 import re
 import warnings
@@ -35,6 +36,44 @@ __date__ = "Dec 13, 2017"
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+def _read_numeric_block(f, num_columns=None, num_rows=None, usecols=None, chunk_size=100000):
+    """
+    Reads a block of whitespace-separated numbers from an open file. The
+    lines are parsed in chunks with a single call to np.fromstring each, and
+    only the requested columns of every chunk are kept, so that the memory
+    needed for large files is limited to the data that are actually used.
+
+    Args:
+        f: Open file (in text mode), positioned at the start of the block.
+        num_columns: Number of columns in the block. If None, it is
+            determined from the number of rows, which must then be given.
+        num_rows: Number of rows to read. Defaults to None, i.e., everything
+            until the end of the file is read.
+        usecols: Indices of the columns to keep. Defaults to all columns.
+        chunk_size: Number of lines parsed at once.
+
+    Returns:
+        numpy array of shape (num_rows, len(usecols)).
+    """
+    chunks = []
+    rows_left = num_rows
+    while rows_left is None or rows_left > 0:
+        n = chunk_size if rows_left is None else min(chunk_size, rows_left)
+        lines = list(itertools.islice(f, n))
+        if not lines:
+            break
+        chunk = np.fromstring("".join(lines), sep=" ")
+        chunk = chunk.reshape(-1, num_columns) if num_columns is not None else chunk.reshape(len(lines), -1)
+        if usecols is not None:
+            chunk = chunk[:, usecols]
+        chunks.append(chunk)
+        if rows_left is not None:
+            rows_left -= len(lines)
+    if not chunks:
+        return np.zeros((0, len(usecols) if usecols is not None else num_columns or 0))
+    return np.concatenate(chunks)
+
+
 class Cohpcar:
     """
     Class to read COHPCAR/COOPCAR files generated by LOBSTER.
@@ -72,13 +111,25 @@ class Cohpcar:
 
     """
 
-    def __init__(self, are_coops: bool = False, filename: str = None):
+    def __init__(self, are_coops: bool = False, filename: str = None, bonds: Optional[List[str]] = None,
+                 orbital_resolved: bool = True, cache_file: str = None):
         """
         Args:
             are_coops: Determines if the file is a list of COHPs or COOPs.
               Default is False for COHPs.
             filename: Name of the COHPCAR file. If it is None, the default
               file name will be chosen, depending on the value of are_coops.
+            bonds: Labels of the bonds (as in cohp_data, e.g. ["1", "5"]) to
+              keep. The average is always kept. Defaults to None, i.e., all
+              bonds are read.
+            orbital_resolved: If False, the orbital-resolved COHPs are
+              skipped and orb_res_cohp is None. Default is True.
+            cache_file: Name of a binary (.npy) cache of the numerical data.
+              If it exists, is newer than filename and has the same shape and
+              first row of data as filename, the data are memory-mapped from
+              it instead of parsing the text file. Otherwise, all data are
+              parsed and written to it. Useful for large files that are read
+              repeatedly.
         """
         self.are_coops = are_coops
         if filename is None:
@@ -86,78 +137,129 @@ class Cohpcar:
                 else "COHPCAR.lobster"
 
         with zopen(filename, "rt") as f:
-            contents = f.read().split("\n")
-
-        # The parameters line is the second line in a COHPCAR file. It
-        # contains all parameters that are needed to map the file.
-        parameters = contents[1].split()
-        # Subtract 1 to skip the average
-        num_bonds = int(parameters[0]) - 1
-        self.efermi = float(parameters[-1])
-        if int(parameters[1]) == 2:
-            spins = [Spin.up, Spin.down]
-            self.is_spin_polarized = True
-        else:
-            spins = [Spin.up]
-            self.is_spin_polarized = False
-
-        # The COHP data start in row num_bonds + 3
-        data = np.array([np.array(row.split(), dtype=float) for row in contents[num_bonds + 3:]]).transpose()
-        data = np.array([np.array(row.split(), dtype=float) for row in contents[num_bonds + 3:]]).transpose()
-        self.energies = data[0]
-        cohp_data = {"average": {"COHP": {spin: data[1 + 2 * s * (num_bonds + 1)]
-                                          for s, spin in enumerate(spins)},
-                                 "ICOHP": {spin: data[2 + 2 * s * (num_bonds + 1)]
-                                           for s, spin in enumerate(spins)}}}  # type: Dict[Any, Any]
-
-        orb_cohp = {}  # type: Dict[str, Any]
-        # present for Lobster versions older than Lobster 2.2.0
-        veryold = False
-        # the labeling had to be changed: there are more than one COHP for each atom combination
-        # this is done to make the labeling consistent with ICOHPLIST.lobster
-        bondnumber = 0
-        for bond in range(num_bonds):
-            bond_data = self._get_bond_data(contents[3 + bond])
+            contents = [f.readline() for _ in range(2)]
+            # The parameters line is the second line in a COHPCAR file. It
+            # contains all parameters that are needed to map the file.
+            parameters = contents[1].split()
+            # Subtract 1 to skip the average
+            num_bonds = int(parameters[0]) - 1
+            num_energies = int(parameters[2])
+            self.efermi = float(parameters[-1])
+            if int(parameters[1]) == 2:
+                spins = [Spin.up, Spin.down]
+                self.is_spin_polarized = True
+            else:
+                spins = [Spin.up]
+                self.is_spin_polarized = False
+            # The bond headers are followed by the COHP data, which start in
+            # row num_bonds + 3
+            contents += [f.readline().rstrip("\n") for _ in range(num_bonds + 1)]
+
+            # Only the column indices are stored in cohp_data and orb_cohp
+            # at first. They are replaced by the data once it is known which
+            # columns are needed.
+            cohp_data = {"average": {"COHP": {spin: 1 + 2 * s * (num_bonds + 1)
+                                              for s, spin in enumerate(spins)},
+                                     "ICOHP": {spin: 2 + 2 * s * (num_bonds + 1)
+                                               for s, spin in enumerate(spins)}}}  # type: Dict[Any, Any]
+
+            orb_cohp = {}  # type: Dict[str, Any]
+            # present for Lobster versions older than Lobster 2.2.0
+            veryold = False
+            # the labeling had to be changed: there are more than one COHP for each atom combination
+            # this is done to make the labeling consistent with ICOHPLIST.lobster
+            bondnumber = 0
+            for bond in range(num_bonds):
+                bond_data = self._get_bond_data(contents[3 + bond])
 
-            label = str(bondnumber)
+                label = str(bondnumber)
 
-            orbs = bond_data["orbitals"]
-            cohp = {spin: data[2 * (bond + s * (num_bonds + 1)) + 3]
-                    for s, spin in enumerate(spins)}
+                orbs = bond_data["orbitals"]
+                cohp = {spin: 2 * (bond + s * (num_bonds + 1)) + 3
+                        for s, spin in enumerate(spins)}
 
-            icohp = {spin: data[2 * (bond + s * (num_bonds + 1)) + 4]
-                     for s, spin in enumerate(spins)}
-            if orbs is None:
-                bondnumber = bondnumber + 1
-                label = str(bondnumber)
-                cohp_data[label] = {"COHP": cohp, "ICOHP": icohp,
-                                    "length": bond_data["length"],
-                                    "sites": bond_data["sites"]}
-
-            elif label in orb_cohp:
-                orb_cohp[label].update(
-                    {bond_data["orb_label"]: {"COHP": cohp, "ICOHP": icohp, "orbitals": orbs,
-                                              "length": bond_data["length"], "sites": bond_data["sites"]}})
-            else:
-                # present for Lobster versions older than Lobster 2.2.0
-                if bondnumber == 0:
-                    veryold = True
-                if veryold:
-                    bondnumber += 1
+                icohp = {spin: 2 * (bond + s * (num_bonds + 1)) + 4
+                         for s, spin in enumerate(spins)}
+                if orbs is None:
+                    bondnumber = bondnumber + 1
                     label = str(bondnumber)
+                    cohp_data[label] = {"COHP": cohp, "ICOHP": icohp,
+                                        "length": bond_data["length"],
+                                        "sites": bond_data["sites"]}
+
+                elif label in orb_cohp:
+                    orb_cohp[label].update(
+                        {bond_data["orb_label"]: {"COHP": cohp, "ICOHP": icohp, "orbitals": orbs,
+                                                  "length": bond_data["length"], "sites": bond_data["sites"]}})
+                else:
+                    # present for Lobster versions older than Lobster 2.2.0
+                    if bondnumber == 0:
+                        veryold = True
+                    if veryold:
+                        bondnumber += 1
+                        label = str(bondnumber)
+
+                    orb_cohp[label] = {bond_data["orb_label"]: {"COHP": cohp,
+                                                                "ICOHP": icohp,
+                                                                "orbitals": orbs,
+                                                                "length": bond_data["length"],
+                                                                "sites": bond_data["sites"]}}
+
+            # present for lobster older than 2.2.0
+            if veryold:
+                for bond_str in orb_cohp:
+                    cohp_data[bond_str] = {"COHP": None, "ICOHP": None,
+                                           "length": bond_data["length"],
+                                           "sites": bond_data["sites"]}
+
+            if bonds is not None:
+                bond_labels = {str(b) for b in bonds}
+                cohp_data = {label: d for label, d in cohp_data.items()
+                             if label == "average" or label in bond_labels}
+                orb_cohp = {label: d for label, d in orb_cohp.items() if label in bond_labels}
+            if not orbital_resolved:
+                orb_cohp = {}
+
+            # Energies, plus the COHP and ICOHP columns that are kept.
+            columns = [0]
+            for d in list(cohp_data.values()) + [o for orbs in orb_cohp.values() for o in orbs.values()]:
+                for key in ["COHP", "ICOHP"]:
+                    if d[key] is not None:
+                        columns.extend(d[key].values())
+            columns = sorted(set(columns))
+            num_columns = 1 + 2 * len(spins) * (num_bonds + 1)
+            # The first row is compared with the cache, to detect a cache of
+            # another file with the same number of bonds and energies.
+            first_row = np.array(f.readline().split(), dtype=float)
+
+            data = None
+            if cache_file is not None and os.path.exists(cache_file) and \
+                    os.path.getmtime(cache_file) >= os.path.getmtime(filename):
+                # The data are stored column-wise, so that every COHP is a
+                # contiguous block of the memory-mapped file.
+                data = np.load(cache_file, mmap_mode="c")
+                if data.shape != (num_columns, num_energies) or not np.array_equal(data[:, 0], first_row):
+                    data = None
+            if data is not None:
+                rows = {col: col for col in columns}
+            elif cache_file is not None:
+                data = np.vstack([first_row, _read_numeric_block(f, num_columns, num_rows=num_energies - 1)]).T.copy()
+                # Saving to an open file keeps np.save from appending ".npy"
+                # to the name.
+                with open(cache_file, "wb") as fcache:
+                    np.save(fcache, data)
+                rows = {col: col for col in columns}
+            else:
+                data = np.vstack([first_row[columns],
+                                  _read_numeric_block(f, num_columns, num_rows=num_energies - 1,
+                                                      usecols=columns)]).T.copy()
+                rows = {col: i for i, col in enumerate(columns)}
 
-                orb_cohp[label] = {bond_data["orb_label"]: {"COHP": cohp,
-                                                            "ICOHP": icohp,
-                                                            "orbitals": orbs,
-                                                            "length": bond_data["length"],
-                                                            "sites": bond_data["sites"]}}
-
-        # present for lobster older than 2.2.0
-        if veryold:
-            for bond_str in orb_cohp:
-                cohp_data[bond_str] = {"COHP": None, "ICOHP": None,
-                                       "length": bond_data["length"],
-                                       "sites": bond_data["sites"]}
+        self.energies = data[rows[0]]
+        for d in list(cohp_data.values()) + [o for orbs in orb_cohp.values() for o in orbs.values()]:
+            for key in ["COHP", "ICOHP"]:
+                if d[key] is not None:
+                    d[key] = {spin: data[rows[col]] for spin, col in d[key].items()}
 
         self.orb_res_cohp = orb_cohp if orb_cohp else None
         self.cohp_data = cohp_data
@@ -404,23 +506,16 @@ class Doscar:
 
         tdensities = {}
         itdensities = {}
-        f = open(doscar)
-        natoms = int(f.readline().split()[0])
-        efermi = float([f.readline() for nn in range(4)][3].split()[17])
-        dos = []
-        orbitals = []
-        for atom in range(natoms + 1):
-            line = f.readline()
-            ndos = int(line.split()[2])
-            orbitals.append(line.split(';')[-1].split())
-            line = f.readline().split()
-            cdos = np.zeros((ndos, len(line)))
-            cdos[0] = np.array(line)
-            for nd in range(1, ndos):
-                line = f.readline().split()
-                cdos[nd] = np.array(line)
-            dos.append(cdos)
-        f.close()
+        with zopen(doscar, "rt") as f:
+            natoms = int(f.readline().split()[0])
+            efermi = float([f.readline() for nn in range(4)][3].split()[17])
+            dos = []
+            orbitals = []
+            for atom in range(natoms + 1):
+                line = f.readline()
+                ndos = int(line.split()[2])
+                orbitals.append(line.split(';')[-1].split())
+                dos.append(_read_numeric_block(f, num_rows=ndos))
         doshere = np.array(dos[0])
         if len(doshere[0, :]) == 5:
             self._is_spin_polarized = True
@@ -240,6 +240,42 @@ class CohpcarTest(PymatgenTest):
                              for orbs in self.cohp_Na2UO4.orb_res_cohp["49"]], axis=0)
         self.assertArrayAlmostEqual(tot_Na2UO4, icohp_Na2UO4, decimal=3)
 
+    def test_bonds_and_cache(self):
+        filename = os.path.join(test_dir, "COHPCAR.lobster.Na2UO4")
+        cohp = Cohpcar(filename=filename, bonds=["49"], orbital_resolved=False)
+        self.assertEqual(sorted(cohp.cohp_data.keys()), ["49", "average"])
+        self.assertIsNone(cohp.orb_res_cohp)
+        self.assertArrayAlmostEqual(cohp.energies, self.cohp_Na2UO4.energies)
+        self.assertArrayAlmostEqual(cohp.cohp_data["49"]["COHP"][Spin.up],
+                                    self.cohp_Na2UO4.cohp_data["49"]["COHP"][Spin.up])
+        self.assertEqual(cohp.cohp_data["49"]["sites"], self.cohp_Na2UO4.cohp_data["49"]["sites"])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # np.save would append .npy to this name
+            cache_file = os.path.join(tmp_dir, "COHPCAR.cache")
+            for _ in range(2):
+                # The first read writes the cache, the second one memory-maps it.
+                cached = Cohpcar(filename=filename, cache_file=cache_file)
+                self.assertTrue(os.path.exists(cache_file))
+                self.assertEqual(cached.cohp_data.keys(), self.cohp_Na2UO4.cohp_data.keys())
+                self.assertEqual(cached.orb_res_cohp["49"].keys(), self.cohp_Na2UO4.orb_res_cohp["49"].keys())
+                self.assertArrayAlmostEqual(cached.energies, self.cohp_Na2UO4.energies)
+                for orbs in cached.orb_res_cohp["49"]:
+                    self.assertArrayAlmostEqual(cached.orb_res_cohp["49"][orbs]["ICOHP"][Spin.up],
+                                                self.cohp_Na2UO4.orb_res_cohp["49"][orbs]["ICOHP"][Spin.up])
+            self.assertIsInstance(cached.energies, np.memmap)
+            self.assertEqual(os.listdir(tmp_dir), ["COHPCAR.cache"])
+            # Release the memory map before the cache is rewritten.
+            del cached
+
+            # A cache of another file is not used but rebuilt.
+            cached = Cohpcar(filename=os.path.join(test_dir, "COHPCAR.lobster.BiSe"), cache_file=cache_file)
+            self.assertNotIsInstance(cached.energies, np.memmap)
+            self.assertArrayAlmostEqual(cached.energies, self.cohp_bise.energies)
+            self.assertArrayAlmostEqual(cached.cohp_data["1"]["COHP"][Spin.up],
+                                        self.cohp_bise.cohp_data["1"]["COHP"][Spin.up])
+            del cached
+
 
 class IcohplistTest(unittest.TestCase):
     def setUp(self):
@@ -11,5 +11,5 @@ backwards compatibility.
 """
 
 from .inputs import Incar, Poscar, Potcar, Kpoints, PotcarSingle, VaspInput
-from .outputs import Vasprun, BSVasprun, Outcar, VolumetricData, Locpot, Chgcar, Elfcar, Procar, Oszicar, Xdatcar, \
+from .outputs import Vasprun, BSVasprun, LazyVasprun, Outcar, VolumetricData, Locpot, Chgcar, Elfcar, Procar, Oszicar, Xdatcar, \
     Dynmat, Wavecar, Wavederf, Waveder
@@ -17,7 +17,8 @@ import warnings
 from pathlib import Path
 import xml.etree.cElementTree as ET
 from collections import defaultdict
-from io import StringIO
+from io import StringIO, BytesIO
+from types import SimpleNamespace
 import collections
 from typing import Optional, Tuple, List
 
@@ -118,6 +119,60 @@ def _parse_varray(elem):
     return m
 
 
+def _parse_rows(rows):
+    """
+    Converts the texts of <r> rows to a 2D float array with a single
+    conversion, instead of converting every number separately.
+    """
+    try:
+        data = np.array(" ".join(rows).split(), dtype=float)
+    except ValueError:
+        data = np.array([_vasprun_float(i) for r in rows for i in r.split()])
+    return data.reshape(len(rows), -1)
+
+
+def _iter_varray_blocks(context):
+    """
+    Consumes the ("start", "end") iterparse events of an element whose start
+    event has just been read, up to and including its end event. Elements are
+    removed from the tree as soon as they are read, so that memory use does not
+    grow with the size of the element.
+
+    Yields:
+        (path, value) for each <set> of <r> rows, with value the rows as a 2D
+        float array, and for each <field> and <i> element, with value its text.
+        path is the list of (tag, comment or name) of the element and its
+        ancestors below the consumed element.
+    """
+    stack = []
+    rows = []
+    for event, elem in context:
+        if event == "start":
+            stack.append(elem)
+            continue
+        if not stack:
+            elem.clear()
+            return
+        if elem.tag == "r":
+            rows.append(elem.text)
+        elif elem.tag == "set" and rows:
+            yield [(e.tag, e.attrib.get("comment")) for e in stack], _parse_rows(rows)
+            rows = []
+        elif elem.tag in ("field", "i"):
+            yield [(e.tag, e.attrib.get("comment", e.attrib.get("name")))
+                   for e in stack], elem.text
+        stack.pop()
+        if stack:
+            stack[-1].remove(elem)
+
+
+def _comment_index(comment):
+    """
+    Returns the 0-based index from a set comment such as "kpoint 3".
+    """
+    return int(re.search(r"(\d+)\s*$", comment).group(1)) - 1
+
+
 def _parse_from_incar(filename, key):
     """
     Helper function to parse a parameter from the INCAR.
@@ -274,7 +329,7 @@ class Vasprun(MSONable):
                  ionic_step_offset=0, parse_dos=True,
                  parse_eigen=True, parse_projected_eigen=False,
                  parse_potcar_file=True, occu_tol=1e-8,
-                 exception_on_bad_xml=True):
+                 exception_on_bad_xml=True, fast_parse=False):
         """
         Args:
             filename (str): Filename to parse
@@ -316,6 +371,13 @@ class Vasprun(MSONable):
                 proper vasprun.xml are parsed. You can set to False if you want
                 partial results (e.g., if you are monitoring a calculation during a
                 run), but use the results with care. A warning is issued.
+            fast_parse (bool): Whether to parse the dos, eigenvalues and
+                projected eigenvalues with a streaming parser that fills
+                arrays with the sizes declared in the header using bulk
+                conversion of the numbers, instead of building the full xml
+                tree and nested lists for these blocks. The results are the
+                same, but this is much faster and uses far less memory for
+                large k-point meshes and projections. Defaults to False.
         """
         self.filename = filename
         self.ionic_step_skip = ionic_step_skip
@@ -342,10 +404,12 @@ class Vasprun(MSONable):
                     to_parse = "{}<calculation>{}".format(preamble, to_parse)
                 self._parse(StringIO(to_parse), parse_dos=parse_dos,
                             parse_eigen=parse_eigen,
-                            parse_projected_eigen=parse_projected_eigen)
+                            parse_projected_eigen=parse_projected_eigen,
+                            fast_parse=fast_parse)
             else:
                 self._parse(f, parse_dos=parse_dos, parse_eigen=parse_eigen,
-                            parse_projected_eigen=parse_projected_eigen)
+                            parse_projected_eigen=parse_projected_eigen,
+                            fast_parse=fast_parse)
                 self.nionic_steps = len(self.ionic_steps)
 
             if parse_potcar_file:
@@ -359,7 +423,8 @@ class Vasprun(MSONable):
             msg += "Ionic convergence reached: %s." % self.converged_ionic
             warnings.warn(msg, UnconvergedVASPWarning)
 
-    def _parse(self, stream, parse_dos, parse_eigen, parse_projected_eigen):
+    def _parse(self, stream, parse_dos, parse_eigen, parse_projected_eigen,
+               fast_parse=False):
         self.efermi = None
         self.eigenvalues = None
         self.projected_eigenvalues = None
@@ -368,8 +433,24 @@ class Vasprun(MSONable):
         ionic_steps = []
         parsed_header = False
         try:
-            for event, elem in ET.iterparse(stream):
+            context = ET.iterparse(stream, events=("start", "end") if fast_parse
+                                   else ("end",))
+            for event, elem in context:
                 tag = elem.tag
+                if event == "start":
+                    if parse_dos and tag == "dos":
+                        try:
+                            self.tdos, self.idos, self.pdos = self._fast_parse_dos(context)
+                            self.efermi = self.tdos.efermi
+                            self.dos_has_errors = False
+                        except Exception:
+                            self.dos_has_errors = True
+                    elif parse_eigen and tag == "eigenvalues":
+                        self.eigenvalues = self._fast_parse_eigen(context)
+                    elif parse_projected_eigen and tag == "projected":
+                        self.projected_eigenvalues = self._fast_parse_projected_eigen(
+                            context)
+                    continue
                 if not parsed_header:
                     if tag == "generator":
                         self.generator = self._parse_params(elem)
@@ -1264,6 +1345,67 @@ class Vasprun(MSONable):
         elem.clear()
         return proj_eigen
 
+    @staticmethod
+    def _fast_parse_dos(context):
+        efermi = None
+        energies = None
+        tdensities = {}
+        idensities = {}
+        orbs = []
+        pdoss = []
+        for path, value in _iter_varray_blocks(context):
+            tag, comment = path[-1]
+            if tag == "i" and comment == "efermi":
+                efermi = float(value)
+            elif tag == "field" and path[0][0] == "partial":
+                orbs.append(value)
+            elif tag == "set" and path[0][0] == "total":
+                spin = Spin.up if comment == "spin 1" else Spin.down
+                energies = value[:, 0]
+                tdensities[spin] = value[:, 1]
+                idensities[spin] = value[:, 2]
+            elif tag == "set" and path[0][0] == "partial":
+                spin = Spin.up if comment == "spin 1" else Spin.down
+                ion = _comment_index(path[-2][1])
+                while len(pdoss) <= ion:
+                    pdoss.append(defaultdict(dict))
+                lm = any(["x" in s for s in orbs[1:]])
+                for j in range(1, value.shape[1]):
+                    orb = Orbital(j - 1) if lm else OrbitalType(j - 1)
+                    pdoss[ion][orb][spin] = value[:, j]
+        return Dos(efermi, energies, tdensities), Dos(efermi, energies, idensities), pdoss
+
+    def _fast_parse_eigen(self, context):
+        shape = (len(self.actual_kpoints), int(self.parameters["NBANDS"]), 2)
+        eigenvalues = {}
+        for path, value in _iter_varray_blocks(context):
+            if path[-1][0] != "set":
+                continue
+            spin = Spin.up if path[-2][1] == "spin 1" else Spin.down
+            if spin not in eigenvalues:
+                eigenvalues[spin] = np.zeros(shape)
+            eigenvalues[spin][_comment_index(path[-1][1])] = value
+        return eigenvalues
+
+    def _fast_parse_projected_eigen(self, context):
+        nkpts = len(self.actual_kpoints)
+        nbands = int(self.parameters["NBANDS"])
+        # Non-collinear runs have 4 spin components, of which the last three
+        # are stacked along the k-point axis as in _parse_projected_eigen.
+        ncomp = 3 if self.parameters.get("LNONCOLLINEAR", False) else 1
+        proj_eigen = {}
+        for path, value in _iter_varray_blocks(context):
+            if path[0][0] != "array" or path[-1][0] != "set":
+                continue
+            ispin = int(re.match(r"spin(\d+)", path[-3][1]).group(1))
+            spin = Spin.up if ispin == 1 else Spin.down
+            if spin not in proj_eigen:
+                nk = nkpts if spin == Spin.up else ncomp * nkpts
+                proj_eigen[spin] = np.zeros((nk, nbands) + value.shape)
+            k = _comment_index(path[-2][1]) + max(ispin - 2, 0) * nkpts
+            proj_eigen[spin][k, _comment_index(path[-1][1])] = value
+        return proj_eigen
+
     @staticmethod
     def _parse_dynmat(elem):
         hessian = []
@@ -1290,7 +1432,7 @@ class BSVasprun(Vasprun):
     """
 
     def __init__(self, filename, parse_projected_eigen=False,
-                 parse_potcar_file=False, occu_tol=1e-8):
+                 parse_potcar_file=False, occu_tol=1e-8, fast_parse=False):
         """
         Args:
             filename (str): Filename to parse
@@ -1307,6 +1449,9 @@ class BSVasprun(Vasprun):
             occu_tol (float): Sets the minimum tol for the determination of the
                 vbm and cbm. Usually the default of 1e-8 works well enough,
                 but there may be pathological cases.
+            fast_parse (bool): Whether to parse the eigenvalues and projected
+                eigenvalues with the streaming parser. See Vasprun. Defaults
+                to False.
         """
         self.filename = filename
         self.occu_tol = occu_tol
@@ -1316,8 +1461,17 @@ class BSVasprun(Vasprun):
             parsed_header = False
             self.eigenvalues = None
             self.projected_eigenvalues = None
-            for event, elem in ET.iterparse(f):
+            context = ET.iterparse(f, events=("start", "end") if fast_parse
+                                   else ("end",))
+            for event, elem in context:
                 tag = elem.tag
+                if event == "start":
+                    if tag == "eigenvalues":
+                        self.eigenvalues = self._fast_parse_eigen(context)
+                    elif parse_projected_eigen and tag == "projected":
+                        self.projected_eigenvalues = self._fast_parse_projected_eigen(
+                            context)
+                    continue
                 if not parsed_header:
                     if tag == "generator":
                         self.generator = self._parse_params(elem)
@@ -1406,6 +1560,230 @@ class BSVasprun(Vasprun):
         return jsanitize(d, strict=True)
 
 
+class LazyVasprun(Vasprun):
+    """
+    A Vasprun that only parses the parts of the file that are used. The file
+    is scanned once to record the byte offsets of every <calculation> block
+    and of the <dos>, <eigenvalues> and <projected> blocks in them. The header
+    (parameters, kpoints, atominfo, initial and final structures) is parsed
+    eagerly, while the ionic steps, dos, eigenvalues and projected eigenvalues
+    are parsed from their blocks when they are first accessed, and cached.
+    final_energy only parses the last calculation. Other attributes (e.g.,
+    dielectric data) trigger a full parse of the file without the dos and
+    eigenvalue blocks.
+
+    This is useful for very large vasprun.xml files of which only a few
+    properties are needed. Unlike Vasprun, no warning is issued for
+    unconverged runs, since checking convergence requires parsing all ionic
+    steps.
+    """
+
+    # Attributes that are parsed lazily, and the section they are parsed from.
+    _lazy_attributes = {"ionic_steps": "calculations",
+                        "nionic_steps": "calculations",
+                        "tdos": "dos", "idos": "dos", "pdos": "dos",
+                        "efermi": "dos", "dos_has_errors": "dos",
+                        "eigenvalues": "eigenvalues",
+                        "projected_eigenvalues": "projected",
+                        "dielectric_data": "rest",
+                        "other_dielectric": "rest"}
+
+    def __init__(self, filename, parse_potcar_file=True, occu_tol=1e-8,
+                 exception_on_bad_xml=True, fast_parse=False):
+        """
+        Args:
+            filename (str): Filename to parse
+            parse_potcar_file (bool/str): Whether to parse the potcar file to
+                read the potcar hashes for the potcar_spec attribute. See
+                Vasprun.
+            occu_tol (float): Sets the minimum tol for the determination of the
+                vbm and cbm. See Vasprun.
+            exception_on_bad_xml (bool): Whether to throw a ParseException if a
+                malformed XML is detected. See Vasprun.
+            fast_parse (bool): Whether to parse the dos, eigenvalues and
+                projected eigenvalues blocks with the streaming parser. See
+                Vasprun.
+        """
+        self._parsed_sections = set()
+        self.filename = filename
+        self.ionic_step_skip = None
+        self.ionic_step_offset = 0
+        self.occu_tol = occu_tol
+        self.exception_on_bad_xml = exception_on_bad_xml
+        self.fast_parse = fast_parse
+        self._potcar_path = parse_potcar_file
+
+        self._index_blocks()
+        # Nothing is parsed lazily while the header is parsed.
+        self._parsed_sections = set(self._lazy_attributes.values())
+        if self._calculations:
+            header_end = self._calculations[0][0]
+            tail_start = self._calculations[-1][1]
+        else:
+            header_end = tail_start = None
+        with zopen(filename, "rb") as f:
+            header = f.read(header_end) if header_end is not None else f.read()
+            tail = b""
+            if tail_start is not None:
+                f.seek(tail_start)
+                tail = f.read()
+        self._parse(BytesIO(header + tail), parse_dos=False, parse_eigen=False,
+                    parse_projected_eigen=False)
+        for name in self._lazy_attributes:
+            self.__dict__.pop(name, None)
+        self._parsed_sections = set()
+
+        if parse_potcar_file:
+            self.update_potcar_spec(parse_potcar_file)
+
+    def _index_blocks(self):
+        """
+        Records the (start, end) byte offsets of the <calculation> blocks, and
+        of the <dos>, <eigenvalues> and <projected> blocks in them as a list of
+        (start, end, {tag: (start, end)}).
+        """
+        calculations = []
+        blocks = {}
+        starts = {}
+        pos = 0
+        with zopen(self.filename, "rb") as f:
+            for line in f:
+                stripped = line.lstrip()
+                if stripped.startswith(b"<"):
+                    offset = pos + len(line) - len(stripped)
+                    if stripped.startswith(b"<calculation>"):
+                        starts = {"calculation": offset}
+                        blocks = {}
+                    elif stripped.startswith(b"</calculation>"):
+                        calculations.append((starts["calculation"],
+                                             offset + len(b"</calculation>"),
+                                             blocks))
+                        starts = {}
+                    elif "calculation" in starts:
+                        for tag in ("dos", "eigenvalues", "projected"):
+                            # Skip the eigenvalues nested in <projected>.
+                            if tag == "eigenvalues" and "projected" in starts:
+                                continue
+                            if stripped.startswith("<{}>".format(tag).encode()):
+                                starts[tag] = offset
+                            elif stripped.startswith("</{}>".format(tag).encode()) \
+                                    and tag in starts:
+                                end = offset + len(tag) + 3
+                                blocks[tag] = (starts.pop(tag), end)
+                pos += len(line)
+        self._calculations = calculations
+
+    def _read_blocks(self, ranges):
+        """
+        Returns the bytes of a list of (start, end) byte ranges.
+        """
+        data = []
+        with zopen(self.filename, "rb") as f:
+            for start, end in ranges:
+                f.seek(start)
+                data.append(f.read(end - start))
+        return data
+
+    def _parse_calculations(self, calculations):
+        """
+        Parses the ionic steps of a list of indexed calculations, without
+        their dos and eigenvalue blocks.
+        """
+        ranges = []
+        for start, end, blocks in calculations:
+            for b_start, b_end in sorted(blocks.values()):
+                ranges.append((start, b_start))
+                start = b_end
+            ranges.append((start, end))
+        data = self._read_blocks(ranges)
+        ionic_steps = []
+        i = 0
+        for _, _, blocks in calculations:
+            elem = ET.fromstring(b"".join(data[i:i + len(blocks) + 1]))
+            i += len(blocks) + 1
+            if not self.parameters.get("LCHIMAG", False):
+                ionic_steps.append(self._parse_calculation(elem))
+            else:
+                ionic_steps.extend(self._parse_chemical_shielding_calculation(elem))
+        return ionic_steps
+
+    def _parse_block(self, tag):
+        """
+        Parses the last <dos>, <eigenvalues> or <projected> block in the
+        calculations, or returns None if there is none.
+        """
+        for _, _, blocks in reversed(self._calculations):
+            if tag in blocks:
+                data = self._read_blocks([blocks[tag]])[0]
+                break
+        else:
+            return None
+        if self.fast_parse:
+            context = ET.iterparse(BytesIO(data), events=("start", "end"))
+            next(context)
+            return {"dos": self._fast_parse_dos,
+                    "eigenvalues": self._fast_parse_eigen,
+                    "projected": self._fast_parse_projected_eigen}[tag](context)
+        elem = ET.fromstring(data)
+        return {"dos": self._parse_dos,
+                "eigenvalues": self._parse_eigen,
+                "projected": self._parse_projected_eigen}[tag](elem)
+
+    def _parse_section(self, section):
+        if section == "calculations":
+            self.ionic_steps = self._parse_calculations(self._calculations)
+            self.nionic_steps = len(self.ionic_steps)
+            if self._potcar_path:
+                self.update_charge_from_potcar(self._potcar_path)
+        elif section == "dos":
+            self.efermi = None
+            try:
+                dos = self._parse_block("dos")
+                if dos is not None:
+                    self.tdos, self.idos, self.pdos = dos
+                    self.efermi = self.tdos.efermi
+                self.dos_has_errors = False
+            except Exception:
+                self.dos_has_errors = True
+        elif section == "eigenvalues":
+            self.eigenvalues = self._parse_block("eigenvalues")
+        elif section == "projected":
+            self.projected_eigenvalues = self._parse_block("projected")
+        else:
+            vasprun = Vasprun.__new__(Vasprun)
+            vasprun.filename = self.filename
+            vasprun.exception_on_bad_xml = self.exception_on_bad_xml
+            with zopen(self.filename, "rt") as f:
+                vasprun._parse(f, parse_dos=False, parse_eigen=False,
+                               parse_projected_eigen=False)
+            for k, v in vasprun.__dict__.items():
+                if self._lazy_attributes.get(k, "rest") == "rest":
+                    self.__dict__.setdefault(k, v)
+
+    def __getattr__(self, name):
+        # Only called for attributes that have not been set (yet).
+        if name.startswith("_"):
+            raise AttributeError(name)
+        section = self._lazy_attributes.get(name, "rest")
+        if section in self._parsed_sections:
+            raise AttributeError(name)
+        self._parsed_sections.add(section)
+        self._parse_section(section)
+        return getattr(self, name)
+
+    @property  # type: ignore
+    @unitized("eV")
+    def final_energy(self):
+        """
+        Final energy from the vasp run. Only the last calculation is parsed if
+        the ionic steps have not been parsed yet.
+        """
+        if "ionic_steps" in self.__dict__:
+            return Vasprun.final_energy.fget(self)
+        return Vasprun.final_energy.fget(
+            SimpleNamespace(ionic_steps=self._parse_calculations(self._calculations[-1:])))
+
+
 class Outcar:
     """
     Parser for data in OUTCAR that is not available in Vasprun.xml
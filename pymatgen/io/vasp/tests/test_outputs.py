@@ -20,8 +20,9 @@ from pymatgen.electronic_structure.core import OrbitalType
 from pymatgen.io.wannier90 import Unk
 from pymatgen.io.vasp.inputs import Kpoints, Poscar
 from pymatgen.io.vasp.outputs import Chgcar, Locpot, Oszicar, Outcar, \
-    Vasprun, Procar, Xdatcar, Dynmat, BSVasprun, UnconvergedVASPWarning, \
-    VaspParserError, Wavecar, Waveder, Elfcar, Eigenval
+    Vasprun, Procar, Xdatcar, Dynmat, BSVasprun, LazyVasprun, \
+    UnconvergedVASPWarning, VaspParserError, Wavecar, Waveder, Elfcar, \
+    Eigenval
 from pymatgen import Spin, Orbital, Lattice, Structure
 from pymatgen.entries.compatibility import MaterialsProjectCompatibility
 from pymatgen.electronic_structure.core import Magmom
@@ -203,6 +204,38 @@ class VasprunTest(PymatgenTest):
         self.assertEqual(d["elements"], ["Fe", "Li", "O", "P"])
         self.assertEqual(d["nelements"], 4)
 
+    def test_fast_parse(self):
+        for filename in ['vasprun.xml', 'lifepo4.xml', 'vasprun.xml.nonlm']:
+            filepath = self.TEST_FILES_DIR / filename
+            vasprun = Vasprun(filepath, parse_projected_eigen=True,
+                              parse_potcar_file=False)
+            fast = Vasprun(filepath, parse_projected_eigen=True,
+                           parse_potcar_file=False, fast_parse=True)
+            self.assertEqual(fast.final_energy, vasprun.final_energy)
+            self.assertEqual(fast.final_structure, vasprun.final_structure)
+            self.assertEqual(fast.efermi, vasprun.efermi)
+            for spin, v in vasprun.eigenvalues.items():
+                self.assertArrayEqual(fast.eigenvalues[spin], v)
+            self.assertEqual(fast.projected_eigenvalues is None,
+                             vasprun.projected_eigenvalues is None)
+            for spin, v in (vasprun.projected_eigenvalues or {}).items():
+                self.assertArrayEqual(fast.projected_eigenvalues[spin], v)
+            for spin, v in vasprun.tdos.densities.items():
+                self.assertArrayEqual(fast.tdos.densities[spin], v)
+            self.assertArrayEqual(fast.tdos.energies, vasprun.tdos.energies)
+            self.assertEqual(len(fast.pdos), len(vasprun.pdos))
+            for pdos, ref in zip(fast.pdos, vasprun.pdos):
+                self.assertEqual(pdos.keys(), ref.keys())
+                for orb, d in ref.items():
+                    for spin, v in d.items():
+                        self.assertArrayEqual(pdos[orb][spin], v)
+
+        filepath = self.TEST_FILES_DIR / 'vasprun_Si_bands.xml'
+        vasprun = BSVasprun(filepath, parse_potcar_file=False)
+        fast = BSVasprun(filepath, parse_potcar_file=False, fast_parse=True)
+        for spin, v in vasprun.eigenvalues.items():
+            self.assertArrayEqual(fast.eigenvalues[spin], v)
+
     def test_unconverged(self):
         filepath = self.TEST_FILES_DIR / 'vasprun.xml.unconverged'
         with warnings.catch_warnings(record=True) as w:
@@ -1059,6 +1092,47 @@ class BSVasprunTest(PymatgenTest):
         self.assertIn("eigenvalues", d["output"])
 
 
+class LazyVasprunTest(PymatgenTest):
+    _multiprocess_shared_ = True
+
+    def setUp(self):
+        warnings.simplefilter("ignore")
+
+    def tearDown(self):
+        warnings.simplefilter("default")
+
+    def test_lazy(self):
+        filepath = self.TEST_FILES_DIR / 'lifepo4.xml'
+        vasprun = Vasprun(filepath, parse_projected_eigen=True,
+                          parse_potcar_file=False)
+        lazy = LazyVasprun(filepath, parse_potcar_file=False)
+        self.assertEqual(lazy.parameters, vasprun.parameters)
+        self.assertEqual(lazy.final_structure, vasprun.final_structure)
+        self.assertNotIn("ionic_steps", lazy.__dict__)
+        self.assertAlmostEqual(lazy.final_energy, vasprun.final_energy)
+        self.assertNotIn("ionic_steps", lazy.__dict__)
+        self.assertNotIn("tdos", lazy.__dict__)
+
+        self.assertEqual(len(lazy.ionic_steps), len(vasprun.ionic_steps))
+        self.assertEqual(lazy.structures, vasprun.structures)
+        self.assertEqual(lazy.nionic_steps, vasprun.nionic_steps)
+        self.assertAlmostEqual(lazy.final_energy, vasprun.final_energy)
+        self.assertEqual(lazy.efermi, vasprun.efermi)
+        self.assertArrayEqual(lazy.tdos.densities[Spin.up],
+                              vasprun.tdos.densities[Spin.up])
+        self.assertNotIn("projected_eigenvalues", lazy.__dict__)
+        for spin, v in vasprun.eigenvalues.items():
+            self.assertArrayEqual(lazy.eigenvalues[spin], v)
+        for spin, v in vasprun.projected_eigenvalues.items():
+            self.assertArrayEqual(lazy.projected_eigenvalues[spin], v)
+        self.assertEqual(lazy.converged, vasprun.converged)
+        self.assertEqual(lazy.dielectric_data, vasprun.dielectric_data)
+
+        lazy = LazyVasprun(filepath, parse_potcar_file=False, fast_parse=True)
+        for spin, v in vasprun.projected_eigenvalues.items():
+            self.assertArrayEqual(lazy.projected_eigenvalues[spin], v)
+
+
 class OszicarTest(PymatgenTest):
 
     def test_init(self):
@@ -15,7 +15,8 @@ v3.0 - pymatgen no longer ships with spglib. Instead, spglib (the python
 
 import itertools
 import logging
-from collections import defaultdict
+import hashlib
+from collections import defaultdict, OrderedDict
 import copy
 import math
 from math import cos
@@ -37,12 +38,116 @@ from pymatgen.util.coord import find_in_coord_list, pbc_diff
 logger = logging.getLogger(__name__)
 
 
+class SymmetryDatasetCache:
+    """
+    Bounded LRU cache of the spglib results computed for a cell, shared by all
+    SpacegroupAnalyzer instances. Entries are keyed by a hash of the lattice,
+    fractional coordinates, species numbering and magnetic moments of the
+    cell, together with symprec and angle_tolerance, so analyzers built for
+    the same structure (e.g., by XRDCalculator, StructureMatcher,
+    SlabGenerator or the k-path classes) only call spglib once.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Args:
+            maxsize (int): Maximum number of cells kept in the cache. Set to
+                0 to disable caching.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def get_key(cell, symprec, angle_tolerance):
+        """
+        Args:
+            cell (tuple): (lattice, positions, numbers, magmoms) as passed to
+                spglib.
+            symprec (float): Tolerance for symmetry finding.
+            angle_tolerance (float): Angle tolerance for symmetry finding.
+
+        Returns:
+            (str) Hash of the cell and tolerances.
+        """
+        h = hashlib.sha1()
+        for i, a in enumerate(cell):
+            try:
+                # Adding 0.0 maps -0.0 to 0.0.
+                a = np.ascontiguousarray(a, dtype=np.float64) + 0.0
+                h.update(str(a.shape).encode())
+                h.update(a.tobytes())
+            except (TypeError, ValueError):
+                h.update(repr(a).encode())
+            h.update(str(i).encode())
+        h.update(repr((float(symprec), float(angle_tolerance))).encode())
+        return h.hexdigest()
+
+    def get(self, key, name, func):
+        """
+        Gets a cached result for a cell, computing it with func on a miss.
+
+        Args:
+            key (str): Key of the cell, from get_key.
+            name (hashable): Name of the result, e.g., "dataset".
+            func (callable): Function with no arguments computing the result.
+
+        Returns:
+            The cached result.
+        """
+        if self.maxsize <= 0:
+            self.misses += 1
+            return func()
+        entry = self._entries.get(key)
+        if entry is not None and name in entry:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[name]
+        self.misses += 1
+        result = func()
+        if entry is None:
+            entry = self._entries[key] = {}
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        entry[name] = result
+        return result
+
+    def clear(self):
+        """
+        Clears the cache and resets the hit and miss counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+        Returns:
+            (dict) With the hits, misses, maxsize and current size of the
+            cache.
+        """
+        return {"hits": self.hits, "misses": self.misses,
+                "maxsize": self.maxsize, "currsize": len(self._entries)}
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class SpacegroupAnalyzer:
     """
     Takes a pymatgen.core.structure.Structure object and a symprec.
     Uses spglib to perform various symmetry finding operations.
+
+    The spglib results are stored in SpacegroupAnalyzer.cache, a
+    SymmetryDatasetCache shared by all instances, so creating several
+    analyzers for the same structure and tolerances only calls spglib once.
     """
 
+    cache = SymmetryDatasetCache()
+
     def __init__(self, structure, symprec=0.01, angle_tolerance=5.0):
         """
         Args:
@@ -86,9 +191,34 @@ class SpacegroupAnalyzer:
         self._numbers = zs
         # For now, we are setting magmom to zero.
         self._cell = latt, positions, zs, magmoms
+        self._cache_key = self.cache.get_key(self._cell, symprec,
+                                             angle_tolerance)
+
+        self._space_group_data = self._get_cached(
+            "dataset", lambda: spglib.get_symmetry_dataset(
+                self._cell, symprec=self._symprec,
+                angle_tolerance=angle_tolerance))
 
-        self._space_group_data = spglib.get_symmetry_dataset(
-            self._cell, symprec=self._symprec, angle_tolerance=angle_tolerance)
+    def _get_cached(self, name, func):
+        # The cached results are shared by all analyzers, so each one gets its
+        # own copy that callers can modify.
+        return copy.deepcopy(self.cache.get(self._cache_key, name, func))
+
+    @classmethod
+    def cache_info(cls):
+        """
+        Returns:
+            (dict) With the hits, misses, maxsize and current size of the
+            cache of spglib results shared by all SpacegroupAnalyzers.
+        """
+        return cls.cache.info()
+
+    @classmethod
+    def cache_clear(cls):
+        """
+        Clears the cache of spglib results shared by all SpacegroupAnalyzers.
+        """
+        cls.cache.clear()
 
     def get_space_group_symbol(self):
         """
@@ -215,8 +345,10 @@ class SpacegroupAnalyzer:
             "translations" gives the numpy float64 array of the translation
             vectors in scaled positions.
         """
-        d = spglib.get_symmetry(self._cell, symprec=self._symprec,
-                                angle_tolerance=self._angle_tol)
+        d = self._get_cached(
+            "symmetry", lambda: spglib.get_symmetry(
+                self._cell, symprec=self._symprec,
+                angle_tolerance=self._angle_tol))
         # Sometimes spglib returns small translation vectors, e.g.
         # [1e-4, 2e-4, 1e-4]
         # (these are in fractional coordinates, so should be small denominator
@@ -301,9 +433,10 @@ class SpacegroupAnalyzer:
         Returns:
             Refined structure.
         """
-        # Atomic positions have to be specified by scaled positions for spglib.
-        lattice, scaled_positions, numbers \
-            = spglib.refine_cell(self._cell, self._symprec, self._angle_tol)
+        # The standardized cell of the dataset is the refined cell.
+        ds = self._space_group_data
+        lattice, scaled_positions, numbers = \
+            ds["std_lattice"], ds["std_positions"], ds["std_types"]
 
         species = [self._unique_species[i - 1] for i in numbers]
         s = Structure(lattice, species, scaled_positions)
@@ -318,14 +451,21 @@ class SpacegroupAnalyzer:
             as an Structure object. If no primitive cell is found, None is
             returned.
         """
-        lattice, scaled_positions, numbers = spglib.find_primitive(
-            self._cell, symprec=self._symprec)
+        lattice, scaled_positions, numbers = self._get_cached(
+            "primitive", lambda: spglib.find_primitive(
+                self._cell, symprec=self._symprec))
 
         species = [self._unique_species[i - 1] for i in numbers]
 
         return Structure(lattice, species, scaled_positions,
                          to_unit_cell=True).get_reduced_structure()
 
+    def _get_ir_reciprocal_mesh(self, mesh, shift):
+        key = ("ir_reciprocal_mesh", tuple(int(i) for i in mesh),
+               tuple(int(i) for i in shift))
+        return self._get_cached(key, lambda: spglib.get_ir_reciprocal_mesh(
+            np.array(mesh), self._cell, is_shift=shift, symprec=self._symprec))
+
     def get_ir_reciprocal_mesh(self, mesh=(10, 10, 10), is_shift=(0, 0, 0)):
         """
         k-point mesh of the Brillouin zone generated taken into account
@@ -344,8 +484,7 @@ class SpacegroupAnalyzer:
             in fractional coordinates
         """
         shift = np.array([1 if i else 0 for i in is_shift])
-        mapping, grid = spglib.get_ir_reciprocal_mesh(
-            np.array(mesh), self._cell, is_shift=shift, symprec=self._symprec)
+        mapping, grid = self._get_ir_reciprocal_mesh(mesh, shift)
 
         results = []
         for i, count in zip(*np.unique(mapping, return_counts=True)):
@@ -764,8 +903,7 @@ class SpacegroupAnalyzer:
                 mesh.append(int(max(m)))
                 shift.append(1)
 
-        mapping, grid = spglib.get_ir_reciprocal_mesh(
-            np.array(mesh), self._cell, is_shift=shift, symprec=self._symprec)
+        mapping, grid = self._get_ir_reciprocal_mesh(mesh, shift)
         mapping = list(mapping)
         grid = (np.array(grid) + np.array(shift) * (0.5, 0.5, 0.5)) / mesh
         weights = []
@@ -1561,22 +1699,98 @@ class SpacegroupOperations(list):
             equivalent.
         """
 
-        def in_sites(site):
-            for test_site in sites1:
-                if test_site.is_periodic_image(site, symm_prec, False):
-                    return True
+        if len(self) == 0:
             return False
+        matches = self._get_image_matches(sites1, sites2, symm_prec)
+        return bool(np.any(np.all(np.any(matches, axis=2), axis=1)))
 
-        for op in self:
-            newsites2 = [PeriodicSite(site.species,
-                                      op.operate(site.frac_coords),
-                                      site.lattice) for site in sites2]
-            for site in newsites2:
-                if not in_sites(site):
-                    break
-            else:
-                return True
-        return False
+    def _get_image_diffs(self, sites1, sites2):
+        """
+        Applies all operations to the fractional coordinates of sites2 in a
+        single tensor operation.
+
+        Returns:
+            (frac_diffs, same_species): frac_diffs is the (nops, n2, n1, 3)
+            array of periodic fractional differences between the images of
+            sites2 and sites1, and same_species the (n2, n1) boolean array of
+            whether the sites have the same species.
+        """
+        affine = np.array([op.affine_matrix for op in self])
+        fcoords1 = np.reshape([site.frac_coords for site in sites1], (-1, 3))
+        fcoords2 = np.reshape([site.frac_coords for site in sites2], (-1, 3))
+        images = np.einsum("oij,nj->oni", affine[:, :3, :3], fcoords2) + \
+            affine[:, None, :3, 3]
+        frac_diffs = pbc_diff(images[:, :, None, :], fcoords1[None, None, :, :])
+
+        species = []
+        ids = []
+        for site in itertools.chain(sites1, sites2):
+            if site.species not in species:
+                species.append(site.species)
+            ids.append(species.index(site.species))
+        ids1 = np.array(ids[:len(sites1)])
+        ids2 = np.array(ids[len(sites1):])
+        return frac_diffs, ids2[:, None] == ids1[None, :]
+
+    def _get_image_matches(self, sites1, sites2, symm_prec):
+        """
+        Returns:
+            (nops, n2, n1) boolean array of whether the image of each site of
+            sites2 under each operation is a periodic image of each site of
+            sites1.
+        """
+        frac_diffs, same_species = self._get_image_diffs(sites1, sites2)
+        return np.all(np.abs(frac_diffs) <= symm_prec, axis=-1) & \
+            same_species[None, :, :]
+
+    def get_site_permutations(self, sites, symm_prec=1e-3):
+        """
+        Computes how each operation permutes a set of sites, e.g., all the
+        sites of a structure. Together with get_orbit_key, this allows
+        subsets of the sites to be compared for symmetrical equivalence
+        using integer indices only.
+
+        Args:
+            sites ([PeriodicSite]): Sites to permute.
+            symm_prec (float): Tolerance in atomic distance to test if atoms
+                are symmetrically similar.
+
+        Returns:
+            (np.ndarray) (nops, nsites) array of the index of the site each
+            site is mapped to by each operation, or -1 if its image is not in
+            sites.
+        """
+        frac_diffs, same_species = self._get_image_diffs(sites, sites)
+        dists = np.max(np.abs(frac_diffs), axis=-1)
+        dists[:, ~same_species] = np.inf
+        perms = np.argmin(dists, axis=-1)
+        found = np.take_along_axis(dists, perms[:, :, None], axis=-1)[:, :, 0]
+        perms[found > symm_prec] = -1
+        return perms
+
+    @staticmethod
+    def get_orbit_key(indices, permutations):
+        """
+        Computes a canonical key of the orbit of a subset of sites, i.e., the
+        lexicographically smallest sorted image of the subset under the
+        operations that map it onto the sites. Two subsets of the same sites
+        are symmetrically equivalent if and only if they have the same key,
+        so large candidate sets can be deduplicated with a dict or set in a
+        single pass.
+
+        Args:
+            indices ([int]): Indices of the subset of sites.
+            permutations (np.ndarray): Site permutations, from
+                get_site_permutations.
+
+        Returns:
+            (tuple) Canonical key of the orbit.
+        """
+        images = np.sort(permutations[:, list(indices)], axis=1)
+        images = images[np.all(images >= 0, axis=1)]
+        if len(images) == 0:
+            return tuple(sorted(indices))
+        return tuple(min(map(tuple, images.tolist())))
 
     def __str__(self):
         return "{} ({}) spacegroup".format(self.int_symbol, self.int_number)
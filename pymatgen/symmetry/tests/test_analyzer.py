@@ -48,6 +48,49 @@ class SpacegroupAnalyzerTest(PymatgenTest):
         self.assertEqual(len(s), 4)
         self.assertEqual(len(a.find_primitive()), 1)
 
+    def test_cache(self):
+        SpacegroupAnalyzer.cache_clear()
+        a = SpacegroupAnalyzer(self.structure, 0.001)
+        self.assertEqual(SpacegroupAnalyzer.cache_info()["misses"], 1)
+        self.assertEqual(SpacegroupAnalyzer.cache_info()["hits"], 0)
+        b = SpacegroupAnalyzer(self.structure.copy(), 0.001)
+        self.assertEqual(SpacegroupAnalyzer.cache_info()["hits"], 1)
+        self.assertEqual(a.get_symmetry_dataset()["number"], b.get_symmetry_dataset()["number"])
+        # The analyzers do not share the dataset.
+        wyckoffs = list(b.get_symmetry_dataset()["wyckoffs"])
+        rotations = b.get_symmetry_dataset()["rotations"].copy()
+        c = SpacegroupAnalyzer(self.structure, 0.001)
+        c.get_symmetry_dataset()["wyckoffs"][0] = "z"
+        c.get_symmetry_dataset()["rotations"][0] = 0
+        for sg in [a, b]:
+            self.assertEqual(sg.get_symmetry_dataset()["wyckoffs"], wyckoffs)
+            self.assertArrayEqual(sg.get_symmetry_dataset()["rotations"], rotations)
+        self.assertEqual(a.get_refined_structure(), self.sg.get_refined_structure())
+        self.assertEqual(len(a.get_symmetry_operations()),
+                         len(b.get_symmetry_operations()))
+        self.assertEqual(SpacegroupAnalyzer.cache_info()["hits"], 3)
+        self.assertEqual(a.find_primitive(), self.sg.find_primitive())
+
+        # Different tolerances, positions or magmoms are different entries.
+        SpacegroupAnalyzer(self.structure, 0.1)
+        SpacegroupAnalyzer(self.sg3._structure, 0.001)
+        s = self.structure.copy()
+        s.add_site_property("magmom", [1] * len(s))
+        SpacegroupAnalyzer(s, 0.001)
+        self.assertEqual(SpacegroupAnalyzer.cache_info()["currsize"], 4)
+
+        maxsize = SpacegroupAnalyzer.cache.maxsize
+        SpacegroupAnalyzer.cache.maxsize = 2
+        try:
+            SpacegroupAnalyzer(self.structure4, 0.001)
+            self.assertEqual(SpacegroupAnalyzer.cache_info()["currsize"], 2)
+        finally:
+            SpacegroupAnalyzer.cache.maxsize = maxsize
+        SpacegroupAnalyzer.cache_clear()
+        self.assertEqual(SpacegroupAnalyzer.cache_info(),
+                         {"hits": 0, "misses": 0, "maxsize": maxsize,
+                          "currsize": 0})
+
     def test_is_laue(self):
         s = Structure.from_spacegroup("Fm-3m", np.eye(3) * 3, ["Cu"],
                                       [[0, 0, 0]])
@@ -393,6 +436,21 @@ class SpacegroupTest(unittest.TestCase):
         self.assertFalse(self.sg1.are_symmetrically_equivalent(sites1, sites2,
                                                                1e-3))
 
+    def test_get_orbit_key(self):
+        perms = self.sg1.get_site_permutations(self.structure, 1e-3)
+        self.assertEqual(perms.shape, (len(self.sg1), len(self.structure)))
+        self.assertTrue(np.all(perms >= 0))
+        for p in perms:
+            self.assertEqual(sorted(p), list(range(len(self.structure))))
+        for inds1, inds2 in [([0, 1], [2, 3]), ([0, 1], [0, 2]),
+                             ([4, 5, 6], [8, 9, 10])]:
+            sites1 = [self.structure[i] for i in inds1]
+            sites2 = [self.structure[i] for i in inds2]
+            self.assertEqual(
+                self.sg1.get_orbit_key(inds1, perms) ==
+                self.sg1.get_orbit_key(inds2, perms),
+                self.sg1.are_symmetrically_equivalent(sites1, sites2, 1e-3))
+
 
 H2O2 = Molecule(["O", "O", "H", "H"],
                 [[0, 0.727403, -0.050147], [0, -0.727403, -0.050147],
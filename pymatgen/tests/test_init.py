@@ -1,6 +1,8 @@
 import unittest
 
 import os
+import subprocess
+import sys
 import ruamel.yaml as yaml
 from pymatgen import SETTINGS_FILE, _load_pmg_settings, get_structure_from_mp, \
     SETTINGS, loadfn
@@ -45,5 +47,40 @@ class SettingsTestCase(unittest.TestCase):
             self.assertIsInstance(obj, Vasprun)
 
 
+class LazyImportTestCase(unittest.TestCase):
+
+    def test_lazy_aliases(self):
+        code = "import sys, pymatgen; " \
+               "print('pymatgen.ext.matproj' in sys.modules, " \
+               "'pymatgen.core.structure' in sys.modules)"
+        out = subprocess.check_output([sys.executable, "-c", code],
+                                      universal_newlines=True)
+        if sys.version_info >= (3, 7):
+            self.assertEqual(out.split(), ["False", "False"])
+
+        import pymatgen
+        from pymatgen import Element, Composition
+        self.assertIs(pymatgen.Structure, Structure)
+        self.assertEqual(Element("Fe").Z, 26)
+        self.assertEqual(Composition("Fe2O3").reduced_formula, "Fe2O3")
+        self.assertIn("MPRester", dir(pymatgen))
+        self.assertRaises(AttributeError, getattr, pymatgen, "NotAClass")
+
+    def test_lazy_periodic_table(self):
+        code = "import sys; from pymatgen.core import periodic_table as pt; " \
+               "print('pymatgen.core.structure' in sys.modules); " \
+               "print(pt._pt_data is None); pt.Element('O').Z; " \
+               "print(pt._pt_data is None)"
+        out = subprocess.check_output([sys.executable, "-c", code],
+                                      universal_newlines=True)
+        if sys.version_info >= (3, 7):
+            self.assertEqual(out.split(), ["False", "True", "False"])
+        code = "from pymatgen.core import periodic_table as pt; " \
+               "import pymatgen.core.structure; print(pt._pt_data is None)"
+        out = subprocess.check_output([sys.executable, "-c", code],
+                                      universal_newlines=True)
+        self.assertEqual(out.split(), ["True"])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,6 +13,7 @@ from string import ascii_lowercase
 import warnings
 import logging
 import math
+from multiprocessing import Pool
 
 import numpy as np
 
@@ -307,6 +308,14 @@ class MultipleSubstitutionTransformation:
         return True
 
 
+def _get_ewald_energies(supercell, orderings):
+    """
+    Computes the Ewald energies of orderings of the same supercell, for
+    EnumerateStructureTransformation.
+    """
+    return EwaldSummation(supercell).compute_sub_structures(orderings)
+
+
 class EnumerateStructureTransformation(AbstractTransformation):
     """
     Order a disordered structure using enumlib. For complete orderings, this
@@ -325,6 +334,7 @@ class EnumerateStructureTransformation(AbstractTransformation):
             max_disordered_sites=None,
             sort_criteria="ewald",
             timeout=None,
+            nproc=None,
     ):
         """
         Args:
@@ -365,6 +375,9 @@ class EnumerateStructureTransformation(AbstractTransformation):
             sort_criteria (str): Sort by Ewald energy ("ewald", must have oxidation
                 states and slow) or by number of sites ("nsites", much faster).
             timeout (float): timeout in minutes to pass to EnumlibAdaptor
+            nproc (int): Number of processes used to compute the Ewald
+                energies of the orderings in parallel, one supercell at a
+                time. Defaults to None, i.e., no parallelization.
         """
         self.symm_prec = symm_prec
         self.min_cell_size = min_cell_size
@@ -375,6 +388,7 @@ class EnumerateStructureTransformation(AbstractTransformation):
         self.max_disordered_sites = max_disordered_sites
         self.sort_criteria = sort_criteria
         self.timeout = timeout
+        self.nproc = nproc
 
         if max_cell_size and max_disordered_sites:
             raise ValueError(
@@ -464,29 +478,31 @@ class EnumerateStructureTransformation(AbstractTransformation):
         if structures is None:
             raise ValueError("Unable to enumerate")
 
-        original_latt = structure.lattice
-        inv_latt = np.linalg.inv(original_latt.matrix)
-        ewald_matrices = {}
-        all_structures = []
-        for s in structures:
-            new_latt = s.lattice
-            transformation = np.dot(new_latt.matrix, inv_latt)
-            transformation = tuple(
-                [tuple([int(round(cell)) for cell in row]) for row in transformation]
-            )
-            if contains_oxidation_state and self.sort_criteria == "ewald":
-                if transformation not in ewald_matrices:
-                    s_supercell = structure * transformation
-                    ewald = EwaldSummation(s_supercell)
-                    ewald_matrices[transformation] = ewald
-                else:
-                    ewald = ewald_matrices[transformation]
-                energy = ewald.compute_sub_structure(s)
-                all_structures.append(
-                    {"num_sites": len(s), "energy": energy, "structure": s}
+        all_structures = [{"num_sites": len(s), "structure": s} for s in structures]
+        if contains_oxidation_state and self.sort_criteria == "ewald":
+            # The orderings are grouped by supercell, so that one Ewald
+            # summation per supercell ranks all of its orderings at once.
+            original_latt = structure.lattice
+            inv_latt = np.linalg.inv(original_latt.matrix)
+            groups = {}
+            for i, s in enumerate(structures):
+                transformation = np.dot(s.lattice.matrix, inv_latt)
+                transformation = tuple(
+                    [tuple([int(round(cell)) for cell in row]) for row in transformation]
                 )
+                groups.setdefault(transformation, []).append(i)
+            args = [
+                (structure * transformation, [structures[i] for i in inds])
+                for transformation, inds in groups.items()
+            ]
+            if self.nproc is not None:
+                with Pool(self.nproc) as p:
+                    all_energies = p.starmap(_get_ewald_energies, args)
             else:
-                all_structures.append({"num_sites": len(s), "structure": s})
+                all_energies = [_get_ewald_energies(*a) for a in args]
+            for inds, energies in zip(groups.values(), all_energies):
+                for i, energy in zip(inds, energies):
+                    all_structures[i]["energy"] = energy
 
         def sort_func(s):
             return (
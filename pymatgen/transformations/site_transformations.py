@@ -363,7 +363,11 @@ class PartialRemoveSitesTransformation(AbstractTransformation):
         self.logger.debug("Symmetry of structure is determined to be {}."
                           .format(s.get_space_group_symbol()))
         sg = s.get_space_group_operations()
-        tested_sites = []
+        # Candidates are deduplicated by the canonical key of the orbit of the
+        # removed sites under the permutations of the sites by the symmetry
+        # operations.
+        perms = sg.get_site_permutations(structure, symm_prec=symprec)
+        tested_keys = set()
         starttime = time.time()
         self.logger.debug("Performing initial ewald sum...")
         ewaldsum = EwaldSummation(structure)
@@ -377,25 +381,16 @@ class PartialRemoveSitesTransformation(AbstractTransformation):
 
         count = 0
         for allindices in itertools.product(*allcombis):
-            sites_to_remove = []
             indices_list = []
             for indices in allindices:
-                sites_to_remove.extend([structure[i] for i in indices])
                 indices_list.extend(indices)
-            s_new = structure.copy()
-            s_new.remove_sites(indices_list)
-            energy = ewaldsum.compute_partial_energy(indices_list)
-            already_tested = False
-            for i, tsites in enumerate(tested_sites):
-                tenergy = all_structures[i]["energy"]
-                if abs((energy - tenergy) / len(s_new)) < 1e-5 and \
-                        sg.are_symmetrically_equivalent(sites_to_remove,
-                                                        tsites,
-                                                        symm_prec=symprec):
-                    already_tested = True
-
-            if not already_tested:
-                tested_sites.append(sites_to_remove)
+            key = sg.get_orbit_key(indices_list, perms)
+
+            if key not in tested_keys:
+                tested_keys.add(key)
+                s_new = structure.copy()
+                s_new.remove_sites(indices_list)
+                energy = ewaldsum.compute_partial_energy(indices_list)
                 all_structures.append({"structure": s_new, "energy": energy})
 
             count += 1
@@ -228,6 +228,15 @@ class EnumerateStructureTransformationTest(unittest.TestCase):
             for ss in alls:
                 self.assertIn("num_sites", ss)
 
+        enum_trans3 = EnumerateStructureTransformation(
+            refine_structure=True, nproc=2
+        )
+        alls3 = enum_trans3.apply_transformation(s, 100)
+        alls = enum_trans.apply_transformation(s, 100)
+        self.assertEqual(len(alls3), len(alls))
+        for ss, ss3 in zip(alls, alls3):
+            self.assertAlmostEqual(ss["energy"], ss3["energy"])
+
         # make sure it works for non-oxidation state decorated structure
         trans = SubstitutionTransformation({"Fe": {"Fe": 0.5}})
         s = trans.apply_transformation(struct)